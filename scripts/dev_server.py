@@ -206,7 +206,7 @@ def _render_once(plugin_id, plugin_dir, manifest, config, mock_data, width, heig
     from src.plugin_system.testing import VisualTestDisplayManager, MockCacheManager, MockPluginManager
     from src.plugin_system.plugin_loader import PluginLoader
 
-    display_manager = VisualTestDisplayManager(width=width, height=height)
+    display_manager = VisualTestDisplayManager(width=width, height=height, track_calls=False)
     cache_manager = MockCacheManager()
     plugin_manager = MockPluginManager()
 
@@ -71,4 +71,6 @@ PYTHON_PATH="$(command -v python3)"
 # pip refuses to uninstall in place ("Cannot uninstall: no RECORD file was
 # found"). This tells pip to install the newer version alongside rather than
 # aborting the whole requirements.txt install over one such conflict.
-exec "$PYTHON_PATH" -m pip install --break-system-packages --ignore-installed -r "$RESOLVED_TARGET"
+# --prefer-binary: take a published wheel over building a newer sdist from
+# source, which can take minutes on a Pi.
+exec "$PYTHON_PATH" -m pip install --break-system-packages --ignore-installed --prefer-binary -r "$RESOLVED_TARGET"
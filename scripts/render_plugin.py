@@ -105,7 +105,7 @@ def main() -> int:
     from src.plugin_system.testing import VisualTestDisplayManager, MockCacheManager, MockPluginManager
     from src.plugin_system.plugin_loader import PluginLoader
 
-    display_manager = VisualTestDisplayManager(width=args.width, height=args.height)
+    display_manager = VisualTestDisplayManager(width=args.width, height=args.height, track_calls=False)
     cache_manager = MockCacheManager()
     plugin_manager = MockPluginManager()
 
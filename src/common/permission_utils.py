@@ -470,8 +470,11 @@ def install_requirements_file(req_file: Path, timeout: int = 300) -> subprocess.
     # raw external/user input. --ignore-installed matches safe_pip_install.sh:
     # apt-managed packages (e.g. python3-requests) ship no pip RECORD file, so
     # upgrading them would otherwise abort with "uninstall-no-record-file".
+    # --prefer-binary also matches it: take a published wheel over building
+    # a newer sdist from source, which can take minutes on a Pi.
     result = subprocess.run(  # nosec B603 - no shell invoked (list-form argv)  # nosemgrep
-        [sys.executable, "-m", "pip", "install", "--break-system-packages", "--ignore-installed", "-r", str(req_file)],
+        [sys.executable, "-m", "pip", "install", "--break-system-packages", "--ignore-installed",
+         "--prefer-binary", "-r", str(req_file)],
         capture_output=True, text=True, timeout=timeout, cwd=str(project_root)
     )
     result.stderr = _redact_url_credentials(result.stderr)
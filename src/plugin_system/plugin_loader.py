@@ -198,7 +198,7 @@ class PluginLoader:
         # Strategy 4: Manifest-based search
         self.logger.debug("Directory name search failed for %s, searching by manifest...", plugin_id)
         for item in plugins_dir.iterdir():
-            if not item.is_dir():
+            if not item.is_dir() or item.name.startswith('.'):
                 continue
             
             # Skip if already checked
@@ -27,6 +27,15 @@ from src.common.permission_utils import (
     get_plugin_dir_mode
 )
 
+# Every installed plugin's manifest is parsed at discovery; orjson does it
+# straight from bytes, several times faster. Its JSONDecodeError subclasses
+# json.JSONDecodeError, so the existing handlers still apply.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class PluginManager:
     """
@@ -173,20 +182,20 @@ class PluginManager:
             for item in directory.iterdir():
                 if not item.is_dir():
                     continue
-                # Skip backup directories so they don't overwrite live entries
-                if '.standalone-backup-' in item.name:
+                # Skip backup directories so they don't overwrite live entries,
+                # and hidden ones (in-progress installs, the store's .cache)
+                if '.standalone-backup-' in item.name or item.name.startswith('.'):
                     continue
 
                 manifest_path = item / "manifest.json"
                 if manifest_path.exists():
                     try:
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            manifest = json.load(f)
-                            plugin_id = manifest.get('id')
-                            if plugin_id:
-                                plugin_ids.append(plugin_id)
-                                new_manifests[plugin_id] = manifest
-                                new_directories[plugin_id] = item
+                        manifest = _json_loads(manifest_path.read_bytes())
+                        plugin_id = manifest.get('id')
+                        if plugin_id:
+                            plugin_ids.append(plugin_id)
+                            new_manifests[plugin_id] = manifest
+                            new_directories[plugin_id] = item
                     except (json.JSONDecodeError, PermissionError, OSError) as e:
                         self.logger.warning("Error reading manifest from %s: %s", manifest_path, e, exc_info=True)
                         continue
@@ -528,8 +537,7 @@ class PluginManager:
         manifest_path = self.plugins_dir / plugin_id / "manifest.json"
         if manifest_path.exists():
             try:
-                with open(manifest_path, 'r', encoding='utf-8') as f:
-                    manifest = json.load(f)
+                manifest = _json_loads(manifest_path.read_bytes())
                 with self._discovery_lock:
                     self.plugin_manifests[plugin_id] = manifest
             except Exception as e:
@@ -227,7 +227,7 @@ class StateReconciliation:
                 for plugin_dir in self.plugins_dir.iterdir():
                     if plugin_dir.is_dir():
                         plugin_id = plugin_dir.name
-                        if '.standalone-backup-' in plugin_id:
+                        if '.standalone-backup-' in plugin_id or plugin_id.startswith('.'):
                             continue
                         manifest_path = plugin_dir / "manifest.json"
                         if manifest_path.exists():
@@ -6,34 +6,215 @@ from both the official registry and custom GitHub repositories.
 """
 
 import os
+import sys
 import re
+import errno
 import json
+import hashlib
+import functools
 import stat
 import subprocess
 import shutil
 import threading
+import heapq
+import mmap
+import tarfile
 import zipfile
 import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple, Set
+from typing import List, Dict, Optional, Any, Tuple, Set, Callable
 import logging
 
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
 from src.common.permission_utils import sudo_remove_directory, install_requirements_file
 from src.plugin_system.plugin_loader import (
     requirements_has_real_deps, requirements_are_satisfied, find_trusted_subdir
 )
 
+# jsonschema (and its referencing/rpds dependency tree) is only needed when
+# installing from a URL, so it is imported on first use instead of adding to
+# every process's startup time on the Pi. ``None`` = not tried yet,
+# ``False`` = not installed.
+_jsonschema = None
+
+
+def _load_jsonschema():
+    """Return the jsonschema module, or None if it isn't installed."""
+    global _jsonschema
+    if _jsonschema is None:
+        try:
+            import jsonschema
+            _jsonschema = jsonschema
+        except ImportError:
+            _jsonschema = False
+    return _jsonschema or None
+
+# orjson parses the registry/manifest payloads several times faster than the
+# stdlib and accepts bytes directly (no intermediate str decode). Its
+# JSONDecodeError subclasses json.JSONDecodeError, so existing handlers apply.
 try:
-    from jsonschema import Draft7Validator, ValidationError
-    JSONSCHEMA_AVAILABLE = True
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+
+    def _json_dumps_indent(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    JSONSCHEMA_AVAILABLE = False
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+    def _json_dumps_indent(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# tarfile's "data" extraction filter (3.12, backported to 3.8.17+/3.11.4+)
+# rejects absolute paths, escaping links and special files on top of our own
+# checks; older interpreters just use the checks in _install_via_download.
+_TAR_EXTRACT_KWARGS = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
+# shutil.rmtree's error-handler keyword: ``onerror`` is deprecated since 3.12
+# in favor of ``onexc``, which passes the exception instead of exc_info.
+_RMTREE_HANDLER_KWARG = 'onexc' if sys.version_info >= (3, 12) else 'onerror'
+
+# Filesystem locations resolved once at import instead of per call.
+_MODULE_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _MODULE_DIR.parent.parent
+_SECRETS_PATH = _REPO_ROOT / "config" / "config_secrets.json"
+_SCHEMA_PATH = _REPO_ROOT / "schema" / "manifest_schema.json"
+_UNINSTALLED_REGISTRY_PATH = _REPO_ROOT / "config" / "uninstalled_plugins.json"
+
+# Plugin class detection in manager.py (see _detect_class_name).
+_BASEPLUGIN_CLASS_RE = re.compile(r'class\s+(\w+)\s*\([^)]*BasePlugin[^)]*\)')
+_FIRST_CLASS_RE = re.compile(r'^class\s+(\w+)', re.MULTILINE)
+_CLASS_SCAN_HEAD_CHARS = 65536
+
+# Git update failure classification for update_plugin: one scan of git's
+# output finds every known condition; the first kind in _GIT_ERROR_HINTS
+# that matched decides the hint that gets logged.
+_GIT_ERROR_RE = re.compile(
+    r'(?P<local>would be overwritten|local changes)'
+    r'|(?P<diverged>not possible to fast-forward|diverging branches)'
+    r'|(?P<unrelated>refusing to merge unrelated histories)'
+    r'|(?P<auth>authentication|permission denied|terminal prompts disabled)'
+    r'|(?P<missing>not found|does not exist)'
+    r'|(?P<conflict>conflict)',
+    re.IGNORECASE,
+)
+_GIT_ERROR_HINTS = (
+    ('local', logging.WARNING, "Plugin {} has local changes that prevent update. Consider committing or stashing changes manually."),
+    ('diverged', logging.ERROR, "Plugin {} has local commits or upstream history was rewritten. Reinstall the plugin to take the upstream version."),
+    ('unrelated', logging.ERROR, "Plugin {} has unrelated git histories. Plugin may need to be reinstalled."),
+    ('auth', logging.ERROR, "Authentication failed for {}. Check git credentials or repository permissions."),
+    ('missing', logging.ERROR, "Remote branch or repository not found for {}. Check repository URL and branch name."),
+    ('conflict', logging.ERROR, "Merge conflict detected for {}. Resolve conflicts manually or reinstall plugin."),
+)
+
+
+def _build_http_session(pool_size: int = 10) -> requests.Session:
+    """Create the pooled HTTP session used for all GitHub traffic.
+
+    Reusing one session keeps TCP+TLS connections to api.github.com and
+    raw.githubusercontent.com alive across calls instead of paying a fresh
+    handshake per request (notably for monorepo installs, which fetch many
+    files).
+
+    Retries live in the urllib3 adapter rather than a Python sleep loop,
+    with the same budget as before: up to three attempts, and only for
+    connection-level failures. HTTP error statuses are returned to the
+    caller on the first response, and ``Retry-After`` is never slept on, so
+    a rate-limited request can't stall the web UI. The pool is sized for
+    search_plugins' enrichment workers.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.75,
+        status_forcelist=(),
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.headers['User-Agent'] = 'LEDMatrix-Plugin-Manager/1.0'
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_GITHUB_API_PREFIX = 'https://api.github.com/'
+
+
+def _git_network_env() -> Dict[str, str]:
+    """Environment for git commands that talk to a remote.
+
+    With no terminal, a credential prompt (e.g. a deleted or private repo)
+    would otherwise block until the subprocess timeout; fail fast instead.
+    """
+    return dict(os.environ, GIT_TERMINAL_PROMPT='0')
+
+
+class _GitHubRateLimited(requests.RequestException):
+    """Raised instead of calling the GitHub REST API while its rate limit is exhausted."""
+
+
+@dataclass
+class _GitState:
+    """Working-tree state of a plugin checkout, from one ``git status`` call."""
+    branch: Optional[str]  # None when HEAD is detached
+    upstream: Optional[str]  # e.g. "origin/main"; None when not tracking
+    untracked: List[str] = field(default_factory=list)
+    has_tracked_changes: bool = False
+
+
+class _TTLCache(OrderedDict):
+    """Bounded LRU map of ``{key: (timestamp, data)}`` cache entries.
+
+    All of the store manager's metadata caches share this shape; freshness
+    is still checked by the caller against its own TTL. Reads mark an entry
+    most-recently-used and inserts past ``maxsize`` evict the least-recently
+    used one, so a long-running web UI browsing many repos can't grow the
+    caches without limit. The lock keeps the reorder/evict steps consistent
+    when search_plugins enriches plugins from its thread pool.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        super().__init__()
+        self.maxsize = maxsize
+        # Reentrant: OrderedDict.pop/popitem on a subclass go back through
+        # __getitem__ while __setitem__ already holds the lock.
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def snapshot(self) -> List[Tuple[Any, Any]]:
+        """Return a consistent list of ``(key, entry)`` pairs."""
+        with self._lock:
+            return list(self.items())
 
 
 class PluginStoreManager:
@@ -46,6 +227,29 @@ class PluginStoreManager:
     """
     
     REGISTRY_URL = "https://raw.githubusercontent.com/ChuckBuilds/ledmatrix-plugins/main/plugins.json"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+    # Branch names probed, in order, when a repo's default branch is unknown
+    _FALLBACK_BRANCHES = ('main', 'master')
+
+    # Concurrent raw-file downloads per monorepo install, and a process-wide
+    # cap on in-flight raw downloads shared by overlapping installs. Kept
+    # under GitHub's ~10 concurrent request soft limit to avoid 429s.
+    MONOREPO_DOWNLOAD_WORKERS = 8
+    _download_semaphore = threading.BoundedSemaphore(8)
+    # File count at which a monorepo plugin is taken from one streamed
+    # tarball of the commit instead of per-file raw downloads.
+    MONOREPO_TARBALL_MIN_FILES = 150
+    # Plugin updates can now run concurrently (the web UI's "Update all"
+    # keeps several in flight); pip installs into the same site-packages
+    # must not, so dependency installs are serialized process-wide.
+    _dependency_install_lock = threading.Lock()
+    # Seconds a registry fetch stays fresh enough for update checks to reuse.
+    UPDATE_REGISTRY_MAX_AGE = 300
+
+    # Threads used to extract a monorepo ZIP fallback (capped by CPU count),
+    # and the member count below which a single thread is faster.
+    ZIP_EXTRACT_WORKERS = 4
+    _ZIP_PARALLEL_MIN_MEMBERS = 32
 
     # A valid plugin id is a single path component: starts alphanumeric, then
     # alphanumerics / dot / dash / underscore. Used to keep the uninstall
@@ -69,15 +273,33 @@ class PluginStoreManager:
         self.logger = logging.getLogger(__name__)
         self.registry_cache = None
         self.registry_cache_time = None  # Timestamp of when registry was cached
-        self.github_cache = {}  # Cache for GitHub API responses
-        self.cache_timeout = 3600  # 1 hour cache timeout (repo info: stars, default_branch)
+        # Validators from the last full registry download. Sent back as
+        # If-None-Match / If-Modified-Since so an unchanged registry costs a
+        # bodyless 304 instead of the whole plugins.json on every TTL expiry.
+        self._registry_etag: Optional[str] = None
+        # Body of that download, exactly as fetched. This (not the live
+        # registry_cache dict) is what gets persisted to disk.
+        self._registry_body: Optional[bytes] = None
+        # (registry, plugins_list, len, {id: entry}) — see _find_registry_plugin
+        self._plugin_index: Optional[Tuple[Dict, List, int, Dict[str, Dict]]] = None
+        # ETag-validated GitHub API lookups: {cache_key: (etag, extracted)}.
+        # Lets commit and tree lookups revalidate with If-None-Match; a 304
+        # costs no rate-limit point and carries no body. Only the fields
+        # each caller extracts are kept, never the full response body.
+        self._etag_cache = _TTLCache(maxsize=512)
+        self._registry_last_modified: Optional[str] = None
+        self.github_cache = _TTLCache()  # Cache for GitHub API responses: {owner/repo: (timestamp, data)}
+        # 6 hours for repo info: stars drift slowly and default_branch
+        # almost never changes, yet every store listing asks for it per
+        # plugin. get_plugin_info(force_refresh=True) bypasses it.
+        self.cache_timeout = 6 * 3600
         # 15 minutes for registry cache. Long enough that the plugin list
         # endpoint on a warm cache never hits the network, short enough that
         # new plugins show up within a reasonable window. See also the
         # stale-cache fallback in fetch_registry for transient network
         # failures.
         self.registry_cache_timeout = 900
-        self.commit_info_cache = {}  # Cache for latest commit info: {key: (timestamp, data)}
+        self.commit_info_cache = _TTLCache()  # Cache for latest commit info: {key: (timestamp, data)}
         # 30 minutes for commit/manifest caches. Plugin Store users browse
         # the catalog via /plugins/store/list which fetches commit info and
         # manifest data per plugin. 5-min TTLs meant every fresh browse on
@@ -85,11 +307,28 @@ class PluginStoreManager:
         # minutes keeps the cache warm across a realistic session while
         # still picking up upstream updates within a reasonable window.
         self.commit_cache_timeout = 1800
-        self.manifest_cache = {}  # Cache for GitHub manifest fetches: {key: (timestamp, data)}
+        self.manifest_cache = _TTLCache()  # Cache for GitHub manifest fetches: {key: (timestamp, data)}
         self.manifest_cache_timeout = 1800
         self.github_token = self._load_github_token()
-        self._token_validation_cache = {}  # Cache for token validation results: {token: (is_valid, timestamp, error_message)}
+        self._token_validation_cache = _TTLCache(maxsize=16)  # Cache for token validation results: {token_digest: (timestamp, (is_valid, error_message))}
         self._token_validation_cache_timeout = 300  # 5 minutes cache for token validation
+        # GitHub REST rate limit: once X-RateLimit-Remaining hits 0, API
+        # calls are skipped (callers fall back to cached data) until the
+        # X-RateLimit-Reset epoch, and the warning is logged once per window.
+        self._rate_limit_reset = 0.0
+        self._rate_limit_warned_reset = 0.0
+        # Compiled manifest schema validator, keyed on the schema file's
+        # mtime: (mtime_ns, Draft7Validator). Re-parsing and re-checking
+        # the schema on every install cost an open + JSON parse + meta-schema
+        # validation; a single stat() is enough to notice an edited schema.
+        self._schema_cache: Optional[Tuple[int, Any]] = None
+        # Parsed .plugin_metadata.json per plugin dir, keyed on the file's
+        # (mtime_ns, size): {plugin_path_str: (signature, metadata)}.
+        # update_plugin checks it on every update pass.
+        self._plugin_metadata_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # Installed plugins' manifest.json, memoized the same way:
+        # {plugin_id: (signature, manifest)}.
+        self._installed_manifest_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
         # Per-plugin tombstone timestamps for plugins that were uninstalled
         # recently via the UI. Used by the state reconciler to avoid
@@ -110,9 +349,7 @@ class PluginStoreManager:
         if uninstalled_registry_path is not None:
             self._uninstalled_registry_path = Path(uninstalled_registry_path)
         else:
-            self._uninstalled_registry_path = (
-                Path(__file__).parent.parent.parent / "config" / "uninstalled_plugins.json"
-            )
+            self._uninstalled_registry_path = _UNINSTALLED_REGISTRY_PATH
         # Serializes read-modify-write of the registry file so concurrent
         # install/uninstall requests can't lose updates.
         self._uninstalled_registry_lock = threading.Lock()
@@ -137,10 +374,31 @@ class PluginStoreManager:
         # handlers. Bumping the cached-entry timestamp on failure serves
         # the stale payload cheaply until the backoff expires.
         self._failure_backoff_seconds = 60
+
+        # Cache timestamps come from time.monotonic() so a wall-clock jump
+        # (NTP sync after a Pi boots without an RTC) can't make every entry
+        # look fresh for hours or expired all at once. Expired entries are
+        # kept around for ``_stale_retention_seconds`` so the stale-on-error
+        # fallbacks above still have something to serve, then swept via a
+        # min-heap of (evict_at, cache_name, key) so long-running sessions
+        # don't grow the cache dicts without bound. Each entry has at most
+        # one heap item, tracked in _expiry_scheduled; an entry refreshed
+        # since its item was pushed is rescheduled when the item pops.
+        self._stale_retention_seconds = 24 * 3600
+        self._expiry_heap: List[Tuple[float, str, str]] = []
+        self._expiry_scheduled: Dict[Tuple[str, str], float] = {}
+        self._expiry_lock = threading.Lock()
         # Prevents concurrent callers from each firing a network request when
         # the registry cache expires. Only one thread fetches; others wait and
         # then get the result from the warm cache (double-checked locking).
         self._registry_fetch_lock = threading.Lock()
+        self._session = _build_http_session()
+        # In-flight GitHub metadata fetches keyed by request identity, so
+        # concurrent callers asking for the same repo/branch/manifest (two
+        # browser tabs, overlapping search_plugins calls) share one HTTP
+        # request instead of each issuing their own. See _singleflight.
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
 
         # Per-plugin locks for _reinstall_with_rollback: the web UI runs
         # Flask with threaded=True, so two overlapping requests for the
@@ -155,6 +413,17 @@ class PluginStoreManager:
         # Ensure plugins directory exists
         self.plugins_dir.mkdir(exist_ok=True)
 
+        # On-disk mirror of the GitHub metadata caches (and their ETags) so
+        # a restart, e.g. a Pi reboot, doesn't re-query GitHub for every
+        # plugin while the cached entries are still within their TTLs.
+        # Writes are debounced onto a timer thread; the file lives under a
+        # dot-directory, which plugin discovery never treats as a plugin.
+        self._persistent_cache_path = self.plugins_dir / '.cache' / 'github_meta.json'
+        self._cache_persist_delay = 30.0
+        self._cache_persist_timer: Optional[threading.Timer] = None
+        self._cache_persist_lock = threading.Lock()
+        self._load_persistent_caches()
+
     def _get_reinstall_lock(self, plugin_id: str) -> threading.Lock:
         """Lazily create (or fetch) the per-plugin reinstall lock."""
         with self._reinstall_locks_guard:
@@ -164,6 +433,46 @@ class PluginStoreManager:
                 self._reinstall_locks[plugin_id] = lock
             return lock
 
+    def _singleflight(self, key: Tuple, fn):
+        """Run ``fn()`` once per ``key`` across concurrent callers.
+
+        The first caller executes ``fn``; callers arriving while it is still
+        running block on its Future and receive the same result (or
+        exception). The slot is released as soon as the call completes, so
+        later calls go through the normal cache path.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _inflight_repo_key(self, repo_url: str) -> str:
+        """Canonical repo identity for _singleflight keys.
+
+        Spellings of the same repo (trailing slash, ``.git`` suffix,
+        www.github.com) share one in-flight request.
+        """
+        try:
+            owner, repo = self._parse_github_url(repo_url)
+        except ValueError:
+            return repo_url
+        return f"{owner}/{repo}"
+
     def _record_cache_backoff(self, cache_dict: Dict, cache_key: str,
                               cache_timeout: int, payload: Any) -> None:
         """Bump a cache entry's timestamp so subsequent lookups hit the
@@ -177,19 +486,209 @@ class PluginStoreManager:
         check ``(now - ts) < cache_timeout`` succeeds for another
         ``backoff`` seconds.
         """
-        synthetic_ts = time.time() + self._failure_backoff_seconds - cache_timeout
-        cache_dict[cache_key] = (synthetic_ts, payload)
+        synthetic_ts = time.monotonic() + self._failure_backoff_seconds - cache_timeout
+        self._cache_store(cache_dict, cache_key, payload, cache_timeout, synthetic_ts)
+
+    # cache attribute name -> TTL attribute name, for the expiry sweep
+    _EXPIRING_CACHES = {
+        'github_cache': 'cache_timeout',
+        'commit_info_cache': 'commit_cache_timeout',
+        'manifest_cache': 'manifest_cache_timeout',
+        '_token_validation_cache': '_token_validation_cache_timeout',
+    }
+
+    # Caches mirrored to disk. Token validation results are never persisted.
+    _PERSISTED_CACHES = ('github_cache', 'commit_info_cache', 'manifest_cache')
+    # Most recently used ETag entries written to disk; older ones are
+    # simply revalidated with a full request after a restart.
+    _PERSISTED_ETAG_LIMIT = 128
+
+    def _cache_store(self, cache_dict: Dict, cache_key: str, payload: Any,
+                     cache_timeout: float, timestamp: Optional[float] = None,
+                     persist: bool = True) -> None:
+        """Store ``(timestamp, payload)`` and schedule the entry for eviction."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        cache_dict[cache_key] = (timestamp, payload)
+        cache_name = next(
+            (name for name in self._EXPIRING_CACHES if getattr(self, name) is cache_dict),
+            None,
+        )
+        if cache_name is None:
+            return
+        evict_at = timestamp + cache_timeout + self._stale_retention_seconds
+        with self._expiry_lock:
+            if (cache_name, cache_key) not in self._expiry_scheduled:
+                self._expiry_scheduled[(cache_name, cache_key)] = evict_at
+                heapq.heappush(self._expiry_heap, (evict_at, cache_name, cache_key))
+                self._compact_expiry_heap()
+        if persist and cache_name in self._PERSISTED_CACHES:
+            self._schedule_cache_persist()
+
+    def _schedule_cache_persist(self) -> None:
+        """Arrange for the caches to be written to disk after a short delay.
+
+        Bursts of inserts (a search_plugins enrichment pass) coalesce into
+        a single write.
+        """
+        with self._cache_persist_lock:
+            if self._cache_persist_timer is not None:
+                return
+            timer = threading.Timer(self._cache_persist_delay, self._persist_caches)
+            timer.daemon = True
+            self._cache_persist_timer = timer
+        timer.start()
+
+    def close(self) -> None:
+        """Flush pending cache writes and release pooled HTTP connections.
+
+        The manager lives for the whole process in normal use; call this
+        on shutdown (or in tests) so a debounced cache write isn't lost and
+        idle keep-alive sockets are closed promptly.
+        """
+        with self._cache_persist_lock:
+            timer = self._cache_persist_timer
+        if timer is not None:
+            timer.cancel()
+            self._persist_caches()
+        self._session.close()
+
+    def _persist_caches(self) -> None:
+        """Write the persisted caches to ``_persistent_cache_path``.
+
+        Monotonic timestamps are converted to wall-clock time on disk and
+        back again on load.
+        """
+        with self._cache_persist_lock:
+            self._cache_persist_timer = None
+        if not self.plugins_dir.is_dir():
+            return
+        wall_offset = time.time() - time.monotonic()
+        snapshot = {
+            'version': 2,
+            'caches': {
+                name: {key: [ts + wall_offset, payload]
+                       for key, (ts, payload) in getattr(self, name).snapshot()}
+                for name in self._PERSISTED_CACHES
+            },
+            'etags': {key: [etag, data] for key, (etag, data)
+                      in self._etag_cache.snapshot()[-self._PERSISTED_ETAG_LIMIT:]},
+        }
+        if self._registry_body and (self._registry_etag or self._registry_last_modified):
+            snapshot['registry'] = [self._registry_etag, self._registry_last_modified,
+                                    self._registry_body.decode('utf-8')]
+        path = self._persistent_cache_path
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not persist GitHub metadata cache: {e}")
+
+    def _load_persistent_caches(self) -> None:
+        """Seed the in-memory caches from ``_persistent_cache_path``, if present."""
+        try:
+            with open(self._persistent_cache_path, 'rb') as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable GitHub metadata cache: {e}")
+            return
+        # Version 1 stored whole API bodies in 'etags'; drop it wholesale.
+        if not isinstance(data, dict) or data.get('version') != 2:
+            return
+
+        now = time.monotonic()
+        mono_offset = now - time.time()
+        caches = data.get('caches') or {}
+        for name in self._PERSISTED_CACHES:
+            cache_dict = getattr(self, name)
+            timeout = getattr(self, self._EXPIRING_CACHES[name])
+            entries = caches.get(name)
+            if not isinstance(entries, dict):
+                continue
+            for key, entry in entries.items():
+                if not isinstance(entry, list) or len(entry) != 2:
+                    continue
+                timestamp = entry[0] + mono_offset
+                if now - timestamp >= timeout + self._stale_retention_seconds:
+                    continue
+                self._cache_store(cache_dict, key, entry[1], timeout, timestamp, persist=False)
+        etags = data.get('etags')
+        if isinstance(etags, dict):
+            for key, entry in list(etags.items())[-self._PERSISTED_ETAG_LIMIT:]:
+                if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str):
+                    self._etag_cache[key] = (entry[0], entry[1])
+        # The registry comes back without a cache time, so the first
+        # fetch_registry() still revalidates it, but with its validators:
+        # an unchanged registry costs a 304 rather than a full download.
+        registry = data.get('registry')
+        if isinstance(registry, list) and len(registry) == 3 and isinstance(registry[2], str):
+            try:
+                registry_cache = _json_loads(registry[2])
+            except ValueError:
+                return
+            if isinstance(registry_cache, dict):
+                self._registry_etag, self._registry_last_modified = registry[0], registry[1]
+                self._registry_body = registry[2].encode('utf-8')
+                self.registry_cache = registry_cache
+
+    def _sweep_expired_caches(self) -> None:
+        """Drop cache entries that are past TTL plus the stale-retention window.
+
+        Cheap when nothing is due: a single comparison against the heap head.
+        """
+        heap = self._expiry_heap
+        if not heap:
+            return
+        now = time.monotonic()
+        if heap[0][0] > now:
+            return
+        with self._expiry_lock:
+            while heap and heap[0][0] <= now:
+                _, cache_name, cache_key = heapq.heappop(heap)
+                self._expiry_scheduled.pop((cache_name, cache_key), None)
+                cache_dict = getattr(self, cache_name)
+                # dict.get: a plain read that leaves the LRU order alone
+                entry = dict.get(cache_dict, cache_key)
+                if entry is None:
+                    continue
+                timeout = getattr(self, self._EXPIRING_CACHES[cache_name])
+                evict_at = entry[0] + timeout + self._stale_retention_seconds
+                if evict_at <= now:
+                    cache_dict.pop(cache_key, None)
+                else:
+                    # Refreshed since it was scheduled
+                    self._expiry_scheduled[(cache_name, cache_key)] = evict_at
+                    heapq.heappush(heap, (evict_at, cache_name, cache_key))
+
+    def _compact_expiry_heap(self) -> None:
+        """Drop heap items for entries the caches' LRU bound already evicted.
+
+        Called with ``_expiry_lock`` held. Only rebuilds once those items
+        outnumber the live entries, so the cost is amortized over stores.
+        """
+        heap = self._expiry_heap
+        live = sum(len(getattr(self, name)) for name in self._EXPIRING_CACHES)
+        if len(heap) <= 2 * live + 64:
+            return
+        heap[:] = [item for item in heap if item[2] in getattr(self, item[1])]
+        heapq.heapify(heap)
+        self._expiry_scheduled = {(name, key): evict_at for evict_at, name, key in heap}
 
     def mark_recently_uninstalled(self, plugin_id: str) -> None:
         """Record that ``plugin_id`` was just uninstalled by the user."""
-        self._uninstall_tombstones[plugin_id] = time.time()
+        self._uninstall_tombstones[plugin_id] = time.monotonic()
 
     def was_recently_uninstalled(self, plugin_id: str) -> bool:
         """Return True if ``plugin_id`` has an active uninstall tombstone."""
         ts = self._uninstall_tombstones.get(plugin_id)
         if ts is None:
             return False
-        if time.time() - ts > self._uninstall_tombstone_ttl:
+        if time.monotonic() - ts > self._uninstall_tombstone_ttl:
             # Expired — clean up so the dict doesn't grow unbounded.
             self._uninstall_tombstones.pop(plugin_id, None)
             return False
@@ -332,10 +831,10 @@ class PluginStoreManager:
             GitHub token or None if not configured
         """
         try:
-            config_path = Path(__file__).parent.parent.parent / "config" / "config_secrets.json"
+            config_path = _SECRETS_PATH
             if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    config = _json_loads(f.read())
                     token = config.get('github', {}).get('api_token', '').strip()
                     if token and token != "YOUR_GITHUB_PERSONAL_ACCESS_TOKEN":
                         return token
@@ -343,6 +842,16 @@ class PluginStoreManager:
             self.logger.debug(f"Could not load GitHub token: {e}")
         return None
 
+    @staticmethod
+    def _token_cache_key(token: str) -> str:
+        """Return a keyed BLAKE2 digest of a token for use as a cache key.
+
+        Unlike a raw prefix this never collides between tokens sharing the
+        same leading characters and keeps no token material in the cache.
+        """
+        return hashlib.blake2b(token.encode('utf-8'), digest_size=16,
+                               key=b'ledmatrix-token').hexdigest()
+
     def _validate_github_token(self, token: str) -> tuple[bool, Optional[str]]:
         """
         Validate a GitHub token by making a lightweight API call.
@@ -359,10 +868,11 @@ class PluginStoreManager:
             return (False, "No token provided")
         
         # Check cache first
-        cache_key = token[:10]  # Use first 10 chars as cache key for privacy
+        cache_key = self._token_cache_key(token)
+        self._sweep_expired_caches()
         if cache_key in self._token_validation_cache:
-            cached_valid, cached_time, cached_error = self._token_validation_cache[cache_key]
-            if time.time() - cached_time < self._token_validation_cache_timeout:
+            cached_time, (cached_valid, cached_error) = self._token_validation_cache[cache_key]
+            if time.monotonic() - cached_time < self._token_validation_cache_timeout:
                 return (cached_valid, cached_error)
         
         # Validate token by making a lightweight API call to /user endpoint
@@ -374,18 +884,18 @@ class PluginStoreManager:
                 'Authorization': f'token {token}'
             }
             
-            response = requests.get(api_url, headers=headers, timeout=5)
+            response = self._session.get(api_url, headers=headers, timeout=5)
             
             if response.status_code == 200:
                 # Token is valid
                 result = (True, None)
-                self._token_validation_cache[cache_key] = (True, time.time(), None)
+                self._cache_store(self._token_validation_cache, cache_key, (True, None), self._token_validation_cache_timeout)
                 return result
             elif response.status_code == 401:
                 # Token is invalid or expired
                 error_msg = "Token is invalid or expired"
                 result = (False, error_msg)
-                self._token_validation_cache[cache_key] = (False, time.time(), error_msg)
+                self._cache_store(self._token_validation_cache, cache_key, (False, error_msg), self._token_validation_cache_timeout)
                 return result
             elif response.status_code == 403:
                 # Rate limit or forbidden (but token might be valid)
@@ -399,13 +909,13 @@ class PluginStoreManager:
                     # Token lacks permissions: cache the result (permissions don't change)
                     error_msg = "Token lacks required permissions"
                     result = (False, error_msg)
-                    self._token_validation_cache[cache_key] = (False, time.time(), error_msg)
+                    self._cache_store(self._token_validation_cache, cache_key, (False, error_msg), self._token_validation_cache_timeout)
                     return result
             else:
                 # Other error
                 error_msg = f"GitHub API error: {response.status_code}"
                 result = (False, error_msg)
-                self._token_validation_cache[cache_key] = (False, time.time(), error_msg)
+                self._cache_store(self._token_validation_cache, cache_key, (False, error_msg), self._token_validation_cache_timeout)
                 return result
                 
         except requests.exceptions.Timeout:
@@ -425,11 +935,44 @@ class PluginStoreManager:
             return result
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _parse_github_url(url: str) -> Tuple[str, str]:
+        """Return ``(owner, repo)`` for a github.com repository URL.
+
+        Accepts trailing slashes and a ``.git`` suffix. Memoized since the
+        same handful of repo URLs are parsed on every metadata lookup.
+
+        Raises:
+            ValueError: If the URL is not a github.com URL with an owner/repo path.
+        """
+        parsed = urlparse(url)
+        if parsed.hostname not in ('github.com', 'www.github.com'):
+            raise ValueError(f"Not a GitHub URL: {url}")
+        path = parsed.path.rstrip('/')
+        if path.endswith('.git'):
+            path = path[:-4]
+        rest, _, repo = path.rpartition('/')
+        owner = rest.rpartition('/')[2]
+        if not owner or not repo:
+            raise ValueError(f"GitHub URL has no owner/repo: {url}")
+        return owner, repo
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _iso_to_date(iso_timestamp: str) -> str:
         """Convert an ISO timestamp to YYYY-MM-DD string."""
         if not iso_timestamp:
             return ""
 
+        # GitHub timestamps are always YYYY-MM-DDTHH:MM:SSZ; the date is
+        # just the first 10 characters, no datetime construction needed.
+        date_part = iso_timestamp[:10]
+        if (len(date_part) == 10 and date_part[4] == '-' and date_part[7] == '-'
+                and date_part[:4].isdigit() and date_part[5:7].isdigit()
+                and date_part[8:].isdigit()
+                and (len(iso_timestamp) == 10 or iso_timestamp[10] in 'T ')):
+            return date_part
+
         try:
             dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
             return dt.strftime('%Y-%m-%d')
@@ -439,16 +982,33 @@ class PluginStoreManager:
     @staticmethod
     def _distinct_sequence(values: List[str]) -> List[str]:
         """Return list preserving order while removing duplicates and falsey entries."""
-        seen = set()
-        ordered = []
-        for value in values:
-            if not value:
-                continue
-            if value in seen:
-                continue
-            seen.add(value)
-            ordered.append(value)
-        return ordered
+        return list(dict.fromkeys(value for value in values if value))
+    
+    def _known_default_branch(self, repo_url: str) -> Optional[str]:
+        """Return the repo's default branch from cached repo info, or None.
+
+        Only successful API responses are cached, so unlike the 'main'
+        placeholder returned on errors a cache hit is authoritative.
+        """
+        try:
+            owner, repo = self._parse_github_url(repo_url)
+        except ValueError:
+            return None
+        cached = self.github_cache.get(f"{owner}/{repo}")
+        return cached[1].get('default_branch') if cached is not None else None
+
+    def _branches_to_probe(self, repo_url: str, preferred: List[Optional[str]]) -> List[str]:
+        """Order branch names to try for ``repo_url``, most preferred first.
+
+        With a known default branch the list stops there: that branch exists
+        by definition, so probing 'main'/'master' after it would only add
+        404 round trips. Otherwise 'main' and 'master' are tried last.
+        """
+        default_branch = self._known_default_branch(repo_url)
+        if default_branch:
+            candidates = self._distinct_sequence([*preferred, default_branch])
+            return candidates[:candidates.index(default_branch) + 1]
+        return self._distinct_sequence([*preferred, *self._FALLBACK_BRANCHES])
     
     def _validate_manifest_version_fields(self, manifest: Dict[str, Any]) -> List[str]:
         """
@@ -470,9 +1030,10 @@ class PluginStoreManager:
         
         # Check compatible_versions is an array
         if 'compatible_versions' in manifest:
-            if not isinstance(manifest['compatible_versions'], list):
+            compatible = manifest['compatible_versions']
+            if not isinstance(compatible, list):
                 errors.append("compatible_versions must be an array")
-            elif len(manifest['compatible_versions']) == 0:
+            elif not compatible:
                 errors.append("compatible_versions array cannot be empty")
         
         # Warn about deprecated ledmatrix_version field
@@ -480,11 +1041,12 @@ class PluginStoreManager:
             errors.append("ledmatrix_version is deprecated, use compatible_versions instead")
         
         # Check versions array entries use standardized field names
-        if 'versions' in manifest and isinstance(manifest['versions'], list):
-            for i, version_entry in enumerate(manifest['versions']):
+        versions = manifest.get('versions')
+        if isinstance(versions, list):
+            for i, version_entry in enumerate(versions):
                 if not isinstance(version_entry, dict):
                     continue
-                
+
                 # Check for old ledmatrix_min field
                 if 'ledmatrix_min' in version_entry and 'ledmatrix_min_version' not in version_entry:
                     errors.append(f"versions[{i}] uses deprecated 'ledmatrix_min', should use 'ledmatrix_min_version'")
@@ -502,23 +1064,36 @@ class PluginStoreManager:
         Returns:
             List of validation error messages (empty if valid or schema unavailable)
         """
-        if not JSONSCHEMA_AVAILABLE:
+        jsonschema = _load_jsonschema()
+        if jsonschema is None:
             return []
         
         try:
             # Load manifest schema
-            schema_path = Path(__file__).parent.parent.parent / "schema" / "manifest_schema.json"
-            if not schema_path.exists():
+            schema_path = _SCHEMA_PATH
+            try:
+                schema_mtime = schema_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 return []  # Schema not available, skip validation
-            
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
-            
-            # Validate schema itself
-            Draft7Validator.check_schema(schema)
-            
-            # Validate manifest against schema
-            validator = Draft7Validator(schema)
+
+            cached = self._schema_cache
+            if cached is not None and cached[0] == schema_mtime:
+                validator = cached[1]
+            else:
+                with open(schema_path, 'rb') as f:
+                    schema = _json_loads(f.read())
+
+                # Validate schema itself
+                jsonschema.Draft7Validator.check_schema(schema)
+
+                validator = jsonschema.Draft7Validator(schema)
+                self._schema_cache = (schema_mtime, validator)
+
+            # Valid manifests are the common case: is_valid() stops at the
+            # first failure, so only walk the full error tree when needed.
+            if validator.is_valid(manifest):
+                return []
+
             errors = []
             for error in validator.iter_errors(manifest):
                 error_path = '.'.join(str(p) for p in error.path)
@@ -528,115 +1103,117 @@ class PluginStoreManager:
         except json.JSONDecodeError as e:
             self.logger.warning(f"Could not parse manifest schema: {e}")
             return []
-        except ValidationError as e:
+        except jsonschema.ValidationError as e:
             self.logger.warning(f"Manifest schema is invalid: {e}")
             return []
         except Exception as e:
             self.logger.debug(f"Error validating manifest schema for {plugin_id}: {e}")
             return []
 
-    def _get_github_repo_info(self, repo_url: str) -> Dict[str, Any]:
+    def _get_github_repo_info(self, repo_url: str, force_refresh: bool = False) -> Dict[str, Any]:
         """Fetch GitHub repository information (stars, etc.)"""
+        return self._singleflight(
+            ('repo', self._inflight_repo_key(repo_url), force_refresh),
+            lambda: self._do_get_github_repo_info(repo_url, force_refresh),
+        )
+
+    def _do_get_github_repo_info(self, repo_url: str, force_refresh: bool = False) -> Dict[str, Any]:
         # Extract owner/repo from URL
         try:
-            # Handle different URL formats
-            _parsed_url = urlparse(repo_url)
-            if _parsed_url.hostname in ('github.com', 'www.github.com'):
-                parts = repo_url.strip('/').split('/')
-                if len(parts) >= 2:
-                    owner = parts[-2]
-                    repo = parts[-1]
-                    if repo.endswith('.git'):
-                        repo = repo[:-4]
-
-                    cache_key = f"{owner}/{repo}"
-
-                    # Check cache first
-                    if cache_key in self.github_cache:
-                        cached_time, cached_data = self.github_cache[cache_key]
-                        if time.time() - cached_time < self.cache_timeout:
-                            return cached_data
-
-                    # Fetch from GitHub API
-                    api_url = f"https://api.github.com/repos/{owner}/{repo}"
-                    headers = {
-                        'Accept': 'application/vnd.github.v3+json',
-                        'User-Agent': 'LEDMatrix-Plugin-Manager/1.0'
-                    }
-                    
-                    # Add authentication if token is available
-                    if self.github_token:
-                        headers['Authorization'] = f'token {self.github_token}'
+            try:
+                owner, repo = self._parse_github_url(repo_url)
+            except ValueError:
+                owner = None
+            if owner is not None:
+                cache_key = f"{owner}/{repo}"
+
+                # Check cache first (single lookup on the warm path)
+                cached = self.github_cache.get(cache_key)
+                if (not force_refresh and cached is not None
+                        and time.monotonic() - cached[0] < self.cache_timeout):
+                    return cached[1]
+                self._sweep_expired_caches()
+
+                # Fetch from GitHub API
+                api_url = f"https://api.github.com/repos/{owner}/{repo}"
+                headers = {
+                    'Accept': 'application/vnd.github.v3+json',
+                    'User-Agent': 'LEDMatrix-Plugin-Manager/1.0'
+                }
+                
+                # Add authentication if token is available
+                if self.github_token:
+                    headers['Authorization'] = f'token {self.github_token}'
 
-                    try:
-                        response = requests.get(api_url, headers=headers, timeout=10)
-                    except requests.RequestException as req_err:
-                        # Network error: prefer a stale cache hit over an
-                        # empty default so the UI keeps working on a flaky
-                        # Pi WiFi link. Bump the cached entry's timestamp
-                        # into a short backoff window so subsequent
-                        # requests serve the stale payload cheaply instead
-                        # of re-hitting the network on every request.
-                        if cache_key in self.github_cache:
-                            _, stale = self.github_cache[cache_key]
-                            self._record_cache_backoff(self.github_cache, cache_key, self.cache_timeout, stale)
-                            self.logger.warning(
-                                "GitHub repo info fetch failed for %s (%s); serving stale cache.",
-                                cache_key, req_err,
-                            )
-                            return stale
-                        raise
+                try:
+                    response = self._http_get_with_retries(api_url, headers=headers, timeout=10)
+                except requests.RequestException as req_err:
+                    # Network error: prefer a stale cache hit over an
+                    # empty default so the UI keeps working on a flaky
+                    # Pi WiFi link. Bump the cached entry's timestamp
+                    # into a short backoff window so subsequent
+                    # requests serve the stale payload cheaply instead
+                    # of re-hitting the network on every request.
+                    if cache_key in self.github_cache:
+                        _, stale = self.github_cache[cache_key]
+                        self._record_cache_backoff(self.github_cache, cache_key, self.cache_timeout, stale)
+                        self.logger.warning(
+                            "GitHub repo info fetch failed for %s (%s); serving stale cache.",
+                            cache_key, req_err,
+                        )
+                        return stale
+                    raise
 
-                    if response.status_code == 200:
-                        data = response.json()
-                        pushed_at = data.get('pushed_at', '') or data.get('updated_at', '')
-                        repo_info = {
-                            'stars': data.get('stargazers_count', 0),
-                            'forks': data.get('forks_count', 0),
-                            'open_issues': data.get('open_issues_count', 0),
-                            'updated_at_iso': data.get('updated_at', ''),
-                            'last_commit_iso': pushed_at,
-                            'last_commit_date': self._iso_to_date(pushed_at),
-                            'language': data.get('language', ''),
-                            'license': data.get('license', {}).get('name', '') if data.get('license') else '',
-                            'default_branch': data.get('default_branch', 'main')
-                        }
+                if response.status_code == 200:
+                    data = _json_loads(response.content)
+                    pushed_at = data.get('pushed_at', '') or data.get('updated_at', '')
+                    repo_info = {
+                        'stars': data.get('stargazers_count', 0),
+                        'forks': data.get('forks_count', 0),
+                        'open_issues': data.get('open_issues_count', 0),
+                        'updated_at_iso': data.get('updated_at', ''),
+                        'last_commit_iso': pushed_at,
+                        'last_commit_date': self._iso_to_date(pushed_at),
+                        'language': data.get('language', ''),
+                        'license': data.get('license', {}).get('name', '') if data.get('license') else '',
+                        'default_branch': data.get('default_branch', 'main')
+                    }
 
-                        # Cache the result
-                        self.github_cache[cache_key] = (time.time(), repo_info)
-                        return repo_info
-                    elif response.status_code == 403:
-                        # Rate limit or authentication issue. If we have a
-                        # previously-cached value, serve it rather than
-                        # returning empty defaults — a stale star count is
-                        # better than a reset to zero. Apply the same
-                        # failure-backoff bump as the network-error path
-                        # so we don't hammer the API with repeat requests
-                        # while rate-limited.
-                        if cache_key in self.github_cache:
-                            _, stale = self.github_cache[cache_key]
-                            self._record_cache_backoff(self.github_cache, cache_key, self.cache_timeout, stale)
-                            self.logger.warning(
-                                "GitHub API 403 for %s; serving stale cache.", cache_key,
-                            )
-                            return stale
-                        if not self.github_token:
-                            self.logger.warning(
-                                "GitHub API rate limit likely exceeded (403). "
-                                "Add a GitHub personal access token to config/config_secrets.json "
-                                "under 'github.api_token' to increase rate limits from 60 to 5000/hour."
-                            )
-                        else:
-                            self.logger.warning(
-                                f"GitHub API request failed: 403 for {api_url}. "
-                                f"Your token may have insufficient permissions or rate limit exceeded."
-                            )
+                    # Cache the result
+                    self._cache_store(self.github_cache, cache_key, repo_info, self.cache_timeout)
+                    return repo_info
+                elif response.status_code == 403:
+                    # Rate limit or authentication issue. If we have a
+                    # previously-cached value, serve it rather than
+                    # returning empty defaults — a stale star count is
+                    # better than a reset to zero. Apply the same
+                    # failure-backoff bump as the network-error path
+                    # so we don't hammer the API with repeat requests
+                    # while rate-limited.
+                    if cache_key in self.github_cache:
+                        _, stale = self.github_cache[cache_key]
+                        self._record_cache_backoff(self.github_cache, cache_key, self.cache_timeout, stale)
+                        self.logger.warning(
+                            "GitHub API 403 for %s; serving stale cache.", cache_key,
+                        )
+                        return stale
+                    if not self.github_token:
+                        self.logger.warning(
+                            "GitHub API rate limit likely exceeded (403). "
+                            "Add a GitHub personal access token to config/config_secrets.json "
+                            "under 'github.api_token' to increase rate limits from 60 to 5000/hour."
+                        )
                     else:
-                        self.logger.warning(f"GitHub API request failed: {response.status_code} for {api_url}")
-                        if cache_key in self.github_cache:
-                            _, stale = self.github_cache[cache_key]
-                            self._record_cache_backoff(self.github_cache, cache_key, self.cache_timeout, stale)
-                            return stale
+                        self.logger.warning(
+                            f"GitHub API request failed: 403 for {api_url}. "
+                            f"Your token may have insufficient permissions or rate limit exceeded."
+                        )
+                else:
+                    self.logger.warning(f"GitHub API request failed: {response.status_code} for {api_url}")
+                    if cache_key in self.github_cache:
+                        _, stale = self.github_cache[cache_key]
+                        self._record_cache_backoff(self.github_cache, cache_key, self.cache_timeout, stale)
+                        return stale
 
             return {
                 'stars': 0,
@@ -651,7 +1228,11 @@ class PluginStoreManager:
             }
 
         except Exception as e:
-            self.logger.error(f"Error fetching GitHub repo info for {repo_url}: {e}")
+            if isinstance(e, _GitHubRateLimited):
+                # Already warned once for this rate-limit window
+                self.logger.debug(f"Skipped GitHub repo info for {repo_url}: {e}")
+            else:
+                self.logger.error(f"Error fetching GitHub repo info for {repo_url}: {e}")
             return {
                 'stars': 0,
                 'forks': 0,
@@ -664,24 +1245,106 @@ class PluginStoreManager:
                 'default_branch': 'main'
             }
 
-    def _http_get_with_retries(self, url: str, *, timeout: int = 10, stream: bool = False, headers: Dict[str, str] = None, max_retries: int = 3, backoff_sec: float = 0.75):
+    def _http_get_with_retries(self, url: str, *, timeout: int = 10, stream: bool = False, headers: Dict[str, str] = None):
         """
-        HTTP GET with simple retry strategy and exponential backoff.
+        HTTP GET through the shared session.
 
-        Returns a requests.Response or raises the last exception.
+        Retry and backoff are handled by the session's urllib3 adapter
+        (see ``_build_http_session``). Returns a requests.Response or raises
+        the final requests.RequestException once retries are exhausted.
+        GitHub API calls raise ``_GitHubRateLimited`` without touching the
+        network while the rate limit is exhausted.
         """
-        last_exc = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                resp = requests.get(url, timeout=timeout, stream=stream, headers=headers)
-                return resp
-            except requests.RequestException as e:
-                last_exc = e
-                self.logger.warning(f"HTTP GET failed (attempt {attempt}/{max_retries}) for {url}: {e}")
-                if attempt < max_retries:
-                    time.sleep(backoff_sec * attempt)
-        # Exhausted retries
-        raise last_exc
+        if not url.startswith(_GITHUB_API_PREFIX):
+            return self._session.get(url, timeout=timeout, stream=stream, headers=headers)
+        if time.time() < self._rate_limit_reset:
+            raise _GitHubRateLimited(f"GitHub API rate limit exhausted; skipping {url}")
+        response = self._session.get(url, timeout=timeout, stream=stream, headers=headers)
+        self._note_rate_limit(response)
+        return response
+
+    def _note_rate_limit(self, response) -> None:
+        """Start skipping GitHub API calls if ``response`` used up the rate limit."""
+        headers = response.headers
+        if headers.get('X-RateLimit-Remaining') != '0':
+            return
+        try:
+            reset = float(headers.get('X-RateLimit-Reset', 0))
+        except (TypeError, ValueError):
+            return
+        if reset <= time.time():
+            return
+        self._rate_limit_reset = reset
+        if reset != self._rate_limit_warned_reset:
+            self._rate_limit_warned_reset = reset
+            hint = "" if self.github_token else (
+                " Add a GitHub personal access token to config/config_secrets.json "
+                "under 'github.api_token' to raise the limit from 60 to 5000/hour."
+            )
+            self.logger.warning(
+                f"GitHub API rate limit exhausted; serving cached data until "
+                f"{datetime.fromtimestamp(reset).strftime('%H:%M:%S')}.{hint}"
+            )
+
+    def _get_json_conditional(self, url: str, headers: Dict[str, str],
+                              extract: Callable[[Any], Any], timeout: int = 10,
+                              cache_key: Optional[str] = None):
+        """GET a GitHub API JSON resource, revalidating with its ETag.
+
+        ``extract`` reduces the parsed body to what the caller uses, and only
+        that is cached next to the ETag (a recursive tree listing can be
+        megabytes). ``cache_key`` defaults to ``url``; pass a distinct one
+        when the same URL is reduced differently.
+
+        Returns ``(response, data)``. ``data`` is ``extract(body)`` on a 200,
+        the previously cached extract on a 304, and None otherwise.
+        """
+        cache_key = cache_key or url
+        cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            headers = dict(headers, **{'If-None-Match': cached[0]})
+        response = self._http_get_with_retries(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return response, cached[1]
+        if response.status_code != 200:
+            return response, None
+        data = extract(_json_loads(response.content))
+        etag = response.headers.get('ETag')
+        if isinstance(etag, str) and etag:
+            self._etag_cache[cache_key] = (etag, data)
+            self._schedule_cache_persist()
+        return response, data
+
+    @classmethod
+    def _commit_summary(cls, commit_data: Dict) -> Dict[str, str]:
+        """Reduce a commits API response to the fields the store displays."""
+        commit_sha_full = commit_data.get('sha', '')
+        commit_meta = commit_data.get('commit', {})
+        commit_author = commit_meta.get('author', {})
+        commit_date_iso = commit_author.get('date', '')
+        return {
+            'sha': commit_sha_full,
+            'short_sha': commit_sha_full[:7] if commit_sha_full else '',
+            'date_iso': commit_date_iso,
+            'date': cls._iso_to_date(commit_date_iso),
+            'author': commit_author.get('name', ''),
+            'message': commit_meta.get('message', ''),
+        }
+
+    @staticmethod
+    def _tree_blob_paths(tree_data: Dict, prefix: str, subtree: bool) -> Tuple[bool, List[str]]:
+        """Reduce a Git Trees API response to ``(truncated, blob_paths)``.
+
+        Paths are repo-relative and limited to ``prefix``. A ``<ref>:<path>``
+        subtree listing is relative to the plugin directory, so ``prefix`` is
+        prepended instead of filtered on.
+        """
+        blobs = [entry['path'] for entry in tree_data.get('tree', []) if entry['type'] == 'blob']
+        if subtree:
+            paths = [prefix + path for path in blobs]
+        else:
+            paths = [path for path in blobs if path.startswith(prefix)]
+        return bool(tree_data.get('truncated')), paths
 
     def fetch_registry_from_url(self, repo_url: str) -> Optional[Dict]:
         """
@@ -697,32 +1360,27 @@ class PluginStoreManager:
             Registry dict with plugins list, or None if not found/invalid
         """
         try:
-            # Clean up URL
-            repo_url = repo_url.rstrip('/').replace('.git', '')
-            
             # Try to find plugins.json in common locations
             # First try root directory
             registry_urls = []
 
             # Extract owner/repo from URL
-            _parsed_repo_url = urlparse(repo_url)
-            if _parsed_repo_url.hostname in ('github.com', 'www.github.com'):
-                parts = repo_url.split('/')
-                if len(parts) >= 2:
-                    owner = parts[-2]
-                    repo = parts[-1]
-                    
-                    # Try common branch names
-                    for branch in ['main', 'master']:
-                        registry_urls.append(f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/plugins.json")
-                        registry_urls.append(f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/registry.json")
+            try:
+                owner, repo = self._parse_github_url(repo_url)
+            except ValueError:
+                owner = None
+            if owner is not None:
+                # Try the default branch if known, else the common names
+                for branch in self._branches_to_probe(repo_url, []):
+                    registry_urls.append(f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/plugins.json")
+                    registry_urls.append(f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/registry.json")
             
             # Try each URL
             for url in registry_urls:
                 try:
                     response = self._http_get_with_retries(url, timeout=10)
                     if response.status_code == 200:
-                        registry = response.json()
+                        registry = _json_loads(response.content)
                         # Validate it looks like a registry
                         if isinstance(registry, dict) and 'plugins' in registry:
                             self.logger.info(f"Successfully fetched registry from {url}")
@@ -760,7 +1418,7 @@ class PluginStoreManager:
             ``raise_on_failure`` is True and the fetch fails.
         """
         # Check if cache is still valid (within timeout)
-        current_time = time.time()
+        current_time = time.monotonic()
         if (self.registry_cache and self.registry_cache_time and
             not force_refresh and
             (current_time - self.registry_cache_time) < self.registry_cache_timeout):
@@ -769,7 +1427,7 @@ class PluginStoreManager:
         with self._registry_fetch_lock:
             # Re-check inside the lock — a concurrent caller that was waiting
             # may have already populated the cache while we blocked.
-            current_time = time.time()
+            current_time = time.monotonic()
             if (self.registry_cache and self.registry_cache_time and
                     not force_refresh and
                     (current_time - self.registry_cache_time) < self.registry_cache_timeout):
@@ -777,10 +1435,29 @@ class PluginStoreManager:
 
             try:
                 self.logger.info(f"Fetching plugin registry from {self.REGISTRY_URL}")
-                response = self._http_get_with_retries(self.REGISTRY_URL, timeout=10)
+                conditional_headers = {}
+                if self.registry_cache:
+                    if self._registry_etag:
+                        conditional_headers['If-None-Match'] = self._registry_etag
+                    if self._registry_last_modified:
+                        conditional_headers['If-Modified-Since'] = self._registry_last_modified
+                response = self._http_get_with_retries(
+                    self.REGISTRY_URL, timeout=10, headers=conditional_headers or None
+                )
+                if response.status_code == 304 and self.registry_cache:
+                    self.logger.debug("Plugin registry unchanged (304), keeping cached copy")
+                    self.registry_cache_time = current_time
+                    return self.registry_cache
                 response.raise_for_status()
-                self.registry_cache = response.json()
+                self.registry_cache = _json_loads(response.content)
+                self._registry_body = response.content
                 self.registry_cache_time = current_time
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                self._registry_etag = etag if isinstance(etag, str) else None
+                self._registry_last_modified = last_modified if isinstance(last_modified, str) else None
+                if self._registry_etag or self._registry_last_modified:
+                    self._schedule_cache_persist()
                 self.logger.info(f"Fetched registry with {len(self.registry_cache.get('plugins', []))} plugins")
                 return self.registry_cache
             except requests.RequestException as e:
@@ -796,7 +1473,7 @@ class PluginStoreManager:
                 if self.registry_cache:
                     self.logger.warning("Falling back to stale registry cache")
                     self.registry_cache_time = (
-                        time.time() + self._failure_backoff_seconds - self.registry_cache_timeout
+                        time.monotonic() + self._failure_backoff_seconds - self.registry_cache_timeout
                     )
                     return self.registry_cache
                 return {"plugins": []}
@@ -806,7 +1483,7 @@ class PluginStoreManager:
                     raise
                 if self.registry_cache:
                     self.registry_cache_time = (
-                        time.time() + self._failure_backoff_seconds - self.registry_cache_timeout
+                        time.monotonic() + self._failure_backoff_seconds - self.registry_cache_timeout
                     )
                     return self.registry_cache
                 return {"plugins": []}
@@ -833,7 +1510,9 @@ class PluginStoreManager:
 
         # Fetch from official registry
         registry = self.fetch_registry()
-        plugins = registry.get('plugins', []) or []
+        # A fresh list: the registry dict is the long-lived cache (kept
+        # across 304 revalidations), so it must not collect custom plugins.
+        plugins = list(registry.get('plugins') or [])
         
         # Also fetch from saved repositories if enabled
         if include_saved_repos and saved_repositories_manager:
@@ -845,12 +1524,13 @@ class PluginStoreManager:
                         custom_registry = self.fetch_registry_from_url(repo_url)
                         if custom_registry:
                             custom_plugins = custom_registry.get('plugins', []) or []
-                            # Mark these as from custom repository
-                            for plugin in custom_plugins:
-                                plugin['_source'] = 'custom_repository'
-                                plugin['_repository_url'] = repo_url
-                                plugin['_repository_name'] = repo_info.get('name', repo_url)
-                            plugins.extend(custom_plugins)
+                            # Mark copies as from custom repository
+                            repo_name = repo_info.get('name', repo_url)
+                            plugins.extend(
+                                dict(plugin, _source='custom_repository',
+                                     _repository_url=repo_url, _repository_name=repo_name)
+                                for plugin in custom_plugins
+                            )
                     except Exception as e:
                         self.logger.warning(f"Failed to fetch plugins from saved repository {repo_url}: {e}")
 
@@ -958,47 +1638,47 @@ class PluginStoreManager:
         Returns:
             Manifest data or None if not found
         """
+        return self._singleflight(
+            ('manifest', self._inflight_repo_key(repo_url), branch, manifest_path, force_refresh),
+            lambda: self._do_fetch_manifest_from_github(repo_url, branch, manifest_path, force_refresh),
+        )
+
+    def _do_fetch_manifest_from_github(self, repo_url: str, branch: str, manifest_path: str, force_refresh: bool) -> Optional[Dict]:
         try:
             # Convert repo URL to raw content URL
             # https://github.com/user/repo -> https://raw.githubusercontent.com/user/repo/branch/manifest.json
-            _parsed_manifest_url = urlparse(repo_url)
-            if _parsed_manifest_url.hostname in ('github.com', 'www.github.com'):
-                # Handle different URL formats
-                repo_url = repo_url.rstrip('/')
-                if repo_url.endswith('.git'):
-                    repo_url = repo_url[:-4]
-
-                parts = repo_url.split('/')
-                if len(parts) >= 2:
-                    owner = parts[-2]
-                    repo = parts[-1]
-
-                    # Check cache first
-                    cache_key = f"{owner}/{repo}:{branch}:{manifest_path}"
-                    if not force_refresh and cache_key in self.manifest_cache:
-                        cached_time, cached_data = self.manifest_cache[cache_key]
-                        if time.time() - cached_time < self.manifest_cache_timeout:
-                            return cached_data
-
-                    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{manifest_path}"
-
-                    response = self._http_get_with_retries(raw_url, timeout=10)
-                    if response.status_code == 200:
-                        result = response.json()
-                        self.manifest_cache[cache_key] = (time.time(), result)
-                        return result
-                    elif response.status_code == 404:
-                        # Try main branch instead
-                        if branch != "main":
-                            raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{manifest_path}"
-                            response = self._http_get_with_retries(raw_url, timeout=10)
-                            if response.status_code == 200:
-                                result = response.json()
-                                self.manifest_cache[cache_key] = (time.time(), result)
-                                return result
-
-                    # Cache negative result
-                    self.manifest_cache[cache_key] = (time.time(), None)
+            try:
+                owner, repo = self._parse_github_url(repo_url)
+            except ValueError:
+                owner = None
+            if owner is not None:
+                # Check cache first
+                cache_key = f"{owner}/{repo}:{branch}:{manifest_path}"
+                self._sweep_expired_caches()
+                if not force_refresh and cache_key in self.manifest_cache:
+                    cached_time, cached_data = self.manifest_cache[cache_key]
+                    if time.monotonic() - cached_time < self.manifest_cache_timeout:
+                        return cached_data
+
+                raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{manifest_path}"
+
+                response = self._http_get_with_retries(raw_url, timeout=10)
+                if response.status_code == 200:
+                    result = _json_loads(response.content)
+                    self._cache_store(self.manifest_cache, cache_key, result, self.manifest_cache_timeout)
+                    return result
+                elif response.status_code == 404:
+                    # Try main branch instead
+                    if branch != "main":
+                        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{manifest_path}"
+                        response = self._http_get_with_retries(raw_url, timeout=10)
+                        if response.status_code == 200:
+                            result = _json_loads(response.content)
+                            self._cache_store(self.manifest_cache, cache_key, result, self.manifest_cache_timeout)
+                            return result
+
+                # Cache negative result
+                self._cache_store(self.manifest_cache, cache_key, None, self.manifest_cache_timeout)
         except Exception as e:
             self.logger.debug(f"Could not fetch manifest from GitHub for {repo_url}: {e}")
 
@@ -1006,29 +1686,41 @@ class PluginStoreManager:
     
     def _get_latest_commit_info(self, repo_url: str, branch: str = "main", force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """Return metadata about the latest commit on the given branch."""
-        try:
-            if 'github.com' not in repo_url:
-                return None
-
-            repo_url = repo_url.rstrip('/')
-            if repo_url.endswith('.git'):
-                repo_url = repo_url[:-4]
+        return self._singleflight(
+            ('commit', self._inflight_repo_key(repo_url), branch, force_refresh),
+            lambda: self._do_get_latest_commit_info(repo_url, branch, force_refresh),
+        )
 
-            parts = repo_url.split('/')
-            if len(parts) < 2:
+    def _do_get_latest_commit_info(self, repo_url: str, branch: str, force_refresh: bool) -> Optional[Dict[str, Any]]:
+        try:
+            try:
+                owner, repo = self._parse_github_url(repo_url)
+            except ValueError:
                 return None
 
-            owner = parts[-2]
-            repo = parts[-1]
-
             # Check cache first
             cache_key = f"{owner}/{repo}:{branch}"
+            self._sweep_expired_caches()
             if not force_refresh and cache_key in self.commit_info_cache:
                 cached_time, cached_data = self.commit_info_cache[cache_key]
-                if time.time() - cached_time < self.commit_cache_timeout:
+                if time.monotonic() - cached_time < self.commit_cache_timeout:
                     return cached_data
 
-            branches_to_try = self._distinct_sequence([branch, 'main', 'master'])
+            branches_to_try = self._branches_to_probe(repo_url, [branch])
+
+            # With a token, resolve every candidate branch in one GraphQL
+            # round trip instead of up to three sequential REST probes.
+            # GraphQL requires auth, so anonymous callers use REST below;
+            # any GraphQL failure also falls back to REST.
+            if self.github_token:
+                try:
+                    result = self._graphql_latest_commit(owner, repo, branches_to_try)
+                except (requests.RequestException, ValueError) as gql_err:
+                    self.logger.debug(f"GraphQL commit lookup failed for {repo_url}: {gql_err}")
+                    result = None
+                if result is not None:
+                    self._cache_store(self.commit_info_cache, cache_key, result, self.commit_cache_timeout)
+                    return result
 
             headers = {
                 'Accept': 'application/vnd.github.v3+json',
@@ -1042,7 +1734,8 @@ class PluginStoreManager:
             for branch_name in branches_to_try:
                 api_url = f"https://api.github.com/repos/{owner}/{repo}/commits/{branch_name}"
                 try:
-                    response = requests.get(api_url, headers=headers, timeout=10)
+                    response, commit_summary = self._get_json_conditional(
+                        api_url, headers, self._commit_summary, timeout=10)
                 except requests.RequestException as req_err:
                     # Network failure: fall back to a stale cache hit if
                     # available so the plugin store UI keeps populating
@@ -1063,24 +1756,9 @@ class PluginStoreManager:
                             return stale
                     last_error = str(req_err)
                     continue
-                if response.status_code == 200:
-                    commit_data = response.json()
-                    commit_sha_full = commit_data.get('sha', '')
-                    commit_sha_short = commit_sha_full[:7] if commit_sha_full else ''
-                    commit_meta = commit_data.get('commit', {})
-                    commit_author = commit_meta.get('author', {})
-                    commit_date_iso = commit_author.get('date', '')
-
-                    result = {
-                        'branch': branch_name,
-                        'sha': commit_sha_full,
-                        'short_sha': commit_sha_short,
-                        'date_iso': commit_date_iso,
-                        'date': self._iso_to_date(commit_date_iso),
-                        'author': commit_author.get('name', ''),
-                        'message': commit_meta.get('message', ''),
-                    }
-                    self.commit_info_cache[cache_key] = (time.time(), result)
+                if commit_summary is not None:
+                    result = {'branch': branch_name, **commit_summary}
+                    self._cache_store(self.commit_info_cache, cache_key, result, self.commit_cache_timeout)
                     return result
 
                 if response.status_code == 403 and not self.github_token:
@@ -1109,7 +1787,7 @@ class PluginStoreManager:
 
             # No prior good value — cache the negative result so we don't
             # hammer a plugin that genuinely has no reachable commits.
-            self.commit_info_cache[cache_key] = (time.time(), None)
+            self._cache_store(self.commit_info_cache, cache_key, None, self.commit_cache_timeout)
 
         except Exception as e:
             self.logger.debug(f"Error fetching latest commit metadata for {repo_url}: {e}")
@@ -1117,6 +1795,185 @@ class PluginStoreManager:
         return None
     
     
+    def _graphql_post(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a query to the GitHub GraphQL API and return its ``data``.
+
+        Raises:
+            requests.RequestException: On transport errors or a non-200 response.
+            ValueError: If the response carries GraphQL errors or no data.
+        """
+        response = self._session.post(
+            self.GRAPHQL_URL,
+            json={'query': query, 'variables': variables},
+            headers={
+                'Authorization': f'bearer {self.github_token}',
+                'User-Agent': 'LEDMatrix-Plugin-Manager/1.0',
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+        payload = _json_loads(response.content)
+        if payload.get('errors') or not payload.get('data'):
+            raise ValueError(f"GraphQL errors: {payload.get('errors')}")
+        return payload['data']
+
+    def _graphql_latest_commit(self, owner: str, repo: str, branches: List[str]) -> Optional[Dict[str, Any]]:
+        """Resolve the first existing branch in ``branches`` with one GraphQL query.
+
+        Each candidate becomes an aliased ``ref`` field; refs that don't
+        exist come back null. Returns a dict shaped like the REST path's
+        result, or None if none of the branches exist.
+        """
+        var_defs = ['$owner: String!', '$name: String!']
+        fields = []
+        variables: Dict[str, Any] = {'owner': owner, 'name': repo}
+        for i, branch_name in enumerate(branches):
+            var_defs.append(f'$b{i}: String!')
+            fields.append(
+                f'b{i}: ref(qualifiedName: $b{i}) {{ target {{ ... on Commit '
+                f'{{ oid authoredDate message author {{ name }} }} }} }}'
+            )
+            variables[f'b{i}'] = f'refs/heads/{branch_name}'
+        query = (
+            f"query({', '.join(var_defs)}) {{ repository(owner: $owner, name: $name) "
+            f"{{ {' '.join(fields)} }} }}"
+        )
+
+        repository = self._graphql_post(query, variables).get('repository') or {}
+        for i, branch_name in enumerate(branches):
+            result = self._graphql_commit_result(branch_name, repository.get(f'b{i}'))
+            if result is not None:
+                return result
+        return None
+
+    def _graphql_commit_result(self, branch_name: str, ref: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Shape a GraphQL ``ref { target { ... on Commit } }`` node like the REST commit result."""
+        target = (ref or {}).get('target') or {}
+        commit_sha_full = target.get('oid')
+        if not commit_sha_full:
+            return None
+        commit_date_iso = target.get('authoredDate', '')
+        return {
+            'branch': branch_name,
+            'sha': commit_sha_full,
+            'short_sha': commit_sha_full[:7],
+            'date_iso': commit_date_iso,
+            'date': self._iso_to_date(commit_date_iso),
+            'author': (target.get('author') or {}).get('name', ''),
+            'message': target.get('message', ''),
+        }
+
+    def _graphql_plugin_snapshot(self, owner: str, repo: str, branch: Optional[str],
+                                 manifest_path: str) -> Dict[str, Any]:
+        """Fetch repo info, the branch's latest commit and the manifest in one GraphQL query.
+
+        When ``branch`` is None the repository's default branch is used.
+        Returns ``{'repo_info', 'branch', 'commit', 'manifest'}``; ``commit``
+        and ``manifest`` are None when the branch or file doesn't exist.
+        """
+        commit_fields = '... on Commit { oid authoredDate message author { name } }'
+        var_defs = ['$owner: String!', '$name: String!', '$expr: String!']
+        variables: Dict[str, Any] = {
+            'owner': owner,
+            'name': repo,
+            'expr': f"{branch or 'HEAD'}:{manifest_path}",
+        }
+        branch_field = ''
+        if branch:
+            var_defs.append('$qualified: String!')
+            variables['qualified'] = f'refs/heads/{branch}'
+            branch_field = f'branch: ref(qualifiedName: $qualified) {{ target {{ {commit_fields} }} }}'
+        query = (
+            f"query({', '.join(var_defs)}) {{ repository(owner: $owner, name: $name) {{ "
+            f"stargazerCount forkCount updatedAt pushedAt "
+            f"issues(states: OPEN) {{ totalCount }} pullRequests(states: OPEN) {{ totalCount }} "
+            f"primaryLanguage {{ name }} licenseInfo {{ name }} "
+            f"defaultBranchRef {{ name target {{ {commit_fields} }} }} "
+            f"{branch_field} "
+            f"manifest: object(expression: $expr) {{ ... on Blob {{ text }} }} }} }}"
+        )
+
+        repository = self._graphql_post(query, variables).get('repository')
+        if not repository:
+            raise ValueError(f"Repository {owner}/{repo} not found")
+
+        default_ref = repository.get('defaultBranchRef') or {}
+        default_branch = default_ref.get('name') or 'main'
+        updated_at = repository.get('updatedAt') or ''
+        pushed_at = repository.get('pushedAt') or updated_at
+        repo_info = {
+            'stars': repository.get('stargazerCount', 0),
+            'forks': repository.get('forkCount', 0),
+            # REST's open_issues_count includes open pull requests.
+            'open_issues': ((repository.get('issues') or {}).get('totalCount', 0)
+                            + (repository.get('pullRequests') or {}).get('totalCount', 0)),
+            'updated_at_iso': updated_at,
+            'last_commit_iso': pushed_at,
+            'last_commit_date': self._iso_to_date(pushed_at),
+            'language': (repository.get('primaryLanguage') or {}).get('name', ''),
+            'license': (repository.get('licenseInfo') or {}).get('name', ''),
+            'default_branch': default_branch,
+        }
+
+        resolved_branch = branch or default_branch
+        commit_ref = repository.get('branch') if branch else default_ref
+        manifest = None
+        blob = repository.get('manifest') or {}
+        if blob.get('text') is not None:
+            try:
+                manifest = _json_loads(blob['text'])
+            except ValueError as parse_err:
+                self.logger.debug(f"Invalid manifest {manifest_path} in {owner}/{repo}: {parse_err}")
+
+        return {
+            'repo_info': repo_info,
+            'branch': resolved_branch,
+            'commit': self._graphql_commit_result(resolved_branch, commit_ref),
+            'manifest': manifest,
+        }
+
+    def _prime_plugin_caches(self, repo_url: str, branch: Optional[str], manifest_path: str) -> None:
+        """Fill the repo, commit and manifest caches for one plugin with a single GraphQL query.
+
+        Only runs with a token (GraphQL requires auth) and when at least one
+        of the three entries ``get_plugin_info`` needs is missing or stale.
+        Anything the snapshot can't answer (a missing branch or manifest) is
+        left uncached so the REST helpers apply their usual branch fallbacks.
+        """
+        if not self.github_token:
+            return
+        try:
+            owner, repo = self._parse_github_url(repo_url)
+        except ValueError:
+            return
+
+        now = time.monotonic()
+        repo_key = f"{owner}/{repo}"
+        cached_repo = self.github_cache.get(repo_key)
+        if cached_repo is not None and now - cached_repo[0] < self.cache_timeout:
+            branch = branch or cached_repo[1].get('default_branch')
+            cached_commit = self.commit_info_cache.get(f"{repo_key}:{branch}")
+            cached_manifest = self.manifest_cache.get(f"{repo_key}:{branch}:{manifest_path}")
+            if (cached_commit is not None and now - cached_commit[0] < self.commit_cache_timeout
+                    and cached_manifest is not None
+                    and now - cached_manifest[0] < self.manifest_cache_timeout):
+                return
+
+        try:
+            snapshot = self._graphql_plugin_snapshot(owner, repo, branch, manifest_path)
+        except (requests.RequestException, ValueError) as gql_err:
+            self.logger.debug(f"GraphQL plugin snapshot failed for {repo_url}: {gql_err}")
+            return
+
+        resolved_branch = snapshot['branch']
+        self._cache_store(self.github_cache, repo_key, snapshot['repo_info'], self.cache_timeout)
+        if snapshot['commit'] is not None:
+            self._cache_store(self.commit_info_cache, f"{repo_key}:{resolved_branch}",
+                              snapshot['commit'], self.commit_cache_timeout)
+        if snapshot['manifest'] is not None:
+            self._cache_store(self.manifest_cache, f"{repo_key}:{resolved_branch}:{manifest_path}",
+                              snapshot['manifest'], self.manifest_cache_timeout)
+
     def get_plugin_info(self, plugin_id: str, fetch_latest_from_github: bool = True, force_refresh: bool = False) -> Optional[Dict]:
         """
         Get detailed information about a plugin from the registry.
@@ -1132,9 +1989,7 @@ class PluginStoreManager:
         Returns:
             Plugin metadata or None if not found
         """
-        registry = self.fetch_registry()
-        plugins = registry.get('plugins', []) or []
-        plugin_info = next((p for p in plugins if p['id'] == plugin_id), None)
+        plugin_info = self._find_registry_plugin(self.fetch_registry(), plugin_id)
 
         if not plugin_info:
             return None
@@ -1144,7 +1999,15 @@ class PluginStoreManager:
             if repo_url:
                 plugin_info = plugin_info.copy()
 
-                github_info = self._get_github_repo_info(repo_url)
+                plugin_subpath = plugin_info.get('plugin_path', '')
+                manifest_rel = f"{plugin_subpath}/manifest.json" if plugin_subpath else "manifest.json"
+                # With a token, one GraphQL query warms all three lookups
+                # below; they then hit the cache instead of making three
+                # REST calls. force_refresh bypasses those caches anyway.
+                if not force_refresh:
+                    self._prime_plugin_caches(repo_url, plugin_info.get('branch'), manifest_rel)
+
+                github_info = self._get_github_repo_info(repo_url, force_refresh=force_refresh)
                 branch = plugin_info.get('branch') or github_info.get('default_branch', 'main')
 
                 plugin_info['default_branch'] = github_info.get('default_branch', branch)
@@ -1163,8 +2026,6 @@ class PluginStoreManager:
                     plugin_info['branch'] = commit_info.get('branch', branch)
                     plugin_info['last_commit_branch'] = commit_info.get('branch')
 
-                plugin_subpath = plugin_info.get('plugin_path', '')
-                manifest_rel = f"{plugin_subpath}/manifest.json" if plugin_subpath else "manifest.json"
                 github_manifest = self._fetch_manifest_from_github(repo_url, branch, manifest_rel, force_refresh=force_refresh)
                 if github_manifest:
                     if 'last_updated' in github_manifest and not plugin_info.get('last_updated'):
@@ -1187,9 +2048,27 @@ class PluginStoreManager:
         Returns:
             Plugin metadata from registry or None if not found
         """
-        registry = self.fetch_registry()
+        return self._find_registry_plugin(self.fetch_registry(), plugin_id)
+
+    def _find_registry_plugin(self, registry: Dict, plugin_id: str) -> Optional[Dict]:
+        """Look up a registry entry by id through a lazily built index.
+
+        The ``{id: entry}`` index is rebuilt whenever the registry object
+        (or its plugins list) changes, so it follows fetch_registry refreshes
+        as well as direct assignments to ``registry_cache``. The first entry
+        wins for duplicate ids, matching the linear scan it replaces.
+        """
         plugins = registry.get('plugins', []) or []
-        return next((p for p in plugins if p.get('id') == plugin_id), None)
+        cached = self._plugin_index
+        if cached is not None and cached[0] is registry and cached[1] is plugins and cached[2] == len(plugins):
+            return cached[3].get(plugin_id)
+        index: Dict[str, Dict] = {}
+        for entry in plugins:
+            entry_id = entry.get('id') if isinstance(entry, dict) else None
+            if entry_id is not None:
+                index.setdefault(entry_id, entry)
+        self._plugin_index = (registry, plugins, len(plugins), index)
+        return index.get(plugin_id)
     
     def install_plugin(self, plugin_id: str, branch: Optional[str] = None) -> bool:
         """
@@ -1226,13 +2105,11 @@ class PluginStoreManager:
 
         plugin_subpath = plugin_info.get('plugin_path')
         # If branch is provided, prioritize it; otherwise use default logic
-        branch_candidates = self._distinct_sequence([
+        branch_candidates = self._branches_to_probe(repo_url, [
             branch,  # User-specified branch takes highest priority
             plugin_info.get('branch'),
             plugin_info.get('default_branch'),
             plugin_info.get('last_commit_branch'),
-            'main',
-            'master'
         ])
 
         # Use manifest ID for directory name (not registry plugin_id) to ensure consistency
@@ -1252,7 +2129,8 @@ class PluginStoreManager:
                 self.logger.info(f"Installing from monorepo subdirectory: {plugin_subpath}")
                 for candidate in branch_candidates:
                     download_url = f"{repo_url}/archive/refs/heads/{candidate}.zip"
-                    if self._install_from_monorepo(download_url, plugin_subpath, plugin_path):
+                    commit_sha = self._commit_sha_for_branch(plugin_info, candidate)
+                    if self._install_from_monorepo(download_url, plugin_subpath, plugin_path, commit_sha):
                         branch_used = candidate
                         break
 
@@ -1265,7 +2143,7 @@ class PluginStoreManager:
                     # Git failed entirely; fall back to zip download
                     self.logger.info("Git not available or clone failed, attempting archive download...")
                     for candidate in branch_candidates:
-                        download_url = f"{repo_url}/archive/refs/heads/{candidate}.zip"
+                        download_url = f"{repo_url}/archive/refs/heads/{candidate}.tar.gz"
                         if self._install_via_download(download_url, plugin_path):
                             branch_used = candidate
                             break
@@ -1281,8 +2159,7 @@ class PluginStoreManager:
                 return False
 
             try:
-                with open(manifest_path, 'r', encoding='utf-8') as mf:
-                    manifest = json.load(mf)
+                manifest = _json_loads(manifest_path.read_bytes())
 
                 # Get the actual plugin ID from manifest (source of truth)
                 manifest_plugin_id = manifest.get('id')
@@ -1303,7 +2180,7 @@ class PluginStoreManager:
                         if not self._safe_remove_directory(correct_path):
                             self.logger.error(f"Failed to remove existing directory {correct_path}, cannot rename plugin")
                             return False
-                    shutil.move(str(plugin_path), str(correct_path))
+                    self._move_into_place(plugin_path, correct_path)
                     plugin_path = correct_path
                     manifest_path = plugin_path / "manifest.json"
                     # Update plugin_id to match manifest for rest of function
@@ -1339,8 +2216,7 @@ class PluginStoreManager:
                     self.logger.info(f"Added missing entry_point field to {plugin_id} manifest (defaulted to manager.py)")
 
                 if manifest_modified:
-                    with open(manifest_path, 'w', encoding='utf-8') as mf:
-                        json.dump(manifest, mf, indent=2)
+                    self._replace_json_file(manifest_path, manifest)
 
             except Exception as manifest_error:
                 self.logger.error(f"Failed to read/validate manifest for {plugin_id}: {manifest_error}")
@@ -1387,15 +2263,16 @@ class PluginStoreManager:
         self.logger.info(f"Installing plugin from custom URL: {repo_url}{branch_info}" + (f" (subpath: {plugin_path})" if plugin_path else ""))
         
         # Clean up URL (remove .git suffix if present)
-        repo_url = repo_url.rstrip('/').replace('.git', '')
+        repo_url = self._strip_repo_url(repo_url)
         
         temp_dir = None
         try:
-            # Create temporary directory
-            temp_dir = Path(tempfile.mkdtemp(prefix='ledmatrix_plugin_'))
+            # Stage inside plugins_dir (hidden, so plugin discovery skips it)
+            # so the final move is a same-filesystem rename, not a copy.
+            temp_dir = Path(tempfile.mkdtemp(prefix='.ledmatrix_plugin_', dir=str(self.plugins_dir)))
             
             # Build branch candidates list - prioritize user-specified branch
-            branch_candidates = self._distinct_sequence([branch, 'main', 'master']) if branch else ['main', 'master']
+            branch_candidates = self._branches_to_probe(repo_url, [branch])
             
             # For monorepo installations, download and extract subdirectory
             if plugin_path:
@@ -1420,7 +2297,7 @@ class PluginStoreManager:
                     # Git failed; try downloading as zip
                     branch_used = None
                     for candidate in branch_candidates:
-                        download_url = f"{repo_url}/archive/refs/heads/{candidate}.zip"
+                        download_url = f"{repo_url}/archive/refs/heads/{candidate}.tar.gz"
                         if self._install_via_download(download_url, temp_dir):
                             branch_used = candidate
                             break
@@ -1439,8 +2316,7 @@ class PluginStoreManager:
                     'error': 'No manifest.json found in repository' + (f' at path: {plugin_path}' if plugin_path else '')
                 }
             
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            manifest = _json_loads(manifest_path.read_bytes())
             
             plugin_id = plugin_id or manifest.get('id')
             if not plugin_id:
@@ -1472,8 +2348,7 @@ class PluginStoreManager:
             if 'entry_point' not in manifest:
                 manifest['entry_point'] = 'manager.py'
                 # Write updated manifest back to file
-                with open(manifest_path, 'w') as f:
-                    json.dump(manifest, f, indent=2)
+                self._replace_json_file(manifest_path, manifest)
                 self.logger.info(f"Added missing entry_point field to {plugin_id} manifest (defaulted to manager.py)")
             
             # Move to plugins directory - use manifest ID as source of truth
@@ -1487,7 +2362,7 @@ class PluginStoreManager:
                         'error': f'Failed to remove existing plugin directory: {final_path}'
                     }
             
-            shutil.move(str(temp_dir), str(final_path))
+            self._move_into_place(temp_dir, final_path)
             temp_dir = None  # Prevent cleanup since we moved it
             
             # Note: plugin_id here is already from manifest (line 749), so directory name matches manifest ID
@@ -1534,19 +2409,18 @@ class PluginStoreManager:
             Class name if found, None otherwise
         """
         try:
-            import re
             with open(manager_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Look for class definition that inherits from BasePlugin
-            pattern = r'class\s+(\w+)\s*\([^)]*BasePlugin[^)]*\)'
-            match = re.search(pattern, content)
-            if match:
-                return match.group(1)
-            
-            # Fallback: find first class definition
-            pattern = r'^class\s+(\w+)'
-            match = re.search(pattern, content, re.MULTILINE)
+                # Class definitions sit near the top; only read the rest of
+                # an unusually large file if the head has no BasePlugin class.
+                content = f.read(_CLASS_SCAN_HEAD_CHARS)
+                match = _BASEPLUGIN_CLASS_RE.search(content)
+                if match is None and len(content) == _CLASS_SCAN_HEAD_CHARS:
+                    content += f.read()
+                    match = _BASEPLUGIN_CLASS_RE.search(content)
+
+            # Look for class definition that inherits from BasePlugin,
+            # falling back to the first class definition
+            match = match or _FIRST_CLASS_RE.search(content)
             if match:
                 return match.group(1)
             
@@ -1555,11 +2429,34 @@ class PluginStoreManager:
             self.logger.warning(f"Error detecting class name from {manager_file}: {e}")
             return None
     
+    @staticmethod
+    def _replace_json_file(path: Path, data: Any) -> None:
+        """Write ``data`` as indented JSON to ``path`` in one atomic replace.
+
+        Plugin discovery can read the file at any time, so it must never
+        see a truncated or half-written copy.
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(_json_dumps_indent(data))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _move_into_place(source: Path, destination: Path) -> None:
+        """Move ``source`` to ``destination`` with a single rename.
+
+        Only falls back to ``shutil.move``'s copy-and-delete when the two
+        paths are on different filesystems (e.g. plugins_dir is a mount).
+        """
+        try:
+            os.rename(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source), str(destination))
+
     def _install_via_git(self, repo_url: str, target_path: Path, branches: Optional[List[str]] = None) -> Optional[str]:
         """Clone a repository into ``target_path``. Returns the branch name on success."""
-        branches_to_try = self._distinct_sequence(branches or [])
-        if not branches_to_try:
-            branches_to_try = ['main', 'master']
+        branches_to_try = self._distinct_sequence(branches or []) or list(self._FALLBACK_BRANCHES)
 
         last_error = None
         for try_branch in branches_to_try:
@@ -1600,7 +2497,34 @@ class PluginStoreManager:
         self.logger.error(f"Git clone failed for all attempted branches: {last_error}")
         return None
     
-    def _install_from_monorepo(self, download_url: str, plugin_subpath: str, target_path: Path) -> bool:
+    @staticmethod
+    def _safe_relative_parts(rel_path: str) -> Optional[Tuple[str, ...]]:
+        """Split a tree/archive path into its components, or None if it could escape.
+
+        Rejects absolute paths and empty, '.' or '..' components. This stands
+        in for a per-entry resolve(): the target directory is freshly created
+        and only ever receives regular files and directories, so no symlink
+        inside it can redirect a path that passes this check.
+        """
+        if not rel_path or rel_path.startswith('/'):
+            return None
+        parts = tuple(rel_path.split('/'))
+        if any(part in ('', '.', '..') for part in parts):
+            return None
+        return parts
+
+    @staticmethod
+    def _commit_sha_for_branch(plugin_info: Dict, branch: str) -> Optional[str]:
+        """Return the known tip SHA for ``branch`` from get_plugin_info data.
+
+        Only trusted when the commit lookup resolved that same branch.
+        """
+        if branch and branch == plugin_info.get('last_commit_branch'):
+            return plugin_info.get('last_commit_sha') or None
+        return None
+
+    def _install_from_monorepo(self, download_url: str, plugin_subpath: str, target_path: Path,
+                               commit_sha: Optional[str] = None) -> bool:
         """
         Install a plugin from a monorepo by downloading only the target subdirectory.
 
@@ -1612,6 +2536,8 @@ class PluginStoreManager:
             download_url: URL to download zip from (used as fallback and to extract repo info)
             plugin_subpath: Path within repo (e.g., "plugins/hello-world")
             target_path: Target directory for plugin
+            commit_sha: Optional known tip commit of the branch; lets the API
+                path fetch an immutable, content-addressed tree.
 
         Returns:
             True if successful
@@ -1619,7 +2545,7 @@ class PluginStoreManager:
         # Try the API-based approach first (downloads only the target directory)
         repo_url, branch = self._parse_monorepo_download_url(download_url)
         if repo_url and branch:
-            result = self._install_from_monorepo_api(repo_url, branch, plugin_subpath, target_path)
+            result = self._install_from_monorepo_api(repo_url, branch, plugin_subpath, target_path, commit_sha)
             if result:
                 return True
             self.logger.info(f"API-based install failed for {plugin_subpath}, falling back to ZIP download")
@@ -1631,6 +2557,7 @@ class PluginStoreManager:
         return self._install_from_monorepo_zip(download_url, plugin_subpath, target_path)
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _parse_monorepo_download_url(download_url: str):
         """Extract repo URL and branch from a GitHub archive download URL.
 
@@ -1649,14 +2576,22 @@ class PluginStoreManager:
         return None, None
 
     @staticmethod
-    def _normalize_repo_url(url: str) -> str:
-        """Normalize a GitHub repo URL for comparison (strip trailing / and .git)."""
+    @functools.lru_cache(maxsize=512)
+    def _strip_repo_url(url: str) -> str:
+        """Strip a trailing / and .git suffix from a repo URL."""
         url = url.rstrip('/')
         if url.endswith('.git'):
             url = url[:-4]
-        return url.lower()
+        return url
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _normalize_repo_url(url: str) -> str:
+        """Normalize a GitHub repo URL for comparison (strip trailing / and .git)."""
+        return PluginStoreManager._strip_repo_url(url).lower()
 
-    def _install_from_monorepo_api(self, repo_url: str, branch: str, plugin_subpath: str, target_path: Path) -> bool:
+    def _install_from_monorepo_api(self, repo_url: str, branch: str, plugin_subpath: str, target_path: Path,
+                                   commit_sha: Optional[str] = None) -> bool:
         """
         Install a plugin subdirectory using the GitHub Git Trees API.
 
@@ -1669,22 +2604,28 @@ class PluginStoreManager:
             branch: Branch name (e.g., "main")
             plugin_subpath: Path within repo (e.g., "plugins/hello-world")
             target_path: Target directory for plugin
+            commit_sha: Optional commit SHA of the branch tip. When given, the
+                tree and file downloads are addressed by SHA instead of the
+                moving branch name, so the ETag-cached tree stays valid across
+                reinstalls and every file comes from the same commit.
 
         Returns:
             True if successful, False to trigger ZIP fallback
         """
         try:
-            # Parse owner/repo from URL
-            clean_url = repo_url.rstrip('/')
-            if clean_url.endswith('.git'):
-                clean_url = clean_url[:-4]
-            parts = clean_url.split('/')
-            if len(parts) < 2:
+            try:
+                owner, repo = self._parse_github_url(repo_url)
+            except ValueError:
                 return False
-            owner, repo = parts[-2], parts[-1]
 
-            # Step 1: Get the recursive tree listing (1 API call)
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}?recursive=true"
+            # Step 1: List the plugin directory (1 API call). The "<ref>:<path>"
+            # tree-ish returns only the plugin's subtree, so a large monorepo
+            # doesn't send its whole file list; fall back to the full
+            # recursive listing if that form is rejected.
+            ref = commit_sha or branch
+            subpath = plugin_subpath.strip('/')
+            prefix = f"{subpath}/"
+            trees_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees"
             headers = {
                 'Accept': 'application/vnd.github.v3+json',
                 'User-Agent': 'LEDMatrix-Plugin-Manager/1.0'
@@ -1692,37 +2633,60 @@ class PluginStoreManager:
             if self.github_token:
                 headers['Authorization'] = f'token {self.github_token}'
 
-            tree_response = self._http_get_with_retries(api_url, timeout=15, headers=headers)
-            if tree_response.status_code != 200:
-                self.logger.debug(f"Trees API returned {tree_response.status_code} for {owner}/{repo}")
-                return False
-
-            tree_data = tree_response.json()
-            if tree_data.get('truncated'):
-                self.logger.debug(f"Tree response truncated for {owner}/{repo}, falling back to ZIP")
-                return False
+            # Repeat installs of the same branch tip revalidate the tree
+            # listing with a 304 instead of re-downloading it.
+            subtree_url = f"{trees_url}/{quote(f'{ref}:{subpath}', safe='/')}?recursive=true"
+            tree_response, listing = self._get_json_conditional(
+                subtree_url, headers,
+                lambda tree_data: self._tree_blob_paths(tree_data, prefix, subtree=True),
+                timeout=15,
+            )
+            if listing is not None and not listing[0]:
+                file_paths = listing[1]
+            else:
+                # Step 2: Filter the full listing for files in the target
+                # subdirectory. Only this plugin's paths are cached, so the
+                # cache key includes the prefix.
+                api_url = f"{trees_url}/{ref}?recursive=true"
+                tree_response, listing = self._get_json_conditional(
+                    api_url, headers,
+                    lambda tree_data: self._tree_blob_paths(tree_data, prefix, subtree=False),
+                    timeout=15, cache_key=f"{api_url}#{prefix}",
+                )
+                if listing is None:
+                    self.logger.debug(f"Trees API returned {tree_response.status_code} for {owner}/{repo}")
+                    return False
 
-            # Step 2: Filter for files in the target subdirectory
-            prefix = f"{plugin_subpath.strip('/')}/"
-            file_entries = [
-                entry for entry in tree_data.get('tree', [])
-                if entry['path'].startswith(prefix) and entry['type'] == 'blob'
-            ]
+                if listing[0]:
+                    self.logger.debug(f"Tree response truncated for {owner}/{repo}, falling back to ZIP")
+                    return False
+                file_paths = listing[1]
 
-            if not file_entries:
+            if not file_paths:
                 self.logger.error(f"No files found under '{plugin_subpath}' in tree for {owner}/{repo}")
                 return False
 
             # Sanity check: refuse unreasonably large plugin directories
             max_files = 500
-            if len(file_entries) > max_files:
+            if len(file_paths) > max_files:
                 self.logger.error(
-                    f"Plugin {plugin_subpath} has {len(file_entries)} files (limit {max_files}), "
+                    f"Plugin {plugin_subpath} has {len(file_paths)} files (limit {max_files}), "
                     f"falling back to ZIP"
                 )
                 return False
 
-            self.logger.info(f"Downloading {len(file_entries)} files for {plugin_subpath} via API")
+            # Past a few rounds of concurrent raw downloads, one streamed
+            # tarball of the same commit is fewer round trips. Falls through
+            # to the per-file path if the archive can't be used.
+            if len(file_paths) >= self.MONOREPO_TARBALL_MIN_FILES:
+                archive_url = f"https://github.com/{owner}/{repo}/archive/{ref}.tar.gz"
+                self.logger.info(
+                    f"Streaming {plugin_subpath} ({len(file_paths)} files) from {archive_url}"
+                )
+                if self._install_via_download(archive_url, target_path, subpath):
+                    return True
+
+            self.logger.info(f"Downloading {len(file_paths)} files for {plugin_subpath} via API")
 
             # Step 3: Create target directory and download each file
             from src.common.permission_utils import (
@@ -1733,37 +2697,65 @@ class PluginStoreManager:
             target_path.mkdir(parents=True, exist_ok=True)
 
             prefix_len = len(prefix)
-            target_root = target_path.resolve()
-            for entry in file_entries:
+            made_dirs: Set[Path] = {target_path}
+            downloads = []
+            for path in file_paths:
                 # Relative path within the plugin directory
-                rel_path = entry['path'][prefix_len:]
-                dest_file = target_path / rel_path
+                parts = self._safe_relative_parts(path[prefix_len:])
 
                 # Guard against path traversal
-                if not dest_file.resolve().is_relative_to(target_root):
+                if parts is None:
                     self.logger.error(
-                        f"Path traversal detected: {entry['path']!r} resolves outside target directory"
+                        f"Path traversal detected: {path!r} resolves outside target directory"
                     )
                     if target_path.exists():
                         self._safe_remove_directory(target_path)
                     return False
+                dest_file = target_path.joinpath(*parts)
 
                 # Create parent directories
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
+                if dest_file.parent not in made_dirs:
+                    dest_file.parent.mkdir(parents=True, exist_ok=True)
+                    made_dirs.add(dest_file.parent)
 
                 # Download from raw.githubusercontent.com (no API rate limit cost)
-                raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{entry['path']}"
-                file_response = self._http_get_with_retries(raw_url, timeout=30)
-                if file_response.status_code != 200:
-                    self.logger.error(f"Failed to download {entry['path']}: HTTP {file_response.status_code}")
-                    # Clean up partial download
-                    if target_path.exists():
-                        self._safe_remove_directory(target_path)
-                    return False
-
-                dest_file.write_bytes(file_response.content)
+                raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}"
+                downloads.append((path, raw_url, dest_file))
+
+            # The downloads are network-bound, so fetch them concurrently
+            # over the pooled session. _download_semaphore caps in-flight
+            # requests across overlapping installs as well.
+            max_workers = min(self.MONOREPO_DOWNLOAD_WORKERS, len(downloads))
+            failed = False
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='plugin-download') as executor:
+                futures = {
+                    executor.submit(self._download_raw_file, raw_url, dest_file): path
+                    for path, raw_url, dest_file in downloads
+                }
+                for future in as_completed(futures):
+                    try:
+                        status_code = future.result()
+                    except requests.RequestException as e:
+                        self.logger.error(f"Failed to download {futures[future]}: {e}")
+                        failed = True
+                    else:
+                        if status_code != 200:
+                            self.logger.error(f"Failed to download {futures[future]}: HTTP {status_code}")
+                            failed = True
+                    if failed:
+                        # The install is abandoned: drop the queued downloads
+                        # instead of fetching files that will be deleted.
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+            # Leaving the executor block waits for in-flight downloads, so
+            # nothing is still writing into target_path during cleanup.
+            if failed:
+                # Clean up partial download
+                if target_path.exists():
+                    self._safe_remove_directory(target_path)
+                return False
 
-            self.logger.info(f"Successfully installed {plugin_subpath} via API ({len(file_entries)} files)")
+            self.logger.info(f"Successfully installed {plugin_subpath} via API ({len(file_paths)} files)")
             return True
 
         except Exception as e:
@@ -1773,6 +2765,26 @@ class PluginStoreManager:
                 self._safe_remove_directory(target_path)
             return False
 
+    def _download_raw_file(self, raw_url: str, dest_file: Path) -> int:
+        """Download one raw file to ``dest_file``; return the HTTP status code.
+
+        The body is only written on a 200 response.
+        """
+        with self._download_semaphore:
+            file_response = self._http_get_with_retries(raw_url, timeout=30)
+        if file_response.status_code == 200:
+            # The body is already in memory: write it with raw os.write()
+            # calls rather than through a BufferedWriter. Loop because a
+            # write to a regular file may still be short.
+            data = memoryview(file_response.content)
+            fd = os.open(dest_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+        return file_response.status_code
+
     def _install_from_monorepo_zip(self, download_url: str, plugin_subpath: str, target_path: Path) -> bool:
         """
         Fallback: install a plugin from a monorepo by downloading the full ZIP.
@@ -1780,17 +2792,19 @@ class PluginStoreManager:
         Used when the API-based approach fails (rate limited, auth issues, etc.).
         """
         tmp_zip_path = None
-        temp_extract = None
+        created_target = False
         try:
             self.logger.info(f"Downloading monorepo ZIP from: {download_url}")
             response = self._http_get_with_retries(download_url, timeout=60, stream=True)
             response.raise_for_status()
 
-            # Download to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    tmp_file.write(chunk)
+            # Download to temporary file. copyfileobj moves 1 MiB blocks
+            # from the raw stream (undoing any Content-Encoding) instead of
+            # looping over 8 KiB iter_content chunks in Python.
+            response.raw.decode_content = True
+            with response, tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_file:
                 tmp_zip_path = tmp_file.name
+                shutil.copyfileobj(response.raw, tmp_file, 1 << 20)
 
             with zipfile.ZipFile(tmp_zip_path, 'r') as zip_ref:
                 zip_contents = zip_ref.namelist()
@@ -1798,130 +2812,208 @@ class PluginStoreManager:
                     return False
 
                 root_dir = zip_contents[0].split('/')[0]
-                plugin_prefix = f"{root_dir}/{plugin_subpath}/"
+                plugin_prefix = f"{root_dir}/{plugin_subpath.strip('/')}/"
+                prefix_len = len(plugin_prefix)
 
-                # Extract ONLY files under the plugin subdirectory
-                plugin_members = [m for m in zip_contents if m.startswith(plugin_prefix)]
+                # Only the plugin's own files are read out of the archive;
+                # directories are implied by the file paths.
+                plugin_members = [
+                    info for info in zip_ref.infolist()
+                    if info.filename.startswith(plugin_prefix) and not info.is_dir()
+                ]
 
                 if not plugin_members:
                     self.logger.error(f"Plugin path not found in archive: {plugin_subpath}")
                     return False
 
-                temp_extract = Path(tempfile.mkdtemp())
-                temp_extract_resolved = temp_extract.resolve()
-
-                for member in plugin_members:
-                    # Guard against zip-slip (directory traversal)
-                    member_dest = (temp_extract / member).resolve()
-                    if not member_dest.is_relative_to(temp_extract_resolved):
-                        self.logger.error(
-                            f"Zip-slip detected: member {member!r} resolves outside "
-                            f"temp directory, aborting"
-                        )
-                        shutil.rmtree(temp_extract, ignore_errors=True)
-                        return False
-                    zip_ref.extract(member, temp_extract)
-
-                source_plugin_dir = temp_extract / root_dir / plugin_subpath
-
                 from src.common.permission_utils import (
                     ensure_directory_permissions,
                     get_plugin_dir_mode
                 )
                 ensure_directory_permissions(target_path.parent, get_plugin_dir_mode())
-                # Ensure target doesn't exist to prevent shutil.move nesting
                 if target_path.exists():
                     if not self._safe_remove_directory(target_path):
                         self.logger.error(f"Cannot remove existing target {target_path} for monorepo install")
                         return False
-                shutil.move(str(source_plugin_dir), str(target_path))
+                target_path.mkdir(parents=True)
+                created_target = True
+
+                # Write each member straight to its path under target_path,
+                # with the archive prefix stripped (no temp extract + move).
+                made_dirs: Set[Path] = {target_path}
+                writes = []
+                for info in plugin_members:
+                    parts = self._safe_relative_parts(info.filename[prefix_len:])
+                    # Guard against zip-slip (directory traversal)
+                    if parts is None:
+                        self.logger.error(
+                            f"Zip-slip detected: member {info.filename!r} resolves outside "
+                            f"target directory, aborting"
+                        )
+                        self._safe_remove_directory(target_path)
+                        return False
+                    dest_file = target_path.joinpath(*parts)
+                    if dest_file.parent not in made_dirs:
+                        dest_file.parent.mkdir(parents=True, exist_ok=True)
+                        made_dirs.add(dest_file.parent)
+                    writes.append((info, dest_file))
 
+            self._extract_zip_members(tmp_zip_path, writes)
             return True
 
         except Exception as e:
             self.logger.error(f"Monorepo ZIP download failed: {e}", exc_info=True)
+            if created_target and target_path.exists():
+                self._safe_remove_directory(target_path)
             return False
         finally:
             if tmp_zip_path and os.path.exists(tmp_zip_path):
                 os.remove(tmp_zip_path)
-            if temp_extract and temp_extract.exists():
-                shutil.rmtree(temp_extract, ignore_errors=True)
     
-    def _install_via_download(self, download_url: str, target_path: Path) -> bool:
+    def _extract_zip_members(self, zip_path: str, writes: List[Tuple[zipfile.ZipInfo, Path]]) -> None:
+        """Write each ``(info, dest_file)`` pair out of the ZIP at ``zip_path``.
+
+        zlib releases the GIL while inflating, so plugins with many members
+        are extracted on a few threads. A ZipFile handle can't be shared
+        across threads, so each worker opens its own.
         """
-        Install plugin by downloading and extracting zip archive.
-        
+        def copy(zf: zipfile.ZipFile, info: zipfile.ZipInfo, dest_file: Path) -> None:
+            if info.file_size == 0:
+                # Empty __init__.py and the like: no need to open the member
+                dest_file.touch()
+                return
+            # Small files are copied in a single read/write.
+            with zf.open(info) as src, open(dest_file, 'wb') as dst:
+                shutil.copyfileobj(src, dst, min(info.file_size, 1 << 20))
+
+        workers = min(os.cpu_count() or 1, self.ZIP_EXTRACT_WORKERS)
+        if workers < 2 or len(writes) < self._ZIP_PARALLEL_MIN_MEMBERS:
+            with zipfile.ZipFile(zip_path) as zf:
+                for info, dest_file in writes:
+                    copy(zf, info, dest_file)
+            return
+
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = []
+        handles_lock = threading.Lock()
+
+        def extract(item: Tuple[zipfile.ZipInfo, Path]) -> None:
+            zf = getattr(local, 'zf', None)
+            if zf is None:
+                zf = local.zf = zipfile.ZipFile(zip_path)
+                with handles_lock:
+                    handles.append(zf)
+            copy(zf, *item)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='plugin-unzip') as executor:
+                # Consuming the iterator re-raises the first worker error
+                for _ in executor.map(extract, writes):
+                    pass
+        finally:
+            for zf in handles:
+                zf.close()
+
+    def _install_via_download(self, download_url: str, target_path: Path, subpath: str = '') -> bool:
+        """
+        Install plugin by streaming a .tar.gz archive straight into place.
+
+        The response body is decompressed and extracted member by member, so
+        there is no temporary archive file or temporary extraction directory.
+        GitHub archives wrap everything in a ``<repo>-<branch>/`` directory,
+        which is stripped as each member is written.
+
         Args:
-            download_url: URL to download zip from
-            target_path: Target directory
-            
+            download_url: URL of the .tar.gz archive
+            target_path: Target directory; created if missing, otherwise it
+                must be empty (e.g. install_from_url's staging directory)
+            subpath: Optional directory within the repo (monorepo plugins);
+                only its members are extracted, relative to it.
+
         Returns:
             True if successful
         """
+        created = None  # Set once target_path is ours to extract into
         try:
             self.logger.info(f"Downloading from: {download_url}")
             # Allow redirects (GitHub archive URLs redirect to codeload.github.com)
             response = self._http_get_with_retries(download_url, timeout=60, stream=True, headers={'User-Agent': 'LEDMatrix-Plugin-Manager/1.0'})
-            response.raise_for_status()
-            
-            # Download to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    tmp_file.write(chunk)
-                tmp_zip_path = tmp_file.name
-            
-            try:
-                # Extract zip
-                with zipfile.ZipFile(tmp_zip_path, 'r') as zip_ref:
-                    # GitHub zips have a root directory, we need to extract contents
-                    zip_contents = zip_ref.namelist()
-                    if not zip_contents:
-                        return False
-                    
-                    # Find the root directory in the zip
-                    root_dir = zip_contents[0].split('/')[0]
-                    
-                    # Extract to temp location with zip-slip protection
-                    temp_extract = Path(tempfile.mkdtemp())
-                    temp_extract_resolved = temp_extract.resolve()
-                    for member in zip_ref.namelist():
-                        member_dest = (temp_extract / member).resolve()
-                        if not member_dest.is_relative_to(temp_extract_resolved):
-                            self.logger.error(
-                                f"Zip-slip detected: member {member!r} resolves outside "
-                                f"temp directory, aborting"
-                            )
-                            shutil.rmtree(temp_extract, ignore_errors=True)
-                            return False
-                    zip_ref.extractall(temp_extract)
-                    
-                    # Move contents from root_dir to target
-                    source_dir = temp_extract / root_dir
-                    if source_dir.exists():
-                        from src.common.permission_utils import (
-                            ensure_directory_permissions,
-                            get_plugin_dir_mode
+            if response.status_code != 200:
+                self.logger.debug(f"Archive download returned {response.status_code} for {download_url}")
+                return False
+
+            from src.common.permission_utils import (
+                ensure_directory_permissions,
+                get_plugin_dir_mode
+            )
+            ensure_directory_permissions(target_path.parent, get_plugin_dir_mode())
+            if target_path.exists():
+                if any(target_path.iterdir()):
+                    self.logger.error(f"Refusing to extract into non-empty directory: {target_path}")
+                    return False
+                created = False
+            else:
+                target_path.mkdir(parents=True)
+                created = True
+            extracted = 0
+            member_prefix = f"{subpath.strip('/')}/" if subpath else ''
+
+            response.raw.decode_content = True
+            with response, tarfile.open(fileobj=response.raw, mode='r|gz') as tar:
+                for member in tar:
+                    # Drop the archive's root directory (and the root entry itself)
+                    rel_name = member.name.split('/', 1)[1] if '/' in member.name else ''
+                    if member_prefix:
+                        # Other plugins' members are skipped without being written
+                        if not rel_name.startswith(member_prefix):
+                            continue
+                        rel_name = rel_name[len(member_prefix):]
+                    if not rel_name:
+                        continue
+                    if not (member.isfile() or member.isdir()):
+                        self.logger.debug(f"Skipping non-regular archive member {member.name!r}")
+                        continue
+                    if self._safe_relative_parts(rel_name.rstrip('/')) is None:
+                        self.logger.error(
+                            f"Tar-slip detected: member {member.name!r} resolves outside "
+                            f"target directory, aborting"
                         )
-                        ensure_directory_permissions(target_path.parent, get_plugin_dir_mode())
-                        shutil.move(str(source_dir), str(target_path))
-                    else:
-                        # No root dir, move everything
-                        shutil.move(str(temp_extract), str(target_path))
-                    
-                    # Cleanup temp extract dir
-                    if temp_extract.exists():
-                        shutil.rmtree(temp_extract, ignore_errors=True)
-                
-                return True
-                
-            finally:
-                # Remove temporary zip file
-                if os.path.exists(tmp_zip_path):
-                    os.remove(tmp_zip_path)
-            
+                        self._discard_extraction(target_path, created)
+                        return False
+                    member.name = rel_name
+                    tar.extract(member, target_path, **_TAR_EXTRACT_KWARGS)
+                    extracted += 1
+
+            if not extracted:
+                if member_prefix:
+                    self.logger.error(f"Plugin path not found in archive: {subpath}")
+                else:
+                    self.logger.error(f"Archive from {download_url} was empty")
+                self._discard_extraction(target_path, created)
+                return False
+            return True
+
         except Exception as e:
             self.logger.error(f"Download failed: {e}")
+            if created is not None and target_path.exists():
+                self._discard_extraction(target_path, created)
             return False
+
+    def _discard_extraction(self, target_path: Path, created: bool) -> None:
+        """
+        Undo a failed extraction without deleting a directory we didn't create.
+
+        A directory created by the install is removed outright; a pre-existing
+        one (such as a caller's staging directory) is only emptied again.
+        """
+        if created:
+            self._safe_remove_directory(target_path)
+            return
+        for child in target_path.iterdir():
+            if child.is_dir() and not child.is_symlink():
+                self._safe_remove_directory(child)
+            else:
+                child.unlink(missing_ok=True)
     
     def _install_dependencies(self, plugin_path: Path) -> bool:
         """
@@ -1974,7 +3066,8 @@ class PluginStoreManager:
             # ledmatrix.service, so pip reports success while the package
             # stays invisible to the running plugin (e.g. missing `astral`
             # for the weather plugin even though "install" succeeded).
-            result = install_requirements_file(requirements_file, timeout=300)
+            with self._dependency_install_lock:
+                result = install_requirements_file(requirements_file, timeout=300)
             if result.returncode != 0:
                 self.logger.error(
                     f"Error installing dependencies for {plugin_path.name}: {result.stderr}"
@@ -2003,6 +3096,88 @@ class PluginStoreManager:
             self.logger.error(f"Unexpected error installing dependencies for {plugin_path.name}: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    def _read_head_branch(git_dir: Path) -> str:
+        """Return the branch ``.git/HEAD`` points at, or '' when detached or unreadable."""
+        try:
+            head_text = (git_dir / 'HEAD').read_text(encoding='utf-8', errors='replace').strip()
+        except (OSError, NotADirectoryError):
+            return ''
+        if head_text.startswith('ref: refs/heads/'):
+            return head_text[len('ref: refs/heads/'):]
+        if head_text.startswith('ref: '):
+            return head_text[len('ref: '):]
+        return ''
+
+    @staticmethod
+    def _read_origin_url(git_dir: Path) -> Optional[str]:
+        """Return ``remote.origin.url`` parsed from ``.git/config``, or None."""
+        try:
+            config_text = (git_dir / 'config').read_text(encoding='utf-8', errors='replace')
+        except (OSError, NotADirectoryError):
+            return None
+        in_origin = False
+        for line in config_text.splitlines():
+            stripped = line.strip()
+            if stripped == '[remote "origin"]':
+                in_origin = True
+            elif stripped.startswith('['):
+                in_origin = False
+            elif in_origin and stripped.startswith('url') and '=' in stripped:
+                return stripped.split('=', 1)[1].strip()
+        return None
+
+    @staticmethod
+    def _read_head_sha(plugin_path: Path) -> Optional[str]:
+        """Return the commit HEAD points at, read from ``.git`` without a subprocess.
+
+        Follows a symbolic HEAD to its loose ref file or its
+        ``packed-refs`` line. Returns None when that isn't possible (e.g.
+        ``.git`` is a worktree pointer file); callers fall back to
+        ``_get_local_git_info``.
+        """
+        git_dir = plugin_path / '.git'
+        try:
+            head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+            if not head.startswith('ref: '):
+                return head or None
+            ref = head[len('ref: '):].strip()
+            try:
+                return (git_dir / ref).read_text(encoding='utf-8').strip() or None
+            except FileNotFoundError:
+                pass
+            return PluginStoreManager._packed_ref_sha(git_dir / 'packed-refs', ref)
+        except (OSError, UnicodeDecodeError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _packed_ref_sha(packed_refs: Path, ref: str) -> Optional[str]:
+        """Find ``ref``'s sha in a packed-refs file with one substring search.
+
+        Files of a page or more are mmapped, so only the pages around the
+        match are read rather than the whole file.
+        """
+        needle = f' {ref}\n'.encode('utf-8')
+        with open(packed_refs, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+                data = f.read()
+                return PluginStoreManager._sha_before(data, needle)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return PluginStoreManager._sha_before(data, needle)
+
+    @staticmethod
+    def _sha_before(data, needle: bytes) -> Optional[str]:
+        """Return the sha starting the packed-refs line that ends in ``needle``."""
+        idx = data.find(needle)
+        if idx < 0:
+            # The last line may lack its trailing newline
+            if data[-len(needle) + 1:] != needle[:-1]:
+                return None
+            idx = len(data) - len(needle) + 1
+        line_start = data.rfind(b'\n', 0, idx) + 1
+        return bytes(data[line_start:idx]).decode('ascii') or None
+
     def _git_cache_signature(self, git_dir: Path) -> Optional[Tuple]:
         """Build a cache signature that invalidates on the kind of updates
         a plugin user actually cares about.
@@ -2074,7 +3249,7 @@ class PluginStoreManager:
 
         Results are cached keyed on a signature that includes HEAD
         contents plus the mtime of HEAD AND the resolved ref (or
-        packed-refs). Repeated calls skip the four ``git`` subprocesses
+        packed-refs). Repeated calls skip the ``git log`` subprocess
         when nothing has changed, and a ``git pull`` that fast-forwards
         the branch correctly invalidates the cache.
         """
@@ -2107,39 +3282,15 @@ class PluginStoreManager:
             except (OSError, NotADirectoryError):
                 return None
 
-            # Read branch directly from .git/HEAD (no subprocess).
-            branch = ''
-            try:
-                head_text = (git_dir / 'HEAD').read_text(encoding='utf-8', errors='replace').strip()
-                if head_text.startswith('ref: refs/heads/'):
-                    branch = head_text[len('ref: refs/heads/'):]
-                elif head_text.startswith('ref: '):
-                    branch = head_text[len('ref: '):]
-                # else: detached HEAD — branch stays ''
-            except (OSError, NotADirectoryError):
-                pass
-
-            # Remote URL from .git/config — parse [remote "origin"] url line.
-            remote_url = None
-            try:
-                config_text = (git_dir / 'config').read_text(encoding='utf-8', errors='replace')
-                in_origin = False
-                for line in config_text.splitlines():
-                    stripped = line.strip()
-                    if stripped == '[remote "origin"]':
-                        in_origin = True
-                    elif stripped.startswith('['):
-                        in_origin = False
-                    elif in_origin and stripped.startswith('url') and '=' in stripped:
-                        remote_url = stripped.split('=', 1)[1].strip()
-                        break
-            except (OSError, NotADirectoryError):
-                pass
+            # Branch and remote URL straight from .git (no subprocess).
+            branch = self._read_head_branch(git_dir)
+            remote_url = self._read_origin_url(git_dir)
 
             # Single subprocess: SHA + commit date in one call.
             log_result = subprocess.run(
                 ['git', '-C', str(plugin_path), 'log', '-1', '--format=%H%n%cI', 'HEAD'],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 timeout=10,
                 check=True
@@ -2171,14 +3322,119 @@ class PluginStoreManager:
 
         return None
     
+    def _collect_git_state(self, plugin_path: Path) -> Optional[_GitState]:
+        """Read branch, upstream, tracked changes and untracked files in one ``git status``.
+
+        Returns None if git reports an error. ``subprocess.TimeoutExpired``
+        propagates so the caller can decide how to treat a hung status.
+        """
+        result = subprocess.run(
+            ['git', '-C', str(plugin_path), 'status', '--porcelain=v2', '--branch', '--untracked-files=all'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=30,
+            check=False
+        )
+        if result.returncode != 0:
+            return None
+        state = _GitState(branch=None, upstream=None)
+        for line in result.stdout.splitlines():
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                state.branch = None if head == '(detached)' else head
+            elif line.startswith('# branch.upstream '):
+                state.upstream = line[len('# branch.upstream '):]
+            elif line.startswith('? '):
+                state.untracked.append(line[2:])
+            elif line[:2] in ('1 ', '2 ', 'u '):
+                state.has_tracked_changes = True
+        return state
+
+    def _ls_remote_heads(self, plugin_path: Path, branches: List[Optional[str]]) -> Tuple[Set[str], Optional[str]]:
+        """Ask origin which of ``branches`` exist, and for its default branch, in one round trip.
+
+        Returns ``(existing_branch_names, default_branch)``. If the remote
+        can't be reached, the default falls back to the locally recorded
+        ``refs/remotes/origin/HEAD`` and no branches are reported.
+        """
+        patterns = [f'refs/heads/{b}' for b in self._distinct_sequence(branches)]
+        result = subprocess.run(
+            ['git', '-C', str(plugin_path), 'ls-remote', '--symref', 'origin', 'HEAD', *patterns],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=10,
+            check=False,
+            env=_git_network_env()
+        )
+        heads: Set[str] = set()
+        default_branch = None
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                left, _, ref = line.partition('\t')
+                if left.startswith('ref: refs/heads/') and ref == 'HEAD':
+                    default_branch = left[len('ref: refs/heads/'):]
+                elif ref.startswith('refs/heads/'):
+                    heads.add(ref[len('refs/heads/'):])
+            return heads, default_branch
+
+        default_branch_result = subprocess.run(
+            ['git', '-C', str(plugin_path), 'symbolic-ref', 'refs/remotes/origin/HEAD'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=10,
+            check=False
+        )
+        if default_branch_result.returncode == 0:
+            default_ref = default_branch_result.stdout.strip()
+            if default_ref.startswith('refs/remotes/origin/'):
+                default_branch = default_ref[len('refs/remotes/origin/'):]
+        return heads, default_branch
+
+    def _read_plugin_metadata(self, plugin_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the plugin's parsed ``.plugin_metadata.json``, or None.
+
+        Memoized on the file's mtime and size, so repeat update checks cost
+        one stat() instead of an open and parse.
+        """
+        metadata_path = plugin_path / ".plugin_metadata.json"
+        try:
+            return self._read_json_cached(metadata_path, self._plugin_metadata_cache, str(plugin_path))
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"[PluginStore] Could not read metadata at {metadata_path}: {e}")
+            return None
+
+    @staticmethod
+    def _read_json_cached(path: Path, cache: Dict, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Parse a JSON object file, memoized in ``cache`` on its mtime and size.
+
+        Returns None if the file is missing or isn't a JSON object; other
+        read and parse errors propagate.
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        data = _json_loads(path.read_bytes())
+        if not isinstance(data, dict):
+            return None
+        cache[cache_key] = (signature, data)
+        return data
+
     def _safe_remove_directory(self, path: Path) -> bool:
         """
         Safely remove a directory, handling permission errors for root-owned files.
 
-        Attempts removal in three stages:
-        1. Normal shutil.rmtree()
-        2. Fix permissions via os.chmod() then retry (works for same-owner files)
-        3. Use sudo rm -rf as last resort (works for root-owned __pycache__, etc.)
+        Attempts removal in two stages:
+        1. shutil.rmtree(), fixing permissions via os.chmod() on just the
+           entries that fail and retrying them (works for same-owner files)
+        2. Use sudo rm -rf as last resort (works for root-owned __pycache__, etc.)
 
         Args:
             path: Path to directory to remove
@@ -2189,33 +3445,30 @@ class PluginStoreManager:
         if not path.exists():
             return True  # Already removed
 
-        # Stage 1: Try normal removal
-        try:
-            shutil.rmtree(path)
-            return True
-        except OSError:
-            self.logger.warning(f"Permission error removing {path}, attempting chmod fix...")
-
-        # Stage 2: Try chmod + retry (works when we own the files)
-        try:
-            for root, _dirs, files in os.walk(path):
-                root_path = Path(root)
+        def _chmod_and_retry(func, failed_path, _exc):
+            if not os.path.lexists(failed_path):
+                return
+            # Unlink/rmdir need write access on the parent; listing needs
+            # read access on the directory itself.
+            for fix_path in (os.path.dirname(failed_path), failed_path):
                 try:
-                    os.chmod(root_path, stat.S_IRWXU)
-                except (OSError, PermissionError):
+                    os.chmod(fix_path, stat.S_IRWXU)
+                except OSError:
                     pass
-                for file in files:
-                    try:
-                        os.chmod(root_path / file, stat.S_IRWXU)
-                    except (OSError, PermissionError):
-                        pass
-            shutil.rmtree(path)
-            self.logger.info(f"Removed {path} after fixing permissions")
+            if func in (os.open, os.scandir):
+                # A directory that could not be listed: remove its subtree now.
+                shutil.rmtree(failed_path, **{_RMTREE_HANDLER_KWARG: _chmod_and_retry})
+            elif func is not os.close:
+                func(failed_path)
+
+        # Stage 1: Normal removal, chmod-fixing only the entries that fail
+        try:
+            shutil.rmtree(path, **{_RMTREE_HANDLER_KWARG: _chmod_and_retry})
             return True
-        except (PermissionError, OSError):
-            self.logger.warning(f"chmod fix failed for {path}, attempting sudo removal...")
+        except OSError:
+            self.logger.warning(f"Permission error removing {path}, attempting sudo removal...")
 
-        # Stage 3: Use sudo rm -rf (for root-owned __pycache__, data/.cache, etc.)
+        # Stage 2: Use sudo rm -rf (for root-owned __pycache__, data/.cache, etc.)
         if sudo_remove_directory(path):
             return True
 
@@ -2312,13 +3565,11 @@ class PluginStoreManager:
             return False
 
         subpath = skin_info.get('plugin_path')
-        branch_candidates = self._distinct_sequence([
+        branch_candidates = self._branches_to_probe(repo_url, [
             branch,
             skin_info.get('branch'),
             skin_info.get('default_branch'),
             skin_info.get('last_commit_branch'),
-            'main',
-            'master'
         ])
 
         try:
@@ -2326,14 +3577,15 @@ class PluginStoreManager:
             if subpath:
                 for candidate in branch_candidates:
                     download_url = f"{repo_url}/archive/refs/heads/{candidate}.zip"
-                    if self._install_from_monorepo(download_url, subpath, staging):
+                    commit_sha = self._commit_sha_for_branch(skin_info, candidate)
+                    if self._install_from_monorepo(download_url, subpath, staging, commit_sha):
                         branch_used = candidate
                         break
             else:
                 branch_used = self._install_via_git(repo_url, staging, branch_candidates)
                 if branch_used is None and not staging.exists():
                     for candidate in branch_candidates:
-                        download_url = f"{repo_url}/archive/refs/heads/{candidate}.zip"
+                        download_url = f"{repo_url}/archive/refs/heads/{candidate}.tar.gz"
                         if self._install_via_download(download_url, staging):
                             branch_used = candidate
                             break
@@ -2380,7 +3632,7 @@ class PluginStoreManager:
             if target.exists() and not self._safe_remove_directory(target):
                 self.logger.error(f"Could not replace existing skin directory: {target}")
                 return False
-            shutil.move(str(staging), str(target))
+            self._move_into_place(staging, target)
             skin_runtime.discover_skins(force_refresh=True)
             self.logger.info(f"Successfully installed skin: {skin_id} (branch: {branch_used})")
             return True
@@ -2507,6 +3759,18 @@ class PluginStoreManager:
                     f"The previous install is preserved there — rename it back manually.")
             return False
 
+    def _refresh_registry_for_update(self) -> Dict:
+        """Refresh the registry for an update check unless it was fetched very recently.
+
+        "Update all" calls update_plugin once per plugin; without this every
+        call would revalidate plugins.json over the network. Per-plugin
+        commit info is still fetched fresh by the caller.
+        """
+        if (self.registry_cache and self.registry_cache_time and
+                time.monotonic() - self.registry_cache_time < self.UPDATE_REGISTRY_MAX_AGE):
+            return self.registry_cache
+        return self.fetch_registry(force_refresh=True)
+
     def update_plugin(self, plugin_id: str) -> bool:
         """
         Update a plugin to the latest commit on its upstream branch.
@@ -2522,16 +3786,10 @@ class PluginStoreManager:
 
             # Check if this is a bundled/unmanaged plugin (no registry entry, no git remote)
             # These are plugins shipped with LEDMatrix itself and updated via LEDMatrix updates.
-            metadata_path = plugin_path / ".plugin_metadata.json"
-            if metadata_path.exists():
-                try:
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    if metadata.get('install_type') == 'bundled':
-                        self.logger.info(f"Plugin {plugin_id} is a bundled plugin; updates are delivered via LEDMatrix itself")
-                        return True
-                except (OSError, ValueError) as e:
-                    self.logger.debug(f"[PluginStore] Could not read metadata for {plugin_id} at {metadata_path}: {e}")
+            metadata = self._read_plugin_metadata(plugin_path)
+            if metadata and metadata.get('install_type') == 'bundled':
+                self.logger.info(f"Plugin {plugin_id} is a bundled plugin; updates are delivered via LEDMatrix itself")
+                return True
 
             # First check if it's a git repository - if so, we can update directly
             git_info = self._get_local_git_info(plugin_path)
@@ -2540,9 +3798,10 @@ class PluginStoreManager:
                 # Plugin is a git repository - try to update via git
                 local_branch = git_info.get('branch') or 'main'
                 local_sha = git_info.get('sha')
+                git_cmd = ('git', '-C', str(plugin_path))
 
                 # Try to get remote info from registry (optional)
-                self.fetch_registry(force_refresh=True)
+                self._refresh_registry_for_update()
                 plugin_info_remote = self.get_plugin_info(plugin_id, fetch_latest_from_github=True, force_refresh=True)
                 # Try without 'ledmatrix-' prefix (monorepo migration)
                 resolved_id = plugin_id
@@ -2576,39 +3835,39 @@ class PluginStoreManager:
                         self.logger.info(f"Plugin {plugin_id} already matches remote commit {remote_sha[:7]}")
                         return True
 
-                # Update via git pull
-                self.logger.info(f"Updating {plugin_id} via git pull (local branch: {local_branch})...")
+                # Update via git fetch + fast-forward
+                self.logger.info(f"Updating {plugin_id} via git (local branch: {local_branch})...")
                 try:
-                    # Fetch latest changes first to get all remote branch info
-                    # If fetch fails, we'll still try to pull (might work with existing remote refs)
-                    fetch_result = subprocess.run(
-                        ['git', '-C', str(plugin_path), 'fetch', 'origin'],
-                        capture_output=True,
-                        text=True,
-                        timeout=60,
-                        check=False
-                    )
-                    if fetch_result.returncode != 0:
-                        self.logger.warning(f"Git fetch failed for {plugin_id}: {fetch_result.stderr or fetch_result.stdout}. Will still attempt pull.")
-                    else:
-                        self.logger.debug(f"Successfully fetched remote changes for {plugin_id}")
+                    # One status call reports the checked-out branch, what it
+                    # tracks, tracked changes and untracked files.
+                    try:
+                        git_state = self._collect_git_state(plugin_path)
+                        status_timed_out = False
+                    except subprocess.TimeoutExpired:
+                        git_state = None
+                        status_timed_out = True
 
                     # Determine which remote branch to pull from
                     # Strategy: Use what the local branch is tracking, or find the best match
                     remote_pull_branch = None
                     
                     # First, check what the local branch is tracking
-                    tracking_result = subprocess.run(
-                        ['git', '-C', str(plugin_path), 'rev-parse', '--abbrev-ref', '--symbolic-full-name', f'{local_branch}@{{upstream}}'],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                        check=False
-                    )
+                    if git_state is not None and git_state.branch == local_branch:
+                        tracking_ref = git_state.upstream or ''
+                    else:
+                        # HEAD is not on local_branch (e.g. detached); ask for its upstream directly
+                        tracking_result = subprocess.run(
+                            [*git_cmd, 'rev-parse', '--abbrev-ref', '--symbolic-full-name', f'{local_branch}@{{upstream}}'],
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL,
+                            text=True,
+                            timeout=10,
+                            check=False
+                        )
+                        tracking_ref = tracking_result.stdout.strip() if tracking_result.returncode == 0 else ''
                     
-                    if tracking_result.returncode == 0 and tracking_result.stdout.strip():
+                    if tracking_ref:
                         # Local branch is tracking a remote branch
-                        tracking_ref = tracking_result.stdout.strip()
                         # Extract branch name from refs/remotes/origin/branch-name or origin/branch-name
                         if tracking_ref.startswith('refs/remotes/origin/'):
                             remote_pull_branch = tracking_ref.replace('refs/remotes/origin/', '')
@@ -2617,48 +3876,22 @@ class PluginStoreManager:
                             remote_pull_branch = tracking_ref.replace('origin/', '')
                             self.logger.info(f"Local branch {local_branch} is tracking origin/{remote_pull_branch}")
                     
-                    # If not tracking anything, try to find the best remote branch match
+                    # If not tracking anything, try to find the best remote branch match:
+                    # the registry branch, then the local branch name, then the
+                    # remote's default branch. One ls-remote answers all three.
                     if not remote_pull_branch:
-                        # Check if remote branch from registry exists
-                        if remote_branch:
-                            remote_check = subprocess.run(
-                                ['git', '-C', str(plugin_path), 'ls-remote', '--heads', 'origin', remote_branch],
-                                capture_output=True,
-                                text=True,
-                                timeout=10,
-                                check=False
-                            )
-                            if remote_check.returncode == 0 and remote_check.stdout.strip():
-                                remote_pull_branch = remote_branch
-                                self.logger.info(f"Using remote branch {remote_branch} from registry")
-                        
-                        # If registry branch doesn't exist, check if local branch name exists on remote
-                        if not remote_pull_branch:
-                            local_as_remote_check = subprocess.run(
-                                ['git', '-C', str(plugin_path), 'ls-remote', '--heads', 'origin', local_branch],
-                                capture_output=True,
-                                text=True,
-                                timeout=10,
-                                check=False
-                            )
-                            if local_as_remote_check.returncode == 0 and local_as_remote_check.stdout.strip():
-                                remote_pull_branch = local_branch
-                                self.logger.info(f"Using local branch name {local_branch} as remote branch")
-                        
-                        # Last resort: try to get remote's default branch
-                        if not remote_pull_branch:
-                            default_branch_result = subprocess.run(
-                                ['git', '-C', str(plugin_path), 'symbolic-ref', 'refs/remotes/origin/HEAD'],
-                                capture_output=True,
-                                text=True,
-                                timeout=10,
-                                check=False
-                            )
-                            if default_branch_result.returncode == 0:
-                                default_ref = default_branch_result.stdout.strip()
-                                if default_ref.startswith('refs/remotes/origin/'):
-                                    remote_pull_branch = default_ref.replace('refs/remotes/origin/', '')
-                                    self.logger.info(f"Using remote default branch {remote_pull_branch}")
+                        remote_heads, remote_default = self._ls_remote_heads(
+                            plugin_path, [remote_branch, local_branch]
+                        )
+                        if remote_branch and remote_branch in remote_heads:
+                            remote_pull_branch = remote_branch
+                            self.logger.info(f"Using remote branch {remote_branch} from registry")
+                        elif local_branch in remote_heads:
+                            remote_pull_branch = local_branch
+                            self.logger.info(f"Using local branch name {local_branch} as remote branch")
+                        elif remote_default:
+                            remote_pull_branch = remote_default
+                            self.logger.info(f"Using remote default branch {remote_pull_branch}")
                     
                     # If we still don't have a remote branch, use local branch name (git will handle it)
                     if not remote_pull_branch:
@@ -2667,7 +3900,7 @@ class PluginStoreManager:
                     
                     # Ensure we're on the local branch
                     checkout_result = subprocess.run(
-                        ['git', '-C', str(plugin_path), 'checkout', local_branch],
+                        [*git_cmd, 'checkout', local_branch],
                         capture_output=True,
                         text=True,
                         timeout=30,
@@ -2677,43 +3910,18 @@ class PluginStoreManager:
                         self.logger.warning(f"Git checkout to {local_branch} failed for {plugin_id}: {checkout_result.stderr or checkout_result.stdout}. Will still attempt pull.")
 
                     # Check for local changes and untracked files that might conflict
-                    # First, check for untracked files that would be overwritten
-                    try:
-                        # Check for untracked files
-                        untracked_result = subprocess.run(
-                            ['git', '-C', str(plugin_path), 'status', '--porcelain', '--untracked-files=all'],
-                            capture_output=True,
-                            text=True,
-                            timeout=30,
-                            check=False
-                        )
-                        untracked_files = []
-                        if untracked_result.returncode == 0:
-                            for line in untracked_result.stdout.strip().split('\n'):
-                                if line.startswith('??'):
-                                    # Untracked file
-                                    file_path = line[3:].strip()
-                                    untracked_files.append(file_path)
-                        
-                        # Check for tracked file changes
-                        status_result = subprocess.run(
-                            ['git', '-C', str(plugin_path), 'status', '--porcelain', '--untracked-files=no'],
-                            capture_output=True,
-                            text=True,
-                            timeout=30,
-                            check=False
-                        )
-                        has_changes = bool(status_result.stdout.strip())
-                        
-                        # If there are untracked files, stash them
-                        if untracked_files:
-                            self.logger.info(f"Found {len(untracked_files)} untracked files in {plugin_id}, will stash them")
-                            has_changes = True
-                    except subprocess.TimeoutExpired:
+                    if status_timed_out:
                         # If status check times out, assume there might be changes and proceed
                         self.logger.warning(f"Git status check timed out for {plugin_id}, proceeding with update")
                         has_changes = True
-                        status_result = type('obj', (object,), {'stdout': '', 'stderr': 'Status check timed out'})()
+                    elif git_state is None:
+                        has_changes = False
+                    else:
+                        has_changes = git_state.has_tracked_changes
+                        # If there are untracked files, stash them
+                        if git_state.untracked:
+                            self.logger.info(f"Found {len(git_state.untracked)} untracked files in {plugin_id}, will stash them")
+                            has_changes = True
                     
                     stash_info = ""
                     if has_changes:
@@ -2721,7 +3929,7 @@ class PluginStoreManager:
                         try:
                             # Use -u to include untracked files in stash
                             stash_result = subprocess.run(
-                                ['git', '-C', str(plugin_path), 'stash', 'push', '-u', '-m', f'LEDMatrix auto-stash before update {plugin_id}'],
+                                [*git_cmd, 'stash', 'push', '-u', '-m', f'LEDMatrix auto-stash before update {plugin_id}'],
                                 capture_output=True,
                                 text=True,
                                 timeout=30,
@@ -2735,13 +3943,24 @@ class PluginStoreManager:
                         except subprocess.TimeoutExpired:
                             self.logger.warning(f"Stash operation timed out for {plugin_id}, proceeding with pull")
 
-                    # Pull from the determined remote branch
-                    self.logger.info(f"Pulling from origin/{remote_pull_branch} for {plugin_id}...")
-                    pull_result = subprocess.run(
-                        ['git', '-C', str(plugin_path), 'pull', 'origin', remote_pull_branch],
+                    # Fetch just the determined remote branch (one network round
+                    # trip) and fast-forward onto it. Unlike `git pull` this
+                    # never creates a merge commit, and there is no second
+                    # fetch inside the pull.
+                    self.logger.info(f"Fetching origin/{remote_pull_branch} for {plugin_id}...")
+                    subprocess.run(
+                        [*git_cmd, 'fetch', '--no-tags', 'origin', remote_pull_branch],
                         capture_output=True,
                         text=True,
                         timeout=120,
+                        check=True,
+                        env=_git_network_env()
+                    )
+                    pull_result = subprocess.run(
+                        [*git_cmd, 'merge', '--ff-only', 'FETCH_HEAD'],
+                        capture_output=True,
+                        text=True,
+                        timeout=60,
                         check=True
                     )
 
@@ -2750,8 +3969,11 @@ class PluginStoreManager:
                         pull_message += stash_info
                     self.logger.info(pull_message)
 
-                    updated_git_info = self._get_local_git_info(plugin_path) or {}
-                    updated_sha = updated_git_info.get('sha', '')
+                    # Read the new HEAD straight from .git rather than spawning
+                    # `git log` just for a log line.
+                    updated_sha = self._read_head_sha(plugin_path)
+                    if updated_sha is None:
+                        updated_sha = (self._get_local_git_info(plugin_path) or {}).get('sha', '')
                     if remote_sha and updated_sha and remote_sha.startswith(updated_sha):
                         self.logger.info(f"Plugin {plugin_id} now at remote commit {remote_sha[:7]}{stash_info}")
                     elif updated_sha:
@@ -2769,45 +3991,29 @@ class PluginStoreManager:
                     self.logger.error(f"Error output: {error_output}")
                     
                     # Check for specific error conditions
-                    error_lower = error_output.lower()
-                    if "would be overwritten" in error_output or "local changes" in error_lower:
-                        self.logger.warning(f"Plugin {plugin_id} has local changes that prevent update. Consider committing or stashing changes manually.")
-                    elif "refusing to merge unrelated histories" in error_lower:
-                        self.logger.error(f"Plugin {plugin_id} has unrelated git histories. Plugin may need to be reinstalled.")
-                    elif "authentication" in error_lower or "permission denied" in error_lower:
-                        self.logger.error(f"Authentication failed for {plugin_id}. Check git credentials or repository permissions.")
-                    elif "not found" in error_lower or "does not exist" in error_lower:
-                        self.logger.error(f"Remote branch or repository not found for {plugin_id}. Check repository URL and branch name.")
-                    elif "merge conflict" in error_lower or "conflict" in error_lower:
-                        self.logger.error(f"Merge conflict detected for {plugin_id}. Resolve conflicts manually or reinstall plugin.")
+                    matched = {m.lastgroup for m in _GIT_ERROR_RE.finditer(error_output)}
+                    for kind, level, hint in _GIT_ERROR_HINTS:
+                        if kind in matched:
+                            self.logger.log(level, hint.format(plugin_id))
+                            break
                     
                     return False
                 except subprocess.TimeoutExpired:
                     self.logger.warning(f"Git update timed out for {plugin_id}")
                     return False
             
-            # Not a git repository - try to get repo URL from git config if it exists
-            # (in case .git directory was removed but remote URL is still in config)
-            repo_url = None
-            try:
-                # Use --local to avoid inheriting the parent LEDMatrix repo's git config
-                # when the plugin directory lives inside the main repo (e.g. plugin-repos/).
-                remote_url_result = subprocess.run(
-                    ['git', '-C', str(plugin_path), 'config', '--local', '--get', 'remote.origin.url'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    check=False
-                )
-                if remote_url_result.returncode == 0:
-                    repo_url = remote_url_result.stdout.strip()
-                    self.logger.info(f"Found git remote URL for {plugin_id}: {repo_url}")
-            except Exception as e:
-                self.logger.debug(f"Could not get git remote URL: {e}")
+            # Not a usable git checkout - try to get repo URL from git config if it exists
+            # (e.g. `git log` failed on a broken checkout but .git/config is intact).
+            # Read the plugin's own .git directly, never a parent LEDMatrix repo's
+            # config when the plugin directory lives inside the main repo.
+            plugin_git_dir = plugin_path / '.git'
+            repo_url = self._read_origin_url(plugin_git_dir) if plugin_git_dir.is_dir() else None
+            if repo_url:
+                self.logger.info(f"Found git remote URL for {plugin_id}: {repo_url}")
             
             # Try registry-based update
             self.logger.info(f"Plugin {plugin_id} is not a git repository, checking registry...")
-            self.fetch_registry(force_refresh=True)
+            self._refresh_registry_for_update()
             plugin_info_remote = self.get_plugin_info(plugin_id, fetch_latest_from_github=True, force_refresh=True)
 
             # If not found, try without 'ledmatrix-' prefix (monorepo migration)
@@ -2824,16 +4030,7 @@ class PluginStoreManager:
                 self.logger.info(f"Plugin {plugin_id} not in registry but has git remote URL. Reinstalling from {repo_url} to enable updates...")
                 try:
                     # Get current branch if possible
-                    branch_result = subprocess.run(
-                        ['git', '-C', str(plugin_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                        check=False
-                    )
-                    branch = branch_result.stdout.strip() if branch_result.returncode == 0 else None
-                    if branch == 'HEAD' or not branch:
-                        branch = 'main'
+                    branch = self._read_head_branch(plugin_git_dir) or 'main'
                     
                     # Reinstall from URL
                     result = self.install_from_url(repo_url, plugin_id=plugin_id, branch=branch)
@@ -2860,8 +4057,7 @@ class PluginStoreManager:
             try:
                 local_manifest_path = plugin_path / "manifest.json"
                 if local_manifest_path.exists():
-                    with open(local_manifest_path, 'r', encoding='utf-8') as f:
-                        local_manifest = json.load(f)
+                    local_manifest = _json_loads(local_manifest_path.read_bytes())
                     local_version = local_manifest.get('version', '')
                     remote_version = plugin_info_remote.get('latest_version', '')
                     if local_version and remote_version and local_version == remote_version:
@@ -2880,9 +4076,9 @@ class PluginStoreManager:
             return self._reinstall_with_rollback(registry_id, plugin_path)
 
         except Exception as e:
-            import traceback
             self.logger.error(f"Error updating plugin {plugin_id}: {e}")
-            self.logger.debug(traceback.format_exc())
+            # exc_info defers formatting the traceback until a debug record is emitted
+            self.logger.debug(f"Traceback for failed update of {plugin_id}", exc_info=True)
             return False
     
     def list_installed_plugins(self) -> List[str]:
@@ -2892,13 +4088,21 @@ class PluginStoreManager:
         Returns:
             List of plugin IDs
         """
-        if not self.plugins_dir.exists():
-            return []
-        
         installed = []
-        for item in self.plugins_dir.iterdir():
-            if item.is_dir() and (item / "manifest.json").exists():
-                installed.append(item.name)
+        try:
+            entries = os.scandir(self.plugins_dir)
+        except OSError:
+            return []
+        with entries:
+            for entry in entries:
+                # Hidden directories are in-progress installs and the metadata cache
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
+                try:
+                    os.stat(os.path.join(entry.path, "manifest.json"))
+                except OSError:
+                    continue
+                installed.append(entry.name)
         
         return installed
     
@@ -2914,12 +4118,8 @@ class PluginStoreManager:
         """
         manifest_path = self.plugins_dir / plugin_id / "manifest.json"
         
-        if not manifest_path.exists():
-            return None
-        
         try:
-            with open(manifest_path, 'r') as f:
-                return json.load(f)
+            return self._read_json_cached(manifest_path, self._installed_manifest_cache, plugin_id)
         except Exception as e:
             self.logger.error(f"Error reading manifest for {plugin_id}: {e}")
             return None
@@ -12,27 +12,56 @@ MagicMock (which tracks nothing visual), this class creates a real
 PIL Image canvas and draws text using the actual project fonts.
 """
 
+import base64
+import io
 import math
 import os
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from src.logging_config import get_logger
 
+try:
+    import freetype
+except ImportError:
+    freetype = None
+
 logger = get_logger(__name__)
 
+# isinstance() target for BDF faces; matches nothing without freetype
+_FREETYPE_FACE_TYPE = (freetype.Face,) if freetype is not None else ()
+# FT_PIXEL_MODE_GRAY: one byte of coverage per pixel
+_FT_PIXEL_MODE_GRAY = 2
+
+# Unit (cos, sin) directions for sun rays and snowflake spokes
+_SUN_DIRS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 45))
+_SNOW_DIRS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 60))
+
 
 class _MatrixProxy:
     """Lightweight proxy so plugins can access display_manager.matrix.width/height."""
 
+    __slots__ = ('width', 'height')
+
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
 
 
+class _BdfGlyph(NamedTuple):
+    """A rendered BDF glyph, copied out of the face's reusable glyph slot."""
+
+    advance: int
+    left: int
+    top: int
+    tile: Image.Image  # 'L' mask, 255 where the glyph is lit
+
+
 class VisualTestDisplayManager:
     """
     Display manager that renders real pixels for testing and development.
@@ -51,31 +80,57 @@ class VisualTestDisplayManager:
         'storm': (255, 255, 0),
     }
 
-    def __init__(self, width: int = 128, height: int = 32):
+    # Upper bounds on the glyph, text width and weather icon caches; the
+    # oldest entries are dropped first.
+    BDF_GLYPH_CACHE_SIZE = 4096
+    TEXT_WIDTH_CACHE_SIZE = 1024
+    ICON_CACHE_SIZE = 64
+
+    # Project root and parsed TTF fonts, shared by every instance. BDF faces
+    # stay per instance: freetype.Face calls drop the GIL and the face's glyph
+    # slot is mutable, so sharing one across threads is unsafe.
+    _project_root: Optional[Path] = None
+    _ttf_cache: dict = {}
+
+    def __init__(self, width: int = 128, height: int = 32,
+                 track_calls: bool = True, max_draw_calls: int = 1000):
         self._width = width
         self._height = height
 
-        # Canvas
-        self.image = Image.new('RGB', (width, height), (0, 0, 0))
+        # Canvas (_canvas is the image this manager allocated, which
+        # _blank_canvas may wipe in place; plugins can swap self.image out)
+        self.image = self._canvas = Image.new('RGB', (width, height), (0, 0, 0))
         self.draw = ImageDraw.Draw(self.image)
 
         # Matrix proxy (plugins access display_manager.matrix.width/height)
         self.matrix = _MatrixProxy(width, height)
 
         # Scrolling state (interface compat, no-op)
-        self._scrolling_state = {
-            'is_scrolling': False,
-            'last_scroll_activity': 0,
-            'scroll_inactivity_threshold': 2.0,
-            'deferred_updates': [],
-            'max_deferred_updates': 50,
-            'deferred_update_ttl': 300.0,
-        }
-
-        # Call tracking (preserves MockDisplayManager capabilities)
+        self._is_scrolling = False
+        self._last_scroll_activity = 0.0
+
+        # Call tracking (preserves MockDisplayManager capabilities). Only the
+        # most recent max_draw_calls draws are kept; render loops that never
+        # inspect them pass track_calls=False.
         self.clear_called = False
         self.update_called = False
-        self.draw_calls = []
+        self._track_calls = track_calls
+        self.draw_calls = deque(maxlen=max_draw_calls)
+
+        # Rendered BDF glyphs keyed by (face, char), and ascenders by face
+        self._bdf_glyph_cache = {}
+        self._bdf_ascender_cache = {}
+
+        # Measured text widths keyed by (font, text), and heights by font
+        self._width_cache = {}
+        self._height_cache = {}
+
+        # Weather icon sprites keyed by (kind, size, color)
+        self._icon_cache = {}
+
+        # Last PNG encoding of the canvas and the pixel state it encodes
+        self._png_key = None
+        self._png_cache = b''
 
         # Load fonts
         self._load_fonts()
@@ -104,14 +159,26 @@ class VisualTestDisplayManager:
     # Font loading
     # ------------------------------------------------------------------
 
-    def _find_project_root(self) -> Optional[Path]:
+    @classmethod
+    def _find_project_root(cls) -> Optional[Path]:
         """Walk up from this file to find the project root (contains assets/fonts)."""
-        current = Path(__file__).resolve().parent
-        for _ in range(10):
-            if (current / 'assets' / 'fonts').exists():
-                return current
-            current = current.parent
-        return None
+        if cls._project_root is None:
+            current = Path(__file__).resolve().parent
+            for _ in range(10):
+                if (current / 'assets' / 'fonts').exists():
+                    cls._project_root = current
+                    break
+                current = current.parent
+        return cls._project_root
+
+    @classmethod
+    def _truetype(cls, path: str, size: int) -> ImageFont.FreeTypeFont:
+        """Load a TTF font once per (path, size) and share it across instances."""
+        key = (path, size)
+        font = cls._ttf_cache.get(key)
+        if font is None:
+            font = cls._ttf_cache[key] = ImageFont.truetype(path, size)
+        return font
 
     def _load_fonts(self):
         """Load fonts with graceful fallback, matching DisplayManager._load_fonts()."""
@@ -125,13 +192,14 @@ class VisualTestDisplayManager:
 
             # Press Start 2P — regular and small (both 8px)
             ttf_path = str(fonts_dir / 'PressStart2P-Regular.ttf')
-            self.regular_font = ImageFont.truetype(ttf_path, 8)
-            self.small_font = ImageFont.truetype(ttf_path, 8)
+            self.regular_font = self._truetype(ttf_path, 8)
+            self.small_font = self._truetype(ttf_path, 8)
             self.font = self.regular_font  # alias used by some code paths
 
             # 5x7 BDF font via freetype
             try:
-                import freetype
+                if freetype is None:
+                    raise ImportError("freetype is not installed")
                 bdf_path = str(fonts_dir / '5x7.bdf')
                 if not os.path.exists(bdf_path):
                     raise FileNotFoundError(f"BDF font not found: {bdf_path}")
@@ -146,7 +214,7 @@ class VisualTestDisplayManager:
             # 4x6 extra small TTF
             try:
                 xs_path = str(fonts_dir / '4x6-font.ttf')
-                self.extra_small_font = ImageFont.truetype(xs_path, 6)
+                self.extra_small_font = self._truetype(xs_path, 6)
             except (FileNotFoundError, OSError) as e:
                 logger.debug("Extra small font not available, using fallback: %s", e)
                 self.extra_small_font = self.small_font
@@ -167,8 +235,15 @@ class VisualTestDisplayManager:
     def clear(self):
         """Clear the display to black."""
         self.clear_called = True
-        self.image = Image.new('RGB', (self._width, self._height), (0, 0, 0))
-        self.draw = ImageDraw.Draw(self.image)
+        self._blank_canvas()
+
+    def _blank_canvas(self):
+        """Black out the canvas in place, or start a new one if a plugin replaced it."""
+        if self.image is self._canvas:
+            self.image.paste((0, 0, 0), (0, 0, self._width, self._height))
+        else:
+            self.image = self._canvas = Image.new('RGB', (self._width, self._height), (0, 0, 0))
+            self.draw = ImageDraw.Draw(self.image)
 
     def update_display(self):
         """No-op for hardware; marks that display was updated."""
@@ -179,12 +254,19 @@ class VisualTestDisplayManager:
                   font: Optional[Any] = None, centered: bool = False) -> None:
         """Draw text on the canvas, matching DisplayManager.draw_text() signature."""
         # Track the call
-        self.draw_calls.append({
-            'type': 'text', 'text': text, 'x': x, 'y': y,
-            'color': color, 'font': font,
-        })
+        if self._track_calls:
+            self.draw_calls.append({
+                'type': 'text', 'text': text, 'x': x, 'y': y,
+                'color': color, 'font': font,
+            })
 
         try:
+            # Fast path: explicit position in the regular (TTF) font
+            if (x is not None and y is not None and not (font or small_font or centered)
+                    and isinstance(color, tuple)):
+                self.draw.text((x, y), text, font=self.regular_font, fill=color)
+                return
+
             # Normalize color to tuple (plugins may pass lists from JSON config)
             if isinstance(color, list):
                 color = tuple(color)
@@ -207,13 +289,7 @@ class VisualTestDisplayManager:
                 y = 0
 
             # Draw
-            try:
-                import freetype
-                is_bdf = isinstance(current_font, freetype.Face)
-            except ImportError:
-                is_bdf = False
-
-            if is_bdf:
+            if isinstance(current_font, _FREETYPE_FACE_TYPE):
                 self._draw_bdf_text(text, x, y, color, current_font)
             else:
                 self.draw.text((x, y), text, font=current_font, fill=color)
@@ -222,9 +298,10 @@ class VisualTestDisplayManager:
 
     def draw_image(self, image: Image.Image, x: int, y: int):
         """Draw an image on the display."""
-        self.draw_calls.append({
-            'type': 'image', 'image': image, 'x': x, 'y': y,
-        })
+        if self._track_calls:
+            self.draw_calls.append({
+                'type': 'image', 'image': image, 'x': x, 'y': y,
+            })
         try:
             self.image.paste(image, (x, y))
         except Exception as e:
@@ -240,35 +317,74 @@ class VisualTestDisplayManager:
                 color = tuple(color)
             face = font if font else self.calendar_font
 
-            # Compute baseline from font ascender
-            try:
-                ascender_px = face.size.ascender >> 6
-            except Exception:
-                ascender_px = 0
-            baseline_y = y + ascender_px
+            baseline_y = y + self._bdf_ascender(face)
 
             for char in text:
-                face.load_char(char)
-                bitmap = face.glyph.bitmap
-
-                glyph_left = face.glyph.bitmap_left
-                glyph_top = face.glyph.bitmap_top
-
-                for i in range(bitmap.rows):
-                    for j in range(bitmap.width):
-                        byte_index = i * bitmap.pitch + (j // 8)
-                        if byte_index < len(bitmap.buffer):
-                            byte = bitmap.buffer[byte_index]
-                            if byte & (1 << (7 - (j % 8))):
-                                pixel_x = x + glyph_left + j
-                                pixel_y = baseline_y - glyph_top + i
-                                if 0 <= pixel_x < self.width and 0 <= pixel_y < self.height:
-                                    self.draw.point((pixel_x, pixel_y), fill=color)
-
-                x += face.glyph.advance.x >> 6
+                glyph = self._load_bdf_glyph(face, char)
+                cols, rows = glyph.tile.size
+
+                # Fill the color through the glyph's mask tile, clipped to
+                # the visible panel (width/height, not the canvas).
+                px = x + glyph.left
+                py = baseline_y - glyph.top
+                x0, y0 = max(px, 0), max(py, 0)
+                x1 = min(px + cols, self.width)
+                y1 = min(py + rows, self.height)
+                if x0 < x1 and y0 < y1:
+                    tile = glyph.tile
+                    if (x1 - x0, y1 - y0) != tile.size:
+                        tile = tile.crop((x0 - px, y0 - py, x1 - px, y1 - py))
+                    self.image.paste(color, (x0, y0, x1, y1), tile)
+
+                x += glyph.advance
         except Exception as e:
             logger.debug(f"Error drawing BDF text: {e}")
 
+    def _bdf_ascender(self, face) -> int:
+        """Ascender of a BDF face in pixels (0 if unavailable), cached per face."""
+        ascender_px = self._bdf_ascender_cache.get(face)
+        if ascender_px is None:
+            try:
+                ascender_px = face.size.ascender >> 6
+            except Exception:
+                ascender_px = 0
+            self._bdf_ascender_cache[face] = ascender_px
+        return ascender_px
+
+    def _load_bdf_glyph(self, face, char: str) -> _BdfGlyph:
+        """Return the glyph tile for char, rasterizing it through FreeType once."""
+        key = (face, char)
+        glyph = self._bdf_glyph_cache.get(key)
+        if glyph is None:
+            face.load_char(char)
+            slot = face.glyph
+            tile = Image.fromarray(self._bitmap_mask(slot.bitmap) * 255)
+            glyph = _BdfGlyph(slot.advance.x >> 6, slot.bitmap_left, slot.bitmap_top, tile)
+            self._bounded_put(self._bdf_glyph_cache, key, glyph, self.BDF_GLYPH_CACHE_SIZE)
+        return glyph
+
+    @staticmethod
+    def _bounded_put(cache: dict, key, value, max_size: int) -> None:
+        """Store value, evicting the oldest entry once the cache is full."""
+        if len(cache) >= max_size:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    @staticmethod
+    def _bitmap_mask(bitmap) -> np.ndarray:
+        """Turn a FreeType glyph bitmap into a (rows, width) 0/1 uint8 array.
+
+        BDF strikes come back 1-bit packed. Outline faces passed in as a
+        freetype.Face render 8-bit grayscale, which is thresholded at half
+        coverage since an LED pixel is either on or off.
+        """
+        rows, width, pitch = bitmap.rows, bitmap.width, abs(bitmap.pitch)
+        raw = bytes(bitmap.buffer)[:rows * pitch].ljust(rows * pitch, b'\0')
+        data = np.frombuffer(raw, dtype=np.uint8).reshape(rows, pitch)
+        if bitmap.pixel_mode == _FT_PIXEL_MODE_GRAY:
+            return (data[:, :width] >= 128).astype(np.uint8)
+        return np.unpackbits(data, axis=1)[:, :width]
+
     # ------------------------------------------------------------------
     # Text measurement
     # ------------------------------------------------------------------
@@ -277,41 +393,40 @@ class VisualTestDisplayManager:
         """Get text width in pixels, matching DisplayManager.get_text_width()."""
         if font is None:
             font = self.regular_font
+        key = (font, text)
+        width = self._width_cache.get(key)
+        if width is not None:
+            return width
         try:
-            try:
-                import freetype
-                is_bdf = isinstance(font, freetype.Face)
-            except ImportError:
-                is_bdf = False
-
-            if is_bdf:
-                width = 0
-                for char in text:
-                    font.load_char(char)
-                    width += font.glyph.advance.x >> 6
-                return width
+            if isinstance(font, _FREETYPE_FACE_TYPE):
+                width = sum(self._load_bdf_glyph(font, char).advance for char in text)
+            elif hasattr(font, 'getbbox'):
+                # Same box textbbox((0, 0)) returns, without the draw context
+                bbox = font.getbbox(text)
+                width = bbox[2] - bbox[0]
             else:
                 bbox = self.draw.textbbox((0, 0), text, font=font)
-                return bbox[2] - bbox[0]
+                width = bbox[2] - bbox[0]
         except Exception:
             return 0
+        self._bounded_put(self._width_cache, key, width, self.TEXT_WIDTH_CACHE_SIZE)
+        return width
 
     def get_font_height(self, font=None) -> int:
         """Get font height in pixels, matching DisplayManager.get_font_height()."""
         if font is None:
             font = self.regular_font
+        height = self._height_cache.get(font)
+        if height is not None:
+            return height
         try:
-            try:
-                import freetype
-                is_bdf = isinstance(font, freetype.Face)
-            except ImportError:
-                is_bdf = False
-
-            if is_bdf:
-                return font.size.height >> 6
+            if isinstance(font, _FREETYPE_FACE_TYPE):
+                height = font.size.height >> 6
             else:
                 ascent, descent = font.getmetrics()
-                return ascent + descent
+                height = ascent + descent
+            self._height_cache[font] = height
+            return height
         except Exception:
             if hasattr(font, 'size'):
                 return font.size
@@ -323,40 +438,61 @@ class VisualTestDisplayManager:
 
     def draw_sun(self, x: int, y: int, size: int = 16):
         """Draw a sun icon using yellow circles and lines."""
-        self._draw_sun(x, y, size)
+        self._paste_weather_icon('sun', x, y, size)
 
     def draw_cloud(self, x: int, y: int, size: int = 16, color: Tuple[int, int, int] = (200, 200, 200)):
         """Draw a cloud icon."""
-        self._draw_cloud(x, y, size, color)
+        self._paste_weather_icon('cloud', x, y, size, tuple(color))
 
     def draw_rain(self, x: int, y: int, size: int = 16):
         """Draw rain icon with cloud and droplets."""
-        self._draw_rain(x, y, size)
+        self._paste_weather_icon('rain', x, y, size)
 
     def draw_snow(self, x: int, y: int, size: int = 16):
         """Draw snow icon with cloud and snowflakes."""
-        self._draw_snow(x, y, size)
+        self._paste_weather_icon('snow', x, y, size)
 
-    def _draw_sun(self, x: int, y: int, size: int) -> None:
+    def _paste_weather_icon(self, kind: str, x: int, y: int, size: int,
+                            color: Optional[Tuple[int, int, int]] = None) -> None:
+        """Paste a cached sprite of the icon drawn by _draw_<kind> at (x, y).
+
+        Sprites carry a margin of `size` on every side because sun rays
+        reach past the icon's nominal size x size box.
+        """
+        key = (kind, size, color)
+        sprite = self._icon_cache.get(key)
+        if sprite is None:
+            sprite = Image.new('RGBA', (3 * size, 3 * size), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(sprite)
+            if kind == 'cloud':
+                self._draw_cloud(size, size, size, color, draw=draw)
+            else:
+                getattr(self, f'_draw_{kind}')(size, size, size, draw=draw)
+            self._bounded_put(self._icon_cache, key, sprite, self.ICON_CACHE_SIZE)
+        self.image.paste(sprite, (x - size, y - size), sprite)
+
+    def _draw_sun(self, x: int, y: int, size: int, draw: Optional[ImageDraw.ImageDraw] = None) -> None:
         """Draw a sun icon with rays (internal weather icon version)."""
+        draw = draw or self.draw
         center_x, center_y = x + size // 2, y + size // 2
         radius = size // 4
         ray_length = size // 3
-        self.draw.ellipse(
+        draw.ellipse(
             [center_x - radius, center_y - radius,
              center_x + radius, center_y + radius],
             fill=self.WEATHER_COLORS['sun'],
         )
-        for angle in range(0, 360, 45):
-            rad = math.radians(angle)
-            start_x = center_x + int((radius + 2) * math.cos(rad))
-            start_y = center_y + int((radius + 2) * math.sin(rad))
-            end_x = center_x + int((radius + ray_length) * math.cos(rad))
-            end_y = center_y + int((radius + ray_length) * math.sin(rad))
-            self.draw.line([start_x, start_y, end_x, end_y], fill=self.WEATHER_COLORS['sun'], width=2)
-
-    def _draw_cloud(self, x: int, y: int, size: int, color: Optional[Tuple[int, int, int]] = None) -> None:
+        for cos_a, sin_a in _SUN_DIRS:
+            start_x = center_x + int((radius + 2) * cos_a)
+            start_y = center_y + int((radius + 2) * sin_a)
+            end_x = center_x + int((radius + ray_length) * cos_a)
+            end_y = center_y + int((radius + ray_length) * sin_a)
+            draw.line([start_x, start_y, end_x, end_y], fill=self.WEATHER_COLORS['sun'], width=2)
+
+    def _draw_cloud(self, x: int, y: int, size: int, color: Optional[Tuple[int, int, int]] = None,
+                    draw: Optional[ImageDraw.ImageDraw] = None) -> None:
         """Draw a cloud using multiple circles (internal weather icon version)."""
+        draw = draw or self.draw
         cloud_color = color if color is not None else self.WEATHER_COLORS['cloud']
         base_y = y + size // 2
         circle_radius = size // 4
@@ -366,15 +502,16 @@ class VisualTestDisplayManager:
             (x + 2 * size // 3, base_y),
         ]
         for cx, cy in positions:
-            self.draw.ellipse(
+            draw.ellipse(
                 [cx - circle_radius, cy - circle_radius,
                  cx + circle_radius, cy + circle_radius],
                 fill=cloud_color,
             )
 
-    def _draw_rain(self, x: int, y: int, size: int) -> None:
+    def _draw_rain(self, x: int, y: int, size: int, draw: Optional[ImageDraw.ImageDraw] = None) -> None:
         """Draw rain drops falling from a cloud."""
-        self._draw_cloud(x, y, size)
+        draw = draw or self.draw
+        self._draw_cloud(x, y, size, draw=draw)
         rain_color = self.WEATHER_COLORS['rain']
         drop_size = size // 8
         drops = [
@@ -383,11 +520,12 @@ class VisualTestDisplayManager:
             (x + 3 * size // 4, y + 2 * size // 3),
         ]
         for dx, dy in drops:
-            self.draw.line([dx, dy, dx - drop_size // 2, dy + drop_size], fill=rain_color, width=2)
+            draw.line([dx, dy, dx - drop_size // 2, dy + drop_size], fill=rain_color, width=2)
 
-    def _draw_snow(self, x: int, y: int, size: int) -> None:
+    def _draw_snow(self, x: int, y: int, size: int, draw: Optional[ImageDraw.ImageDraw] = None) -> None:
         """Draw snowflakes falling from a cloud."""
-        self._draw_cloud(x, y, size)
+        draw = draw or self.draw
+        self._draw_cloud(x, y, size, draw=draw)
         snow_color = self.WEATHER_COLORS['snow']
         flake_size = size // 6
         flakes = [
@@ -396,15 +534,15 @@ class VisualTestDisplayManager:
             (x + 3 * size // 4, y + 2 * size // 3),
         ]
         for fx, fy in flakes:
-            for angle in range(0, 360, 60):
-                rad = math.radians(angle)
-                end_x = fx + int(flake_size * math.cos(rad))
-                end_y = fy + int(flake_size * math.sin(rad))
-                self.draw.line([fx, fy, end_x, end_y], fill=snow_color, width=1)
+            for cos_a, sin_a in _SNOW_DIRS:
+                end_x = fx + int(flake_size * cos_a)
+                end_y = fy + int(flake_size * sin_a)
+                draw.line([fx, fy, end_x, end_y], fill=snow_color, width=1)
 
-    def _draw_storm(self, x: int, y: int, size: int) -> None:
+    def _draw_storm(self, x: int, y: int, size: int, draw: Optional[ImageDraw.ImageDraw] = None) -> None:
         """Draw a storm cloud with lightning bolt."""
-        self._draw_cloud(x, y, size)
+        draw = draw or self.draw
+        self._draw_cloud(x, y, size, draw=draw)
         bolt_color = self.WEATHER_COLORS['storm']
         bolt_points = [
             (x + size // 2, y + size // 2),
@@ -412,23 +550,24 @@ class VisualTestDisplayManager:
             (x + 2 * size // 5, y + 2 * size // 3),
             (x + size // 2, y + 5 * size // 6),
         ]
-        self.draw.polygon(bolt_points, fill=bolt_color)
+        draw.polygon(bolt_points, fill=bolt_color)
 
     def draw_weather_icon(self, condition: str, x: int, y: int, size: int = 16) -> None:
         """Draw a weather icon based on the condition."""
         cond = condition.lower()
         if cond in ('clear', 'sunny'):
-            self._draw_sun(x, y, size)
+            kind = 'sun'
         elif cond in ('clouds', 'cloudy', 'partly cloudy'):
-            self._draw_cloud(x, y, size)
+            kind = 'cloud'
         elif cond in ('rain', 'drizzle', 'shower'):
-            self._draw_rain(x, y, size)
+            kind = 'rain'
         elif cond in ('snow', 'sleet', 'hail'):
-            self._draw_snow(x, y, size)
+            kind = 'snow'
         elif cond in ('thunderstorm', 'storm'):
-            self._draw_storm(x, y, size)
+            kind = 'storm'
         else:
-            self._draw_sun(x, y, size)
+            kind = 'sun'
+        self._paste_weather_icon(kind, x, y, size)
 
     def draw_text_with_icons(self, text: str, icons: List[tuple] = None,
                              x: int = None, y: int = None,
@@ -446,13 +585,13 @@ class VisualTestDisplayManager:
 
     def set_scrolling_state(self, is_scrolling: bool):
         """Set the current scrolling state (no-op for testing)."""
-        self._scrolling_state['is_scrolling'] = is_scrolling
+        self._is_scrolling = is_scrolling
         if is_scrolling:
-            self._scrolling_state['last_scroll_activity'] = time.time()
+            self._last_scroll_activity = time.time()
 
     def is_currently_scrolling(self) -> bool:
         """Check if display is currently scrolling."""
-        return self._scrolling_state['is_scrolling']
+        return self._is_scrolling
 
     def process_deferred_updates(self):
         """Process any deferred updates (no-op for testing).
@@ -483,21 +622,35 @@ class VisualTestDisplayManager:
     # Snapshot / image capture
     # ------------------------------------------------------------------
 
+    def _png_bytes(self) -> bytes:
+        """PNG encoding of the canvas, reused while its pixels are unchanged.
+
+        Keyed on the raw pixel data rather than a dirty flag because plugins
+        draw on display_manager.image / .draw directly.
+        """
+        key = (self.image.mode, self.image.size, self.image.tobytes())
+        if key != self._png_key:
+            buffer = io.BytesIO()
+            self.image.save(buffer, format='PNG')
+            self._png_key, self._png_cache = key, buffer.getvalue()
+        return self._png_cache
+
     def save_snapshot(self, path: str) -> None:
         """Save the current display as a PNG image."""
-        self.image.save(path, format='PNG')
+        with open(path, 'wb') as f:
+            f.write(self._png_bytes())
 
     def get_image(self) -> Image.Image:
-        """Return the current display image."""
-        return self.image
+        """Return a copy of the current display image.
+
+        The canvas is blanked in place by clear()/reset(), so a captured
+        frame must not alias it.
+        """
+        return self.image.copy()
 
     def get_image_base64(self) -> str:
         """Return the current display as a base64-encoded PNG string."""
-        import base64
-        import io
-        buffer = io.BytesIO()
-        self.image.save(buffer, format='PNG')
-        return base64.b64encode(buffer.getvalue()).decode('utf-8')
+        return base64.b64encode(self._png_bytes()).decode('utf-8')
 
     # ------------------------------------------------------------------
     # Cleanup / reset
@@ -507,19 +660,15 @@ class VisualTestDisplayManager:
         """Reset all tracking state (for test reuse)."""
         self.clear_called = False
         self.update_called = False
-        self.draw_calls = []
-        self.image = Image.new('RGB', (self._width, self._height), (0, 0, 0))
-        self.draw = ImageDraw.Draw(self.image)
-        self._scrolling_state = {
-            'is_scrolling': False,
-            'last_scroll_activity': 0,
-            'scroll_inactivity_threshold': 2.0,
-            'deferred_updates': [],
-            'max_deferred_updates': 50,
-            'deferred_update_ttl': 300.0,
-        }
+        self.draw_calls.clear()
+        self._width_cache.clear()
+        self._height_cache.clear()
+        self._blank_canvas()
+        self._is_scrolling = False
+        self._last_scroll_activity = 0.0
 
     def cleanup(self):
         """Clean up resources."""
-        self.image = Image.new('RGB', (self._width, self._height), (0, 0, 0))
-        self.draw = ImageDraw.Draw(self.image)
+        self._width_cache.clear()
+        self._height_cache.clear()
+        self._blank_canvas()
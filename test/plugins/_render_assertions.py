@@ -0,0 +1,30 @@
+"""
+Pixel assertion helpers for rendering tests.
+
+Reference images are built once per distinct size/color and shared; callers
+must treat them as read-only.
+"""
+
+import functools
+
+from PIL import Image, ImageChops
+
+
+@functools.cache
+def solid(width: int, height: int, color=(0, 0, 0)) -> Image.Image:
+    """A cached RGB image filled with color."""
+    return Image.new('RGB', (width, height), color)
+
+
+def has_non_black(img: Image.Image) -> bool:
+    """True if any band of any pixel is non-zero."""
+    return img.getbbox() is not None
+
+
+def is_all_black(img: Image.Image, size) -> bool:
+    """True if img has the expected size and is RGB black everywhere.
+
+    ImageChops only compares the overlapping area, so the size is checked
+    explicitly; a mode mismatch raises.
+    """
+    return img.size == tuple(size) and ImageChops.difference(img, solid(*size)).getbbox() is None
@@ -124,8 +124,15 @@ def get_plugin_config_schema(plugin_id: str, plugins_dir: Path) -> Dict[str, Any
     return None
 
 
-@pytest.fixture
-def visual_display_manager() -> Any:
-    """Create a VisualTestDisplayManager that renders real pixels for visual testing."""
+@pytest.fixture(scope='session')
+def _shared_visual_display_manager() -> Any:
+    """One VisualTestDisplayManager per session (opening its BDF face dominates setup)."""
     from src.plugin_system.testing import VisualTestDisplayManager
     return VisualTestDisplayManager(width=128, height=32)
+
+
+@pytest.fixture
+def visual_display_manager(_shared_visual_display_manager) -> Any:
+    """A VisualTestDisplayManager that renders real pixels, reset for each test."""
+    _shared_visual_display_manager.reset()
+    return _shared_visual_display_manager
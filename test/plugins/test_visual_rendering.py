@@ -5,47 +5,49 @@ Verifies that the visual display manager actually renders pixels,
 loads fonts, and can save snapshots.
 """
 
-from PIL import Image
+import base64
+import io
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image, ImageChops
 
 from src.plugin_system.testing import VisualTestDisplayManager
+from test.plugins._render_assertions import has_non_black, is_all_black, solid
+
+
+@pytest.fixture
+def vdm(visual_display_manager):
+    """The session's shared 128x32 manager, reset before each test."""
+    return visual_display_manager
 
 
 class TestVisualDisplayManager:
     """Test VisualTestDisplayManager pixel rendering."""
 
-    def test_creates_image_with_correct_dimensions(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
-        assert vdm.image.size == (128, 32)
-
-    def test_creates_image_custom_dimensions(self):
-        vdm = VisualTestDisplayManager(width=64, height=64)
-        assert vdm.image.size == (64, 64)
-        assert vdm.width == 64
-        assert vdm.height == 64
+    @pytest.mark.parametrize("width,height", [(128, 32), (64, 64), (64, 32)])
+    def test_dimensions(self, width, height):
+        vdm = VisualTestDisplayManager(width=width, height=height)
+        assert vdm.image.size == (width, height)
+        assert (vdm.width, vdm.height) == (width, height)
+        assert (vdm.display_width, vdm.display_height) == (width, height)
+        assert (vdm.matrix.width, vdm.matrix.height) == (width, height)
 
-    def test_draw_text_renders_pixels(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_draw_text_renders_pixels(self, vdm):
         vdm.draw_text("Hello", x=0, y=0, color=(255, 255, 255))
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) > 0, "draw_text should render actual pixels"
+        assert has_non_black(vdm.image), "draw_text should render actual pixels"
 
-    def test_draw_text_centered(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_draw_text_centered(self, vdm):
         vdm.draw_text("Test", color=(255, 0, 0))  # x=None centers text
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) > 0
+        assert has_non_black(vdm.image)
 
-    def test_draw_text_with_centered_flag(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_draw_text_with_centered_flag(self, vdm):
         vdm.draw_text("X", x=64, y=10, centered=True, color=(0, 255, 0))
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) > 0
+        assert has_non_black(vdm.image)
 
-    def test_draw_text_tracks_calls(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_draw_text_tracks_calls(self, vdm):
         vdm.draw_text("Hello", x=10, y=5, color=(255, 0, 0))
         assert len(vdm.draw_calls) == 1
         assert vdm.draw_calls[0]['type'] == 'text'
@@ -53,61 +55,84 @@ class TestVisualDisplayManager:
         assert vdm.draw_calls[0]['x'] == 10
         assert vdm.draw_calls[0]['y'] == 5
 
-    def test_clear_resets_canvas(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_draw_call_tracking_is_bounded_and_optional(self):
+        vdm = VisualTestDisplayManager(width=128, height=32, max_draw_calls=3)
+        for i in range(5):
+            vdm.draw_text(str(i), x=0, y=0)
+        assert [c['text'] for c in vdm.draw_calls] == ['2', '3', '4']
+
+        untracked = VisualTestDisplayManager(width=128, height=32, track_calls=False)
+        untracked.draw_text("Hello", x=0, y=0)
+        untracked.draw_image(Image.new('RGB', (4, 4), (255, 0, 0)), 0, 0)
+        assert len(untracked.draw_calls) == 0
+        assert untracked.image.getbbox() is not None
+
+    def test_clear_resets_canvas(self, vdm):
         vdm.draw_text("Hello", x=0, y=0, color=(255, 255, 255))
         vdm.clear()
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) == 0, "clear() should reset all pixels to black"
+        assert is_all_black(vdm.image, (128, 32)), "clear() should reset all pixels to black"
         assert vdm.clear_called is True
 
-    def test_update_display_sets_flag(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_clear_reuses_own_canvas_but_not_plugin_images(self, vdm):
+        canvas = vdm.image
+        vdm.draw_text("Hello", x=0, y=0)
+        vdm.clear()
+        assert vdm.image is canvas
+        assert canvas.getbbox() is None
+
+        background = Image.new('RGB', (64, 16), (0, 0, 255))
+        vdm.image = background
+        vdm.clear()
+        assert background.getpixel((0, 0)) == (0, 0, 255)
+        assert vdm.image.size == (128, 32) and vdm.image.getbbox() is None
+
+    def test_update_display_sets_flag(self, vdm):
         assert vdm.update_called is False
         vdm.update_display()
         assert vdm.update_called is True
 
-    def test_matrix_proxy(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
-        assert vdm.matrix.width == 128
-        assert vdm.matrix.height == 32
-
-    def test_width_height_properties(self):
-        vdm = VisualTestDisplayManager(width=64, height=32)
-        assert vdm.width == 64
-        assert vdm.height == 32
-        assert vdm.display_width == 64
-        assert vdm.display_height == 32
-
-    def test_save_snapshot(self, tmp_path):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_save_snapshot_writes_file(self, vdm, tmp_path):
         vdm.draw_text("Test", x=10, y=10, color=(255, 0, 0))
         output = tmp_path / "test_render.png"
         vdm.save_snapshot(str(output))
-        assert output.exists()
-        with Image.open(str(output)) as saved_img:
-            assert saved_img.size == (128, 32)
+        assert output.read_bytes() == base64.b64decode(vdm.get_image_base64())
 
-    def test_get_image(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_snapshot_dimensions_preserved(self, vdm):
+        vdm.draw_text("Test", x=10, y=10, color=(255, 0, 0))
+        with Image.open(io.BytesIO(base64.b64decode(vdm.get_image_base64()))) as snapshot:
+            assert snapshot.size == (128, 32)
+
+    def test_get_image(self, vdm):
         img = vdm.get_image()
         assert isinstance(img, Image.Image)
         assert img.size == (128, 32)
 
-    def test_get_image_base64(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_captured_frame_survives_clear(self, vdm):
+        vdm.draw.rectangle((0, 0, 127, 31), fill=(255, 0, 0))
+        frame = vdm.get_image()
+        vdm.clear()
+        assert frame.getpixel((5, 5)) == (255, 0, 0)
+        assert is_all_black(vdm.get_image(), (128, 32))
+
+    def test_get_image_base64(self, vdm):
         vdm.draw_text("Hi", x=0, y=0, color=(255, 255, 255))
         b64 = vdm.get_image_base64()
         assert isinstance(b64, str)
         assert len(b64) > 0
         # Should be valid base64 PNG
-        import base64
-        decoded = base64.b64decode(b64)
+        decoded = base64.b64decode(b64, validate=True)
         assert decoded[:4] == b'\x89PNG'
 
-    def test_font_attributes_exist(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_png_encoding_is_reused_until_pixels_change(self, vdm):
+        vdm.draw_text("Hi", x=0, y=0)
+        first = vdm.get_image_base64()
+        with patch.object(vdm.image, 'save', side_effect=AssertionError("re-encoded")):
+            assert vdm.get_image_base64() == first
+        # Drawing straight onto the canvas must still invalidate the cache
+        vdm.draw.point((100, 20), fill=(255, 0, 0))
+        assert vdm.get_image_base64() != first
+
+    def test_font_attributes_exist(self, vdm):
         assert hasattr(vdm, 'regular_font')
         assert hasattr(vdm, 'small_font')
         assert hasattr(vdm, 'extra_small_font')
@@ -115,45 +140,44 @@ class TestVisualDisplayManager:
         assert hasattr(vdm, 'bdf_5x7_font')
         assert hasattr(vdm, 'font')
 
-    def test_get_text_width(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_fonts_are_parsed_once_across_instances(self):
+        first = VisualTestDisplayManager(width=128, height=32)
+        second = VisualTestDisplayManager(width=64, height=32)
+        assert second.regular_font is first.regular_font
+        assert second.extra_small_font is first.extra_small_font
+
+    def test_get_text_width(self, vdm):
         w = vdm.get_text_width("Hello", vdm.regular_font)
         assert isinstance(w, int)
         assert w > 0
 
-    def test_get_font_height(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_get_font_height(self, vdm):
         h = vdm.get_font_height(vdm.regular_font)
         assert isinstance(h, int)
         assert h > 0
 
-    def test_image_paste(self):
+    def test_image_paste(self, vdm):
         """Verify plugins can paste images onto the display."""
-        vdm = VisualTestDisplayManager(width=128, height=32)
-        overlay = Image.new('RGB', (10, 10), (255, 0, 0))
-        vdm.image.paste(overlay, (0, 0))
-        pixel = vdm.image.getpixel((5, 5))
-        assert pixel == (255, 0, 0)
+        vdm.image.paste(solid(10, 10, (255, 0, 0)), (0, 0))
+        pixels = np.asarray(vdm.image)
+        assert np.all(pixels[0:10, 0:10] == (255, 0, 0))
+        assert vdm.image.getbbox() == (0, 0, 10, 10)
 
-    def test_image_assignment(self):
+    def test_image_assignment(self, vdm):
         """Verify plugins can assign a new image to display_manager.image."""
-        vdm = VisualTestDisplayManager(width=128, height=32)
-        new_img = Image.new('RGB', (128, 32), (0, 255, 0))
-        vdm.image = new_img
-        assert vdm.image.getpixel((0, 0)) == (0, 255, 0)
+        vdm.image = solid(128, 32, (0, 255, 0)).copy()
+        assert np.all(np.asarray(vdm.image) == (0, 255, 0))
 
-    def test_draw_image(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
-        overlay = Image.new('RGB', (10, 10), (0, 0, 255))
-        vdm.draw_image(overlay, 5, 5)
+    def test_draw_image(self, vdm):
+        vdm.draw_image(solid(10, 10, (0, 0, 255)), 5, 5)
         assert len(vdm.draw_calls) == 1
         assert vdm.draw_calls[0]['type'] == 'image'
-        # Verify pixels were actually pasted
-        pixel = vdm.image.getpixel((7, 7))
-        assert pixel == (0, 0, 255)
+        # Verify the whole overlay was pasted, and nothing else
+        pixels = np.asarray(vdm.image)
+        assert np.all(pixels[5:15, 5:15] == (0, 0, 255))
+        assert vdm.image.getbbox() == (5, 5, 15, 15)
 
-    def test_reset(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_reset(self, vdm):
         vdm.draw_text("Hi", x=0, y=0)
         vdm.clear()
         vdm.update_display()
@@ -161,77 +185,160 @@ class TestVisualDisplayManager:
         assert vdm.clear_called is False
         assert vdm.update_called is False
         assert len(vdm.draw_calls) == 0
-        pixels = list(vdm.image.getdata())
-        assert all(p == (0, 0, 0) for p in pixels)
+        assert is_all_black(vdm.image, (128, 32))
 
-    def test_scrolling_state(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
+    def test_fixture_starts_from_a_blank_display(self, vdm):
+        assert is_all_black(vdm.image, (128, 32))
+        assert len(vdm.draw_calls) == 0 and not vdm.clear_called
+        vdm.draw_text("Hi", x=0, y=0)
+        vdm.set_scrolling_state(True)
+
+    def test_scrolling_state(self, vdm):
         assert vdm.is_currently_scrolling() is False
         vdm.set_scrolling_state(True)
         assert vdm.is_currently_scrolling() is True
         vdm.set_scrolling_state(False)
         assert vdm.is_currently_scrolling() is False
 
-    def test_process_deferred_updates_is_noop(self):
+    def test_process_deferred_updates_is_noop(self, vdm):
         # Ticker-style plugins (news, odds-ticker, leaderboard, stock-news,
         # stocks) call this unconditionally alongside set_scrolling_state();
         # it must exist and be harmless so those plugins render under the
         # harness instead of raising AttributeError.
-        vdm = VisualTestDisplayManager(width=128, height=32)
         vdm.set_scrolling_state(True)
         vdm.process_deferred_updates()  # should not raise
         assert vdm.is_currently_scrolling() is True
 
-    def test_format_date_with_ordinal(self):
-        from datetime import datetime
-        vdm = VisualTestDisplayManager(width=128, height=32)
-        dt = datetime(2025, 8, 1)
-        result = vdm.format_date_with_ordinal(dt)
-        assert '1st' in result
-        dt = datetime(2025, 8, 3)
-        result = vdm.format_date_with_ordinal(dt)
-        assert '3rd' in result
-        dt = datetime(2025, 8, 11)
-        result = vdm.format_date_with_ordinal(dt)
-        assert '11th' in result
+    @pytest.mark.parametrize("day,ordinal", [
+        (1, '1st'), (2, '2nd'), (3, '3rd'), (4, '4th'),
+        (11, '11th'), (12, '12th'), (13, '13th'),
+        (21, '21st'), (22, '22nd'), (23, '23rd'), (31, '31st'),
+    ])
+    def test_format_date_with_ordinal(self, vdm, day, ordinal):
+        assert vdm.format_date_with_ordinal(datetime(2025, 8, day)) == f"Aug {ordinal}"
 
 
 class TestWeatherDrawing:
     """Test weather icon rendering."""
 
-    def test_draw_sun(self):
+    @pytest.mark.parametrize("method,args", [
+        ("draw_sun", (0, 0, 16)),
+        ("draw_cloud", (0, 0, 16)),
+        ("draw_rain", (0, 0, 16)),
+        ("draw_snow", (0, 0, 16)),
+        ("draw_weather_icon", ("clear", 0, 0, 16)),
+        ("draw_weather_icon", ("cloudy", 0, 0, 16)),
+        ("draw_weather_icon", ("rain", 0, 0, 16)),
+        ("draw_weather_icon", ("snow", 0, 0, 16)),
+        ("draw_weather_icon", ("storm", 0, 0, 16)),
+        ("draw_weather_icon", ("unknown", 0, 0, 16)),
+    ])
+    def test_icon_renders(self, vdm, method, args):
+        getattr(vdm, method)(*args)
+        assert has_non_black(vdm.image), f"{method}{args} should render pixels"
+
+    def test_cached_icons_match_direct_rasterization(self):
+        for kind in ('sun', 'cloud', 'rain', 'snow', 'storm'):
+            direct = VisualTestDisplayManager(width=64, height=32)
+            getattr(direct, f'_draw_{kind}')(20, 6, 16)
+            cached = VisualTestDisplayManager(width=64, height=32)
+            cached._paste_weather_icon(kind, 20, 6, 16)
+            cached._paste_weather_icon(kind, 20, 6, 16)
+            assert ImageChops.difference(direct.image, cached.image).getbbox() is None, kind
+        assert len(cached._icon_cache) == 1
+
+
+class TestBdfRendering:
+    """Test BDF glyph blitting against a per-bit reference."""
+
+    @staticmethod
+    def _reference_pixels(vdm, text, x, y):
+        face = vdm.bdf_5x7_font
+        baseline_y = y + (face.size.ascender >> 6)
+        lit = set()
+        for char in text:
+            face.load_char(char)
+            bitmap = face.glyph.bitmap
+            for i in range(bitmap.rows):
+                for j in range(bitmap.width):
+                    if bitmap.buffer[i * bitmap.pitch + j // 8] & (1 << (7 - j % 8)):
+                        px = x + face.glyph.bitmap_left + j
+                        py = baseline_y - face.glyph.bitmap_top + i
+                        if 0 <= px < vdm.width and 0 <= py < vdm.height:
+                            lit.add((px, py))
+            x += face.glyph.advance.x >> 6
+        return lit
+
+    def test_matches_per_bit_reference_with_clipping(self):
+        freetype = pytest.importorskip('freetype')
+        vdm = VisualTestDisplayManager(width=64, height=16)
+        if not isinstance(vdm.bdf_5x7_font, freetype.Face):
+            pytest.skip("5x7 BDF font not available")
+        vdm.draw_text("Ag:9", x=-2, y=12, font=vdm.bdf_5x7_font, color=(255, 128, 0))
+        vdm.draw_text("edge", x=58, y=0, font=vdm.bdf_5x7_font, color=(255, 128, 0))
+        expected = (self._reference_pixels(vdm, "Ag:9", -2, 12)
+                    | self._reference_pixels(vdm, "edge", 58, 0))
+        lit = {(int(px), int(py)) for py, px in np.argwhere(np.asarray(vdm.image).any(axis=-1))}
+        assert expected and lit == expected
+        assert all(vdm.image.getpixel(p) == (255, 128, 0) for p in lit)
+
+    def test_glyphs_load_through_freetype_once(self):
+        freetype = pytest.importorskip('freetype')
         vdm = VisualTestDisplayManager(width=128, height=32)
-        vdm.draw_sun(0, 0, 16)
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) > 0
-
-    def test_draw_cloud(self):
+        face = vdm.bdf_5x7_font
+        if not isinstance(face, freetype.Face):
+            pytest.skip("5x7 BDF font not available")
+        loaded = []
+        real_load_char = face.load_char
+        face.load_char = lambda char, *args: loaded.append(char) or real_load_char(char, *args)
+
+        first = vdm.get_text_width("12:34", face)
+        for _ in range(3):
+            vdm.draw_text("12:34", x=0, y=0, font=face)
+        assert vdm.get_text_width("12:34", face) == first
+        assert sorted(loaded) == sorted("1234:")
+
+    def test_grayscale_face_is_thresholded(self):
+        freetype = pytest.importorskip('freetype')
+        vdm = VisualTestDisplayManager(width=64, height=16)
+        if not isinstance(vdm.bdf_5x7_font, freetype.Face):
+            pytest.skip("font assets not available")
+        face = freetype.Face(str(vdm._find_project_root() / 'assets' / 'fonts' / 'PressStart2P-Regular.ttf'))
+        face.set_pixel_sizes(0, 8)
+        face.load_char('A')
+        bitmap = face.glyph.bitmap
+        coverage = bytes(bitmap.buffer)
+        mask = vdm._bitmap_mask(bitmap)
+        assert mask.shape == (bitmap.rows, bitmap.width)
+        assert [[int(v) for v in row] for row in mask] == [
+            [int(coverage[i * bitmap.pitch + j] >= 128) for j in range(bitmap.width)]
+            for i in range(bitmap.rows)
+        ]
+
+
+class TestTextMeasurementCache:
+    """Test memoized text width / font height lookups."""
+
+    def test_width_is_measured_once_per_font_and_text(self):
         vdm = VisualTestDisplayManager(width=128, height=32)
-        vdm.draw_cloud(0, 0, 16)
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) > 0
-
-    def test_draw_rain(self):
+        expected = vdm.get_text_width("12:34", vdm.regular_font)
+        with patch.object(vdm.regular_font, 'getbbox', side_effect=AssertionError("re-measured")), \
+                patch.object(vdm.draw, 'textbbox', side_effect=AssertionError("re-measured")):
+            assert vdm.get_text_width("12:34", vdm.regular_font) == expected
+            vdm.draw_text("12:34", color=(255, 255, 255))  # centered: measures
+        assert vdm.get_text_width("12:34", vdm.small_font) > 0
+
+    def test_width_matches_textbbox(self):
         vdm = VisualTestDisplayManager(width=128, height=32)
-        vdm.draw_rain(0, 0, 16)
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) > 0
+        for font in (vdm.regular_font, vdm.extra_small_font):
+            for text in ("Hello", "12:34", " a "):
+                bbox = vdm.draw.textbbox((0, 0), text, font=font)
+                assert vdm.get_text_width(text, font) == bbox[2] - bbox[0]
 
-    def test_draw_snow(self):
+    def test_reset_drops_measurements(self):
         vdm = VisualTestDisplayManager(width=128, height=32)
-        vdm.draw_snow(0, 0, 16)
-        pixels = list(vdm.image.getdata())
-        non_black = [p for p in pixels if p != (0, 0, 0)]
-        assert len(non_black) > 0
-
-    def test_draw_weather_icon_dispatches(self):
-        vdm = VisualTestDisplayManager(width=128, height=32)
-        for condition in ['clear', 'cloudy', 'rain', 'snow', 'storm', 'unknown']:
-            vdm.clear()
-            vdm.draw_weather_icon(condition, 0, 0, 16)
-            pixels = list(vdm.image.getdata())
-            non_black = [p for p in pixels if p != (0, 0, 0)]
-            assert len(non_black) > 0, f"draw_weather_icon('{condition}') should render pixels"
+        vdm.get_text_width("Hi")
+        vdm.get_font_height()
+        vdm.reset()
+        assert vdm._width_cache == {} and vdm._height_cache == {}
+        assert vdm.get_font_height() > 0
@@ -0,0 +1,72 @@
+"""Tests for the archive fallback install path (store_manager._install_via_download).
+
+The .tar.gz archive is streamed straight from the response into the target
+directory with GitHub's ``<repo>-<branch>/`` root directory stripped.
+"""
+
+import io
+import os
+import sys
+import tarfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.plugin_system.store_manager import PluginStoreManager  # noqa: E402
+
+ARCHIVE_URL = "https://github.com/owner/plugin/archive/refs/heads/main.tar.gz"
+
+
+def _tarball(files, root="plugin-main"):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        root_info = tarfile.TarInfo(root)
+        root_info.type = tarfile.DIRTYPE
+        root_info.mode = 0o755
+        tar.addfile(root_info)
+        for name, data in files.items():
+            info = tarfile.TarInfo(f"{root}/{name}" if root else name)
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _response(status_code, body=b""):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.raw = io.BytesIO(body)
+    return resp
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PluginStoreManager(plugins_dir=str(tmp_path))
+
+
+class TestArchiveInstall:
+    def test_extracts_without_root_directory(self, store, tmp_path):
+        body = _tarball({"manifest.json": b'{"id": "plugin"}', "assets/logo.png": b"\x89PNG"})
+        target = tmp_path / "plugin"
+        with patch.object(store, "_http_get_with_retries", return_value=_response(200, body)):
+            assert store._install_via_download(ARCHIVE_URL, target)
+
+        assert (target / "manifest.json").read_bytes() == b'{"id": "plugin"}'
+        assert (target / "assets" / "logo.png").read_bytes() == b"\x89PNG"
+        assert not (target / "plugin-main").exists()
+
+    def test_missing_branch_leaves_nothing_behind(self, store, tmp_path):
+        target = tmp_path / "plugin"
+        with patch.object(store, "_http_get_with_retries", return_value=_response(404)):
+            assert not store._install_via_download(ARCHIVE_URL, target)
+        assert not target.exists()
+
+    def test_escaping_member_aborts_install(self, store, tmp_path):
+        body = _tarball({"manifest.json": b"{}", "../../escape.txt": b"x"})
+        target = tmp_path / "plugin"
+        with patch.object(store, "_http_get_with_retries", return_value=_response(200, body)):
+            assert not store._install_via_download(ARCHIVE_URL, target)
+        assert not target.exists()
+        assert not (tmp_path.parent / "escape.txt").exists()
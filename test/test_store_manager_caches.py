@@ -10,14 +10,17 @@ Coverage targets:
 - ``fetch_registry`` stale-cache fallback on network failure.
 """
 
+import heapq
+import json
 import os
+import sys
 import time
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch, MagicMock
 
-from src.plugin_system.store_manager import PluginStoreManager
+from src.plugin_system.store_manager import PluginStoreManager, _TTLCache
 
 
 class TestUninstallTombstone(unittest.TestCase):
@@ -358,7 +361,7 @@ class TestSearchPluginsParallel(unittest.TestCase):
             ]
         }
         self.sm.registry_cache = self.registry
-        self.sm.registry_cache_time = time.time()
+        self.sm.registry_cache_time = time.monotonic()
 
         self._enrich_calls = []
 
@@ -463,11 +466,11 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
                 "forks": 0, "open_issues": 0, "updated_at_iso": "",
                 "language": "", "license": ""}
         # Seed the cache with a known-good value, then force expiry.
-        self.sm.github_cache[cache_key] = (time.time() - 10_000, good)
+        self.sm.github_cache[cache_key] = (time.monotonic() - 10_000, good)
         self.sm.cache_timeout = 1  # force re-fetch
 
         import requests as real_requests
-        with patch("src.plugin_system.store_manager.requests.get",
+        with patch.object(self.sm._session, "get",
                    side_effect=real_requests.ConnectionError("boom")):
             result = self.sm._get_github_repo_info("https://github.com/owner/repo")
         self.assertEqual(result["stars"], 42)
@@ -486,7 +489,7 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
                 "last_commit_iso": "", "last_commit_date": "",
                 "forks": 0, "open_issues": 0, "updated_at_iso": "",
                 "language": "", "license": ""}
-        self.sm.github_cache[cache_key] = (time.time() - 10_000, good)
+        self.sm.github_cache[cache_key] = (time.monotonic() - 10_000, good)
         self.sm.cache_timeout = 1
         self.sm._failure_backoff_seconds = 60
 
@@ -497,7 +500,7 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
             call_count["n"] += 1
             raise real_requests.ConnectionError("boom")
 
-        with patch("src.plugin_system.store_manager.requests.get", side_effect=counting_get):
+        with patch.object(self.sm._session, "get", side_effect=counting_get):
             first = self.sm._get_github_repo_info("https://github.com/owner/repo")
             self.assertEqual(first["stars"], 99)
             self.assertEqual(call_count["n"], 1)
@@ -518,7 +521,7 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
                 "last_commit_iso": "", "last_commit_date": "",
                 "forks": 0, "open_issues": 0, "updated_at_iso": "",
                 "language": "", "license": ""}
-        self.sm.github_cache[cache_key] = (time.time() - 10_000, good)
+        self.sm.github_cache[cache_key] = (time.monotonic() - 10_000, good)
         self.sm.cache_timeout = 1
 
         rate_limited = MagicMock()
@@ -530,7 +533,7 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
             call_count["n"] += 1
             return rate_limited
 
-        with patch("src.plugin_system.store_manager.requests.get", side_effect=counting_get):
+        with patch.object(self.sm._session, "get", side_effect=counting_get):
             self.sm._get_github_repo_info("https://github.com/owner/repo")
             self.assertEqual(call_count["n"], 1)
             self.sm._get_github_repo_info("https://github.com/owner/repo")
@@ -544,11 +547,11 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
         good = {"branch": "main", "sha": "a" * 40, "short_sha": "aaaaaaa",
                 "date_iso": "2026-04-08T00:00:00Z", "date": "2026-04-08",
                 "author": "x", "message": "y"}
-        self.sm.commit_info_cache[cache_key] = (time.time() - 10_000, good)
+        self.sm.commit_info_cache[cache_key] = (time.monotonic() - 10_000, good)
         self.sm.commit_cache_timeout = 1  # force re-fetch
 
         import requests as real_requests
-        with patch("src.plugin_system.store_manager.requests.get",
+        with patch.object(self.sm._session, "get",
                    side_effect=real_requests.ConnectionError("boom")):
             result = self.sm._get_latest_commit_info(
                 "https://github.com/owner/repo", branch="main"
@@ -569,7 +572,7 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
         good = {"branch": "main", "sha": "a" * 40, "short_sha": "aaaaaaa",
                 "date_iso": "2026-04-08T00:00:00Z", "date": "2026-04-08",
                 "author": "x", "message": "y"}
-        self.sm.commit_info_cache[cache_key] = (time.time() - 10_000, good)
+        self.sm.commit_info_cache[cache_key] = (time.monotonic() - 10_000, good)
         self.sm.commit_cache_timeout = 1
 
         # Each branches_to_try attempt returns a 404. No network error
@@ -578,7 +581,7 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
         not_found = MagicMock()
         not_found.status_code = 404
         not_found.text = "Not Found"
-        with patch("src.plugin_system.store_manager.requests.get", return_value=not_found):
+        with patch.object(self.sm._session, "get", return_value=not_found):
             result = self.sm._get_latest_commit_info(
                 "https://github.com/owner/repo", branch="main"
             )
@@ -589,6 +592,94 @@ class TestStaleOnErrorFallbacks(unittest.TestCase):
         self.assertIsNotNone(self.sm.commit_info_cache[cache_key][1])
 
 
+class TestCommitInfoGraphQL(unittest.TestCase):
+    """With a token, commit info for all candidate branches is resolved in
+    one GraphQL request; REST stays the fallback."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm.github_token = "ghp_test"
+
+    def _graphql_response(self, repository):
+        import json as _json
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.content = _json.dumps({"data": {"repository": repository}}).encode()
+        return resp
+
+    def test_first_existing_branch_wins_in_one_request(self):
+        repository = {
+            "b0": None,  # requested "dev" branch doesn't exist
+            "b1": {"target": {"oid": "b" * 40, "authoredDate": "2026-04-08T00:00:00Z",
+                              "message": "msg", "author": {"name": "Ann"}}},
+            "b2": None,
+        }
+        with patch.object(self.sm._session, "post",
+                          return_value=self._graphql_response(repository)) as post, \
+                patch.object(self.sm._session, "get") as rest_get:
+            result = self.sm._get_latest_commit_info("https://github.com/owner/repo", "dev")
+
+        self.assertEqual(post.call_count, 1)
+        rest_get.assert_not_called()
+        variables = post.call_args.kwargs["json"]["variables"]
+        self.assertEqual([variables[k] for k in ("b0", "b1", "b2")],
+                         ["refs/heads/dev", "refs/heads/main", "refs/heads/master"])
+        self.assertEqual(result["branch"], "main")
+        self.assertEqual(result["short_sha"], "bbbbbbb")
+        self.assertEqual(result["date"], "2026-04-08")
+
+    def test_graphql_error_falls_back_to_rest(self):
+        import requests as real_requests
+        rest = MagicMock()
+        rest.status_code = 200
+        rest.content = b'{"sha": "cccccccccc", "commit": {"author": {"date": "", "name": "x"}, "message": ""}}'
+        with patch.object(self.sm._session, "post",
+                          side_effect=real_requests.ConnectionError("boom")), \
+                patch.object(self.sm._session, "get", return_value=rest):
+            result = self.sm._get_latest_commit_info("https://github.com/owner/repo", "main")
+        self.assertEqual(result["short_sha"], "ccccccc")
+
+
+class TestCommitInfoEtagRevalidation(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm.github_token = None
+
+    def test_not_modified_reuses_cached_commit(self):
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {"ETag": 'W/"abc"'}
+        full.content = b'{"sha": "dddddddddd", "commit": {"author": {"date": "2026-01-02T00:00:00Z", "name": "x"}, "message": "m"}}'
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+
+        with patch.object(self.sm._session, "get", side_effect=[full, not_modified]) as get:
+            first = self.sm._get_latest_commit_info("https://github.com/owner/repo", "main")
+            second = self.sm._get_latest_commit_info(
+                "https://github.com/owner/repo", "main", force_refresh=True)
+
+        self.assertEqual(get.call_args_list[1].kwargs["headers"]["If-None-Match"], 'W/"abc"')
+        self.assertEqual(second, first)
+        self.assertEqual(second["date"], "2026-01-02")
+
+    def test_only_commit_summary_is_cached(self):
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {"ETag": 'W/"abc"'}
+        full.content = (b'{"sha": "dddddddddd", "files": [{"patch": "big"}], "commit": '
+                        b'{"author": {"date": "2026-01-02T00:00:00Z", "name": "x"}, "message": "m"}}')
+        with patch.object(self.sm._session, "get", return_value=full):
+            self.sm._get_latest_commit_info("https://github.com/owner/repo", "main")
+        etag, cached = self.sm._etag_cache["https://api.github.com/repos/owner/repo/commits/main"]
+        self.assertEqual(etag, 'W/"abc"')
+        self.assertEqual(cached, {"sha": "dddddddddd", "short_sha": "ddddddd", "date_iso": "2026-01-02T00:00:00Z",
+                                  "date": "2026-01-02", "author": "x", "message": "m"})
+
+
 class TestInstallUpdateUninstallInvariants(unittest.TestCase):
     """Regression guard: the caching and tombstone work added in this PR
     must not break the install / update / uninstall code paths.
@@ -614,14 +705,14 @@ class TestInstallUpdateUninstallInvariants(unittest.TestCase):
         self.sm.registry_cache = {
             "plugins": [{"id": "foo", "repo": "https://github.com/o/r"}]
         }
-        self.sm.registry_cache_time = time.time()
+        self.sm.registry_cache_time = time.monotonic()
 
         repo_calls = []
         commit_calls = []
         manifest_calls = []
 
-        def fake_repo(url):
-            repo_calls.append(url)
+        def fake_repo(url, force_refresh=False):
+            repo_calls.append((url, force_refresh))
             return {"default_branch": "main", "stars": 0,
                     "last_commit_iso": "", "last_commit_date": ""}
 
@@ -644,6 +735,7 @@ class TestInstallUpdateUninstallInvariants(unittest.TestCase):
         self.assertIsNotNone(info)
         self.assertEqual(info["last_commit_sha"], "d" * 40)
         # force_refresh must have propagated through to the fetch helpers.
+        self.assertTrue(repo_calls[0][1], "force_refresh=True did not reach _get_github_repo_info")
         self.assertTrue(commit_calls, "commit fetch was not called")
         self.assertTrue(commit_calls[0][2], "force_refresh=True did not reach _get_latest_commit_info")
         self.assertTrue(manifest_calls, "manifest fetch was not called")
@@ -662,7 +754,7 @@ class TestInstallUpdateUninstallInvariants(unittest.TestCase):
             "plugins": [{"id": "bar", "repo": "https://github.com/o/bar",
                          "plugin_path": ""}]
         }
-        self.sm.registry_cache_time = time.time()
+        self.sm.registry_cache_time = time.monotonic()
 
         # Mark it recently uninstalled (simulates a user who just clicked
         # uninstall and then immediately clicked install again).
@@ -670,7 +762,7 @@ class TestInstallUpdateUninstallInvariants(unittest.TestCase):
         self.assertTrue(self.sm.was_recently_uninstalled("bar"))
 
         # Stub the heavy bits so install_plugin can run without network.
-        self.sm._get_github_repo_info = lambda url: {
+        self.sm._get_github_repo_info = lambda url, force_refresh=False: {
             "default_branch": "main", "stars": 0,
             "last_commit_iso": "", "last_commit_date": ""
         }
@@ -723,7 +815,7 @@ class TestRegistryStaleCacheFallback(unittest.TestCase):
     def test_network_failure_returns_stale_cache(self):
         # Prime the cache with a known-good registry.
         self.sm.registry_cache = {"plugins": [{"id": "cached"}]}
-        self.sm.registry_cache_time = time.time() - 10_000  # very old
+        self.sm.registry_cache_time = time.monotonic() - 10_000  # very old
         self.sm.registry_cache_timeout = 1  # force re-fetch attempt
 
         import requests as real_requests
@@ -754,7 +846,7 @@ class TestRegistryStaleCacheFallback(unittest.TestCase):
         the network timeout before falling back to stale.
         """
         self.sm.registry_cache = {"plugins": [{"id": "cached"}]}
-        self.sm.registry_cache_time = time.time() - 10_000  # expired
+        self.sm.registry_cache_time = time.monotonic() - 10_000  # expired
         self.sm.registry_cache_timeout = 1
         self.sm._failure_backoff_seconds = 60
 
@@ -779,6 +871,57 @@ class TestRegistryStaleCacheFallback(unittest.TestCase):
             )
 
 
+class TestRegistryConditionalGet(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_not_modified_keeps_cache_and_sends_validators(self):
+        full = MagicMock()
+        full.status_code = 200
+        full.content = b'{"plugins": [{"id": "a"}]}'
+        full.headers = {"ETag": '"v1"', "Last-Modified": "Tue, 01 Jan 2026 00:00:00 GMT"}
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+
+        with patch.object(self.sm, "_http_get_with_retries",
+                          side_effect=[full, not_modified]) as get:
+            first = self.sm.fetch_registry()
+            second = self.sm.fetch_registry(force_refresh=True)
+
+        self.assertEqual(first, {"plugins": [{"id": "a"}]})
+        self.assertIs(second, first)
+        self.assertIsNone(get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(get.call_args_list[1].kwargs["headers"], {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Tue, 01 Jan 2026 00:00:00 GMT",
+        })
+
+
+    def test_saved_repo_plugins_do_not_accumulate_across_304(self):
+        full = MagicMock()
+        full.status_code = 200
+        full.content = b'{"plugins": [{"id": "a"}]}'
+        full.headers = {"ETag": '"v1"'}
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        saved = MagicMock()
+        saved.get_registry_repositories.return_value = [{"url": "https://github.com/o/custom"}]
+        custom = {"plugins": [{"id": "c1"}]}
+
+        with patch.object(self.sm, "_http_get_with_retries", side_effect=[full, not_modified]), \
+                patch.object(self.sm, "fetch_registry_from_url", return_value=custom):
+            first = self.sm.search_plugins(fetch_commit_info=False, saved_repositories_manager=saved)
+            self.sm.registry_cache_time = 0  # force revalidation
+            second = self.sm.search_plugins(fetch_commit_info=False, saved_repositories_manager=saved)
+
+        self.assertEqual([p["id"] for p in first], ["a", "c1"])
+        self.assertEqual([p["id"] for p in second], ["a", "c1"])
+        self.assertEqual(self.sm.registry_cache, {"plugins": [{"id": "a"}]})
+        self.assertEqual(custom, {"plugins": [{"id": "c1"}]})
+
+
 class TestFetchRegistryRaiseOnFailure(unittest.TestCase):
     """``fetch_registry(raise_on_failure=True)`` must propagate errors
     instead of silently falling back to the stale cache / empty dict.
@@ -809,7 +952,7 @@ class TestFetchRegistryRaiseOnFailure(unittest.TestCase):
         """Explicit caller opt-in beats the stale-cache convenience."""
         import requests as real_requests
         self.sm.registry_cache = {"plugins": [{"id": "stale"}]}
-        self.sm.registry_cache_time = time.time() - 10_000
+        self.sm.registry_cache_time = time.monotonic() - 10_000
         self.sm.registry_cache_timeout = 1
         with patch.object(
             self.sm,
@@ -825,9 +968,7 @@ class TestFetchRegistryRaiseOnFailure(unittest.TestCase):
         bad_response = MagicMock()
         bad_response.status_code = 200
         bad_response.raise_for_status = MagicMock()
-        bad_response.json = MagicMock(
-            side_effect=_json.JSONDecodeError("bad", "", 0)
-        )
+        bad_response.content = b"{not json"
         with patch.object(self.sm, "_http_get_with_retries", return_value=bad_response):
             with self.assertRaises(_json.JSONDecodeError):
                 self.sm.fetch_registry(raise_on_failure=True)
@@ -836,7 +977,7 @@ class TestFetchRegistryRaiseOnFailure(unittest.TestCase):
         """UI callers that don't pass the flag still get stale-cache fallback."""
         import requests as real_requests
         self.sm.registry_cache = {"plugins": [{"id": "cached"}]}
-        self.sm.registry_cache_time = time.time() - 10_000
+        self.sm.registry_cache_time = time.monotonic() - 10_000
         self.sm.registry_cache_timeout = 1
         with patch.object(
             self.sm,
@@ -847,5 +988,780 @@ class TestFetchRegistryRaiseOnFailure(unittest.TestCase):
         self.assertEqual(result, {"plugins": [{"id": "cached"}]})
 
 
+class TestManifestSchemaCache(unittest.TestCase):
+    """The compiled schema validator is reused until the schema file's
+    mtime changes, so repeated installs don't re-read the schema."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_validator_reused_across_calls(self):
+        self.sm._validate_manifest_schema({"id": "x"}, "x")
+        first = self.sm._schema_cache
+        self.assertIsNotNone(first)
+        with patch("builtins.open", side_effect=AssertionError("schema re-read")):
+            self.sm._validate_manifest_schema({"id": "x"}, "x")
+        self.assertIs(self.sm._schema_cache[1], first[1])
+
+    def test_mtime_change_rebuilds_validator(self):
+        self.sm._validate_manifest_schema({"id": "x"}, "x")
+        stale_validator = object()
+        self.sm._schema_cache = (-1, stale_validator)
+        self.sm._validate_manifest_schema({"id": "x"}, "x")
+        self.assertIsNot(self.sm._schema_cache[1], stale_validator)
+
+
+class TestTokenValidationCacheKey(unittest.TestCase):
+    def test_tokens_sharing_a_prefix_get_distinct_keys(self):
+        a = PluginStoreManager._token_cache_key("ghp_abcdefAAAA")
+        b = PluginStoreManager._token_cache_key("ghp_abcdefBBBB")
+        self.assertNotEqual(a, b)
+        self.assertNotIn("ghp_", a)
+
+    def test_cached_result_served_without_network(self):
+        with TemporaryDirectory() as tmp:
+            sm = PluginStoreManager(plugins_dir=tmp)
+            key = sm._token_cache_key("ghp_token")
+            sm._token_validation_cache[key] = (time.monotonic(), (True, None))
+            with patch.object(sm._session, "get") as get:
+                self.assertEqual(sm._validate_github_token("ghp_token"), (True, None))
+            get.assert_not_called()
+
+
+class TestCacheExpirySweep(unittest.TestCase):
+    """Entries past TTL + stale retention are evicted; entries inside the
+    retention window survive so stale-on-error fallbacks still work."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm._stale_retention_seconds = 100
+
+    def test_entry_evicted_after_retention(self):
+        old = time.monotonic() - 10_000
+        self.sm._cache_store(self.sm.manifest_cache, "gone", {"id": "x"},
+                             self.sm.manifest_cache_timeout, old)
+        self.sm._sweep_expired_caches()
+        self.assertNotIn("gone", self.sm.manifest_cache)
+        self.assertEqual(self.sm._expiry_heap, [])
+
+    def test_expired_entry_kept_within_retention(self):
+        ts = time.monotonic() - self.sm.commit_cache_timeout - 1
+        self.sm._cache_store(self.sm.commit_info_cache, "stale", {"sha": "a"},
+                             self.sm.commit_cache_timeout, ts)
+        self.sm._sweep_expired_caches()
+        self.assertIn("stale", self.sm.commit_info_cache)
+
+    def test_refreshed_entry_survives_outdated_heap_item(self):
+        old = time.monotonic() - self.sm.cache_timeout - 10_000
+        self.sm._cache_store(self.sm.github_cache, "o/r", {"stars": 1},
+                             self.sm.cache_timeout, old)
+        # Refresh by direct write, leaving the outdated heap item behind.
+        self.sm.github_cache["o/r"] = (time.monotonic(), {"stars": 2})
+        self.sm._sweep_expired_caches()
+        self.assertEqual(self.sm.github_cache["o/r"][1], {"stars": 2})
+        # The refreshed entry is rescheduled for its own eviction time.
+        self.assertEqual([key for _, _, key in self.sm._expiry_heap], ["o/r"])
+
+    def test_repeated_stores_keep_one_heap_item(self):
+        for stars in range(5):
+            self.sm._cache_store(self.sm.github_cache, "o/r", {"stars": stars},
+                                 self.sm.cache_timeout)
+        self.assertEqual(len(self.sm._expiry_heap), 1)
+
+    def test_sweep_leaves_lru_order_alone(self):
+        old = time.monotonic() - self.sm.cache_timeout - 1
+        for key in ("a", "b"):
+            self.sm._cache_store(self.sm.github_cache, key, {}, self.sm.cache_timeout, old)
+        # Due in reverse insertion order, so a reordering read would show.
+        self.sm._expiry_heap[:] = [(1, "github_cache", "a"), (0, "github_cache", "b")]
+        heapq.heapify(self.sm._expiry_heap)
+        self.sm._sweep_expired_caches()
+        self.assertEqual(list(self.sm.github_cache), ["a", "b"])
+
+    def test_lru_evicted_entries_are_compacted_out_of_heap(self):
+        self.sm.github_cache.maxsize = 4
+        for i in range(200):
+            self.sm._cache_store(self.sm.github_cache, f"o/r{i}", {}, self.sm.cache_timeout)
+        self.assertLessEqual(len(self.sm._expiry_heap), 2 * 4 + 64 + 1)
+        self.assertEqual(len(self.sm._expiry_scheduled), len(self.sm._expiry_heap))
+
+
+class TestTTLCacheLRU(unittest.TestCase):
+    def test_least_recently_used_entry_evicted(self):
+        cache = _TTLCache(maxsize=2)
+        cache["a"] = (1.0, "A")
+        cache["b"] = (2.0, "B")
+        cache.get("a")  # touch: "b" becomes least recently used
+        cache["c"] = (3.0, "C")
+        self.assertEqual(list(cache), ["a", "c"])
+
+    def test_store_caches_are_bounded(self):
+        with TemporaryDirectory() as tmp:
+            sm = PluginStoreManager(plugins_dir=tmp)
+            sm.manifest_cache.maxsize = 3
+            for i in range(10):
+                sm._cache_store(sm.manifest_cache, f"k{i}", {}, sm.manifest_cache_timeout)
+            self.assertEqual(list(sm.manifest_cache), ["k7", "k8", "k9"])
+
+
+class TestSingleflight(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_concurrent_callers_share_one_call(self):
+        import threading
+        started = threading.Event()
+        release = threading.Event()
+        calls = {"n": 0}
+
+        def slow():
+            calls["n"] += 1
+            started.set()
+            release.wait(5)
+            return {"stars": 7}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(self.sm._singleflight(("k",), slow)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(self.sm._singleflight(("k",), slow)))
+        follower.start()
+        time.sleep(0.2)  # let the follower block on the leader's Future
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(calls["n"], 1)
+        self.assertEqual(results, [{"stars": 7}, {"stars": 7}])
+        self.assertEqual(self.sm._inflight, {})
+
+    def test_concurrent_commit_lookups_for_same_repo_issue_one_request(self):
+        import threading
+        self.sm.github_token = None
+        release = threading.Event()
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.headers = {}
+        ok.content = b'{"sha": "eeeeeeeeee", "commit": {"author": {"date": "", "name": ""}, "message": ""}}'
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return ok
+
+        urls = ["https://github.com/owner/repo", "https://github.com/owner/repo.git/"]
+        results = []
+        with patch.object(self.sm._session, "get", side_effect=slow_get) as get:
+            threads = [
+                threading.Thread(target=lambda u=u: results.append(
+                    self.sm._get_latest_commit_info(u, "main")))
+                for u in urls
+            ]
+            for t in threads:
+                t.start()
+            time.sleep(0.2)
+            release.set()
+            for t in threads:
+                t.join(5)
+
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual([r["short_sha"] for r in results], ["eeeeeee", "eeeeeee"])
+
+    def test_exception_propagates_and_releases_slot(self):
+        with self.assertRaises(RuntimeError):
+            self.sm._singleflight(("k",), MagicMock(side_effect=RuntimeError("x")))
+        self.assertEqual(self.sm._singleflight(("k",), lambda: 1), 1)
+
+
+class TestPersistentMetadataCache(unittest.TestCase):
+    """GitHub metadata caches survive a restart via plugins_dir/.cache."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm._cache_persist_delay = 3600  # flush explicitly below
+
+    def test_entries_reload_in_new_instance(self):
+        commit = {"branch": "main", "sha": "a" * 40}
+        self.sm._cache_store(self.sm.commit_info_cache, "owner/repo:main",
+                             commit, self.sm.commit_cache_timeout)
+        self.sm._etag_cache["https://api.github.com/x"] = ('"e1"', {"k": 1})
+        self.sm._persist_caches()
+
+        fresh = PluginStoreManager(plugins_dir=self._tmp.name)
+        ts, data = fresh.commit_info_cache["owner/repo:main"]
+        self.assertEqual(data, commit)
+        self.assertLess(time.monotonic() - ts, fresh.commit_cache_timeout)
+        self.assertEqual(fresh._etag_cache["https://api.github.com/x"], ('"e1"', {"k": 1}))
+
+    def test_only_recent_etags_are_persisted(self):
+        self.sm._PERSISTED_ETAG_LIMIT = 2
+        for i in range(4):
+            self.sm._etag_cache[f"https://api.github.com/{i}"] = (f'"e{i}"', {"sha": str(i)})
+        self.sm._persist_caches()
+
+        fresh = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.assertEqual(list(fresh._etag_cache), ["https://api.github.com/2", "https://api.github.com/3"])
+
+    def test_entries_past_retention_are_not_loaded(self):
+        old = time.monotonic() - self.sm.manifest_cache_timeout - self.sm._stale_retention_seconds - 10
+        self.sm._cache_store(self.sm.manifest_cache, "gone", {"id": "x"},
+                             self.sm.manifest_cache_timeout, old)
+        self.sm._persist_caches()
+        fresh = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.assertNotIn("gone", fresh.manifest_cache)
+
+    def test_cache_dir_is_not_listed_as_plugin(self):
+        self.sm._persist_caches()
+        self.assertTrue((Path(self._tmp.name) / ".cache" / "github_meta.json").exists())
+        self.assertEqual(self.sm.list_installed_plugins(), [])
+
+    def test_close_flushes_pending_write_and_closes_session(self):
+        self.sm._cache_store(self.sm.commit_info_cache, "owner/repo:main",
+                             {"sha": "b" * 40}, self.sm.commit_cache_timeout)
+        with patch.object(self.sm._session, "close") as close:
+            self.sm.close()
+        close.assert_called_once()
+        self.assertIsNone(self.sm._cache_persist_timer)
+        fresh = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.assertEqual(fresh.commit_info_cache["owner/repo:main"][1], {"sha": "b" * 40})
+
+    def test_registry_reloads_and_revalidates_with_its_etag(self):
+        registry = {"plugins": [{"id": "a"}]}
+        ok = MagicMock(status_code=200, content=b'{"plugins": [{"id": "a"}]}',
+                       headers={"ETag": '"r1"'})
+        with patch.object(self.sm, "_http_get_with_retries", return_value=ok):
+            self.sm.fetch_registry(force_refresh=True)
+        self.sm._persist_caches()
+
+        fresh = PluginStoreManager(plugins_dir=self._tmp.name)
+        not_modified = MagicMock(status_code=304, headers={})
+        with patch.object(fresh, "_http_get_with_retries", return_value=not_modified) as get:
+            self.assertEqual(fresh.fetch_registry(), registry)
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"r1"'})
+
+    def test_registry_is_persisted_as_fetched(self):
+        ok = MagicMock(status_code=200, content=b'{"plugins": [{"id": "a"}]}',
+                       headers={"ETag": '"r1"'})
+        with patch.object(self.sm, "_http_get_with_retries", return_value=ok):
+            registry = self.sm.fetch_registry(force_refresh=True)
+        # In-memory changes to the live dict must not leak into the snapshot.
+        registry["plugins"].append({"id": "c1", "_source": "custom_repository"})
+        self.sm._persist_caches()
+
+        fresh = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.assertEqual(fresh.registry_cache, {"plugins": [{"id": "a"}]})
+
+
+class TestUpdateRegistryRefresh(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_recent_fetch_is_reused(self):
+        self.sm.registry_cache = {"plugins": []}
+        self.sm.registry_cache_time = time.monotonic()
+        with patch.object(self.sm, "fetch_registry") as fetch:
+            self.assertIs(self.sm._refresh_registry_for_update(), self.sm.registry_cache)
+        fetch.assert_not_called()
+
+    def test_older_fetch_is_forced(self):
+        self.sm.registry_cache = {"plugins": []}
+        self.sm.registry_cache_time = time.monotonic() - self.sm.UPDATE_REGISTRY_MAX_AGE - 1
+        with patch.object(self.sm, "fetch_registry") as fetch:
+            self.sm._refresh_registry_for_update()
+        fetch.assert_called_once_with(force_refresh=True)
+
+
+class TestRegistryPluginIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm.registry_cache_time = time.monotonic()
+
+    def test_lookup_follows_registry_replacement(self):
+        self.sm.registry_cache = {"plugins": [{"id": "a", "v": 1}, {"id": "a", "v": 2}]}
+        self.assertEqual(self.sm.get_registry_info("a"), {"id": "a", "v": 1})
+        self.sm.registry_cache = {"plugins": [{"id": "b"}]}
+        self.assertIsNone(self.sm.get_registry_info("a"))
+        self.assertEqual(self.sm.get_registry_info("b"), {"id": "b"})
+
+    def test_lookup_sees_appended_entries(self):
+        self.sm.registry_cache = {"plugins": [{"id": "a"}]}
+        self.assertIsNone(self.sm.get_registry_info("c"))
+        self.sm.registry_cache["plugins"].append({"id": "c"})
+        self.assertEqual(self.sm.get_registry_info("c"), {"id": "c"})
+
+
+class TestPluginSnapshotGraphQL(unittest.TestCase):
+    """With a token, get_plugin_info fills repo, commit and manifest data
+    from a single GraphQL query instead of three REST calls."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm.github_token = "ghp_test"
+        self.sm.registry_cache = {"plugins": [
+            {"id": "foo", "repo": "https://github.com/owner/mono", "plugin_path": "plugins/foo"},
+        ]}
+        self.sm.registry_cache_time = time.monotonic()
+
+    def _graphql_response(self):
+        import json as _json
+        commit = {"oid": "e" * 40, "authoredDate": "2026-05-01T00:00:00Z",
+                  "message": "latest", "author": {"name": "Ann"}}
+        repository = {
+            "stargazerCount": 42, "forkCount": 3,
+            "updatedAt": "2026-05-02T00:00:00Z", "pushedAt": "2026-05-01T00:00:00Z",
+            "issues": {"totalCount": 2}, "pullRequests": {"totalCount": 1},
+            "primaryLanguage": {"name": "Python"}, "licenseInfo": {"name": "MIT License"},
+            "defaultBranchRef": {"name": "main", "target": commit},
+            "manifest": {"text": '{"id": "foo", "description": "From GitHub"}'},
+        }
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.content = _json.dumps({"data": {"repository": repository}}).encode()
+        return resp
+
+    def test_single_query_populates_plugin_info(self):
+        with patch.object(self.sm._session, "post",
+                          return_value=self._graphql_response()) as post, \
+                patch.object(self.sm._session, "get") as rest_get:
+            info = self.sm.get_plugin_info("foo")
+            again = self.sm.get_plugin_info("foo")
+
+        self.assertEqual(post.call_count, 1)
+        rest_get.assert_not_called()
+        self.assertEqual(post.call_args.kwargs["json"]["variables"]["expr"],
+                         "HEAD:plugins/foo/manifest.json")
+        self.assertEqual(info["stars"], 42)
+        self.assertEqual(info["branch"], "main")
+        self.assertEqual(info["last_commit"], "eeeeeee")
+        self.assertEqual(info["description"], "From GitHub")
+        self.assertEqual(again["last_commit_sha"], "e" * 40)
+
+    def test_graphql_failure_falls_back_to_rest_helpers(self):
+        import requests as real_requests
+        with patch.object(self.sm._session, "post",
+                          side_effect=real_requests.ConnectionError("boom")), \
+                patch.object(self.sm, "_get_github_repo_info",
+                             return_value={"default_branch": "main", "stars": 7}) as repo_info, \
+                patch.object(self.sm, "_get_latest_commit_info", return_value=None), \
+                patch.object(self.sm, "_fetch_manifest_from_github", return_value=None):
+            info = self.sm.get_plugin_info("foo")
+        repo_info.assert_called_once()
+        self.assertEqual(info["stars"], 7)
+
+
+class TestDefaultBranchProbing(unittest.TestCase):
+    """A cached default branch caps the branch probes at that branch."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm.github_token = None
+
+    def test_unknown_default_keeps_main_master_fallbacks(self):
+        self.assertEqual(self.sm._branches_to_probe("https://github.com/owner/repo", ["dev"]),
+                         ["dev", "main", "master"])
+
+    def test_known_default_stops_after_it(self):
+        self.sm.github_cache["owner/repo"] = (time.monotonic(), {"default_branch": "trunk"})
+        url = "https://github.com/owner/repo"
+        self.assertEqual(self.sm._branches_to_probe(url, ["dev"]), ["dev", "trunk"])
+        self.assertEqual(self.sm._branches_to_probe(url, ["trunk", "main"]), ["trunk"])
+
+    def test_commit_lookup_on_default_branch_probes_once(self):
+        self.sm.github_cache["owner/repo"] = (time.monotonic(), {"default_branch": "main"})
+        missing = MagicMock()
+        missing.status_code = 404
+        missing.headers = {}
+        missing.text = "Not Found"
+        with patch.object(self.sm._session, "get", return_value=missing) as get:
+            self.assertIsNone(self.sm._get_latest_commit_info("https://github.com/owner/repo", "main"))
+        self.assertEqual(get.call_count, 1)
+
+
+class TestInstallStaging(unittest.TestCase):
+    """Installs stage in a hidden directory inside plugins_dir and are
+    renamed into place."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_hidden_staging_dirs_are_not_listed(self):
+        for name in ("real", ".ledmatrix_plugin_abc"):
+            (Path(self._tmp.name) / name).mkdir()
+            (Path(self._tmp.name) / name / "manifest.json").write_text("{}")
+        self.assertEqual(self.sm.list_installed_plugins(), ["real"])
+
+    def test_cross_device_rename_falls_back_to_move(self):
+        import errno
+        src = Path(self._tmp.name) / ".staging"
+        src.mkdir()
+        (src / "manifest.json").write_text("{}")
+        dest = Path(self._tmp.name) / "plugin"
+        with patch("src.plugin_system.store_manager.os.rename",
+                   side_effect=OSError(errno.EXDEV, "cross-device")):
+            PluginStoreManager._move_into_place(src, dest)
+        self.assertTrue((dest / "manifest.json").exists())
+        self.assertFalse(src.exists())
+
+    def test_manifest_rewrite_replaces_file_atomically(self):
+        manifest = Path(self._tmp.name) / "manifest.json"
+        manifest.write_text('{"id": "old"}')
+        with patch("src.plugin_system.store_manager.os.replace", wraps=os.replace) as replace:
+            PluginStoreManager._replace_json_file(manifest, {"id": "new"})
+        replace.assert_called_once()
+        self.assertEqual(json.loads(manifest.read_text()), {"id": "new"})
+        self.assertEqual([p.name for p in Path(self._tmp.name).iterdir()], ["manifest.json"])
+
+
+class TestRateLimitAwareness(unittest.TestCase):
+    """An exhausted X-RateLimit-Remaining stops further GitHub API calls
+    until X-RateLimit-Reset, with one warning per window."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.sm.github_token = None
+
+    def _exhausted(self):
+        resp = MagicMock()
+        resp.status_code = 403
+        resp.text = "rate limited"
+        resp.headers = {"X-RateLimit-Remaining": "0",
+                        "X-RateLimit-Reset": str(int(time.time()) + 600)}
+        return resp
+
+    def test_calls_skipped_until_reset(self):
+        with patch.object(self.sm._session, "get", return_value=self._exhausted()) as get, \
+                self.assertLogs(self.sm.logger, level="WARNING") as logs:
+            self.sm._get_github_repo_info("https://github.com/owner/one")
+            self.sm._get_github_repo_info("https://github.com/owner/two")
+            self.sm._get_latest_commit_info("https://github.com/owner/two", "main")
+            # Raw content downloads don't count against the API limit.
+            self.sm._http_get_with_retries("https://raw.githubusercontent.com/owner/two/main/x")
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(sum("rate limit exhausted" in line for line in logs.output), 1)
+
+    def test_expired_window_allows_calls_again(self):
+        self.sm._rate_limit_reset = time.time() - 1
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.headers = {"X-RateLimit-Remaining": "59"}
+        ok.content = b'{"stargazers_count": 5, "default_branch": "main"}'
+        with patch.object(self.sm._session, "get", return_value=ok):
+            self.assertEqual(self.sm._get_github_repo_info("https://github.com/owner/repo")["stars"], 5)
+
+
+class TestHttpSessionRetryBudget(unittest.TestCase):
+    """The pooled session keeps the old retry budget: three attempts on
+    connection failures, no status retries and no Retry-After sleeps."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.retry = PluginStoreManager(plugins_dir=self._tmp.name)._session.get_adapter(
+            "https://api.github.com/").max_retries
+
+    def test_connection_errors_get_three_attempts(self):
+        from urllib3.exceptions import MaxRetryError, NewConnectionError
+        retry = self.retry
+        for _ in range(2):
+            retry = retry.increment(method="GET", url="/", error=NewConnectionError(None, "refused"))
+        with self.assertRaises(MaxRetryError):
+            retry.increment(method="GET", url="/", error=NewConnectionError(None, "refused"))
+
+    def test_error_statuses_are_not_retried(self):
+        for status in (429, 502, 503, 504):
+            self.assertFalse(self.retry.is_retry("GET", status, has_retry_after=True))
+
+
+class TestPluginMetadataCache(unittest.TestCase):
+    """.plugin_metadata.json is re-parsed only when the file changes."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        self.plugin_path = Path(self._tmp.name) / "plg"
+        self.plugin_path.mkdir()
+        self.meta = self.plugin_path / ".plugin_metadata.json"
+
+    def test_unchanged_file_is_not_reparsed(self):
+        self.meta.write_text('{"install_type": "bundled"}')
+        first = self.sm._read_plugin_metadata(self.plugin_path)
+        with patch("builtins.open") as opened:
+            second = self.sm._read_plugin_metadata(self.plugin_path)
+        opened.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(second["install_type"], "bundled")
+
+    def test_rewritten_file_is_reparsed(self):
+        self.meta.write_text('{"install_type": "bundled"}')
+        self.sm._read_plugin_metadata(self.plugin_path)
+        self.meta.write_text('{"install_type": "registry"}')
+        os.utime(self.meta, ns=(0, 10 ** 9))
+        self.assertEqual(self.sm._read_plugin_metadata(self.plugin_path)["install_type"], "registry")
+
+    def test_missing_or_invalid_file(self):
+        self.assertIsNone(self.sm._read_plugin_metadata(self.plugin_path))
+        self.meta.write_text("not json")
+        self.assertIsNone(self.sm._read_plugin_metadata(self.plugin_path))
+
+    def test_installed_manifest_is_memoized(self):
+        manifest = self.plugin_path / "manifest.json"
+        manifest.write_text('{"id": "plg", "version": "1.0.0"}')
+        self.assertEqual(self.sm.list_installed_plugins(), ["plg"])
+        first = self.sm.get_installed_plugin_info("plg")
+        with patch("pathlib.Path.read_bytes") as read:
+            self.assertIs(self.sm.get_installed_plugin_info("plg"), first)
+        read.assert_not_called()
+        manifest.write_text('{"id": "plg", "version": "1.1.0"}')
+        os.utime(manifest, ns=(0, 10 ** 9))
+        self.assertEqual(self.sm.get_installed_plugin_info("plg")["version"], "1.1.0")
+        self.assertIsNone(self.sm.get_installed_plugin_info("missing"))
+
+
+class TestLsRemoteHeads(unittest.TestCase):
+    """update_plugin resolves candidate branches and origin's default
+    branch with a single ``git ls-remote --symref``."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_one_call_reports_heads_and_default(self):
+        result = MagicMock(returncode=0, stdout=(
+            "ref: refs/heads/trunk\tHEAD\n"
+            "1111111111111111111111111111111111111111\tHEAD\n"
+            "2222222222222222222222222222222222222222\trefs/heads/dev\n"
+        ))
+        with patch("src.plugin_system.store_manager.subprocess.run", return_value=result) as run:
+            heads, default = self.sm._ls_remote_heads(Path(self._tmp.name), ["dev", "main", "dev"])
+        run.assert_called_once()
+        self.assertEqual(run.call_args.args[0][-3:], ["HEAD", "refs/heads/dev", "refs/heads/main"])
+        self.assertEqual(heads, {"dev"})
+        self.assertEqual(default, "trunk")
+        # Never blocks on a credential prompt for a private/deleted repo.
+        self.assertEqual(run.call_args.kwargs["env"]["GIT_TERMINAL_PROMPT"], "0")
+
+    def test_unreachable_remote_uses_local_origin_head(self):
+        failed = MagicMock(returncode=128, stdout="")
+        local = MagicMock(returncode=0, stdout="refs/remotes/origin/main\n")
+        with patch("src.plugin_system.store_manager.subprocess.run", side_effect=[failed, local]):
+            heads, default = self.sm._ls_remote_heads(Path(self._tmp.name), ["dev"])
+        self.assertEqual(heads, set())
+        self.assertEqual(default, "main")
+
+
+class TestSafeRemoveDirectory(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_failed_entry_is_retried_without_walking_tree(self):
+        target = Path(self._tmp.name) / "plugin"
+        (target / "__pycache__").mkdir(parents=True)
+        for i in range(5):
+            (target / "__pycache__" / f"m{i}.pyc").write_bytes(b"x")
+        real_unlink = os.unlink
+        failures = []
+
+        def flaky_unlink(p, *args, **kwargs):
+            if not failures:
+                failures.append(p)
+                raise PermissionError(p)
+            return real_unlink(p, *args, **kwargs)
+
+        with patch("os.unlink", side_effect=flaky_unlink), \
+                patch("os.walk") as walk, \
+                patch("src.plugin_system.store_manager.sudo_remove_directory") as sudo:
+            self.assertTrue(self.sm._safe_remove_directory(target))
+        self.assertEqual(len(failures), 1)
+        walk.assert_not_called()
+        sudo.assert_not_called()
+        self.assertFalse(target.exists())
+
+    def test_uses_non_deprecated_rmtree_handler(self):
+        target = Path(self._tmp.name) / "plugin"
+        target.mkdir()
+        with patch("src.plugin_system.store_manager.shutil.rmtree") as rmtree:
+            self.sm._safe_remove_directory(target)
+        expected = "onexc" if sys.version_info >= (3, 12) else "onerror"
+        self.assertEqual(list(rmtree.call_args.kwargs), [expected])
+
+
+class TestCollectGitState(unittest.TestCase):
+    """update_plugin reads branch, upstream and dirty state from one
+    ``git status --porcelain=v2 --branch`` call."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+
+    def test_parses_branch_upstream_and_changes(self):
+        result = MagicMock(returncode=0, stdout=(
+            "# branch.oid 1111111111111111111111111111111111111111\n"
+            "# branch.head main\n"
+            "# branch.upstream origin/main\n"
+            "# branch.ab +0 -2\n"
+            "1 .M N... 100644 100644 100644 aaa bbb manager.py\n"
+            "? notes.txt\n"
+            "? data/cache file.json\n"
+        ))
+        with patch("src.plugin_system.store_manager.subprocess.run", return_value=result) as run:
+            state = self.sm._collect_git_state(Path(self._tmp.name))
+        run.assert_called_once()
+        self.assertEqual(state.branch, "main")
+        self.assertEqual(state.upstream, "origin/main")
+        self.assertTrue(state.has_tracked_changes)
+        self.assertEqual(state.untracked, ["notes.txt", "data/cache file.json"])
+
+    def test_clean_detached_checkout(self):
+        result = MagicMock(returncode=0, stdout="# branch.oid abc\n# branch.head (detached)\n")
+        with patch("src.plugin_system.store_manager.subprocess.run", return_value=result):
+            state = self.sm._collect_git_state(Path(self._tmp.name))
+        self.assertIsNone(state.branch)
+        self.assertIsNone(state.upstream)
+        self.assertFalse(state.has_tracked_changes)
+        self.assertEqual(state.untracked, [])
+
+    def test_git_error_returns_none(self):
+        with patch("src.plugin_system.store_manager.subprocess.run",
+                   return_value=MagicMock(returncode=128, stdout="")):
+            self.assertIsNone(self.sm._collect_git_state(Path(self._tmp.name)))
+
+
+class TestGitFastForwardUpdate(unittest.TestCase):
+    """update_plugin fetches only the upstream branch and fast-forwards
+    onto it instead of running ``git pull``."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        (Path(self._tmp.name) / "p").mkdir()
+
+    def test_fetches_branch_then_merges_ff_only(self):
+        status = "# branch.oid abc\n# branch.head main\n# branch.upstream origin/main\n"
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd[3:])
+            return MagicMock(returncode=0, stdout=status if "status" in cmd else "", stderr="")
+
+        with patch.object(self.sm, "_get_local_git_info", return_value={"branch": "main", "sha": "abc"}), \
+                patch.object(self.sm, "fetch_registry"), \
+                patch.object(self.sm, "get_plugin_info", return_value=None), \
+                patch.object(self.sm, "_install_dependencies"), \
+                patch("src.plugin_system.store_manager.subprocess.run", side_effect=fake_run):
+            self.assertTrue(self.sm.update_plugin("p"))
+
+        self.assertNotIn("pull", [c[0] for c in calls])
+        self.assertIn(["fetch", "--no-tags", "origin", "main"], calls)
+        self.assertEqual(calls[-1], ["merge", "--ff-only", "FETCH_HEAD"])
+        self.assertEqual(sum(c[0] == "fetch" for c in calls), 1)
+
+    def test_failure_logs_highest_priority_hint(self):
+        import subprocess
+
+        def fake_run(cmd, **kwargs):
+            if "fetch" in cmd:
+                raise subprocess.CalledProcessError(
+                    128, cmd, stderr="fatal: could not read Username: terminal prompts disabled\n"
+                                     "fatal: repository 'x' not found")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with patch.object(self.sm, "_get_local_git_info", return_value={"branch": "main", "sha": "abc"}), \
+                patch.object(self.sm, "fetch_registry"), \
+                patch.object(self.sm, "get_plugin_info", return_value=None), \
+                patch("src.plugin_system.store_manager.subprocess.run", side_effect=fake_run), \
+                self.assertLogs("src.plugin_system.store_manager", level="ERROR") as logs:
+            self.assertFalse(self.sm.update_plugin("p"))
+        hints = [r for r in logs.output if "Authentication failed" in r or "not found for" in r]
+        self.assertEqual(len(hints), 1)
+        self.assertIn("Authentication failed for p", hints[0])
+
+
+class TestReadHeadSha(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.plugin = Path(self._tmp.name) / "p"
+        (self.plugin / ".git" / "refs" / "heads").mkdir(parents=True)
+
+    def test_loose_ref(self):
+        (self.plugin / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (self.plugin / ".git" / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+        self.assertEqual(PluginStoreManager._read_head_sha(self.plugin), "a" * 40)
+
+    def test_packed_ref(self):
+        (self.plugin / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (self.plugin / ".git" / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            + "b" * 40 + " refs/heads/dev\n"
+            + "c" * 40 + " refs/heads/main\n"
+        )
+        self.assertEqual(PluginStoreManager._read_head_sha(self.plugin), "c" * 40)
+
+    def test_large_packed_refs_without_trailing_newline(self):
+        (self.plugin / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        lines = "".join(f"{i:040d} refs/heads/branch-{i}\n" for i in range(400))
+        (self.plugin / ".git" / "packed-refs").write_text(lines + "e" * 40 + " refs/heads/main")
+        self.assertEqual(PluginStoreManager._read_head_sha(self.plugin), "e" * 40)
+
+    def test_detached_head(self):
+        (self.plugin / ".git" / "HEAD").write_text("d" * 40 + "\n")
+        self.assertEqual(PluginStoreManager._read_head_sha(self.plugin), "d" * 40)
+
+    def test_unresolvable_ref_returns_none(self):
+        (self.plugin / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        self.assertIsNone(PluginStoreManager._read_head_sha(self.plugin))
+
+
+class TestBrokenCheckoutReinstall(unittest.TestCase):
+    """A checkout whose ``git log`` fails is reinstalled from the remote and
+    branch recorded in its own .git, read without spawning git."""
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sm = PluginStoreManager(plugins_dir=self._tmp.name)
+        git_dir = Path(self._tmp.name) / "p" / ".git"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/dev\n")
+        (git_dir / "config").write_text(
+            '[core]\n\tbare = false\n[remote "origin"]\n\turl = https://github.com/o/p.git\n'
+        )
+
+    def test_reinstalls_from_recorded_remote_and_branch(self):
+        with patch.object(self.sm, "_get_local_git_info", return_value=None), \
+                patch.object(self.sm, "fetch_registry"), \
+                patch.object(self.sm, "get_plugin_info", return_value=None), \
+                patch.object(self.sm, "install_from_url", return_value={"success": True}) as install, \
+                patch("src.plugin_system.store_manager.subprocess.run") as run:
+            self.assertTrue(self.sm.update_plugin("p"))
+        run.assert_not_called()
+        install.assert_called_once_with("https://github.com/o/p.git", plugin_id="p", branch="dev")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,308 @@
+"""Tests for the monorepo install path (store_manager._install_from_monorepo_api).
+
+The Trees API listing is followed by one raw.githubusercontent.com download
+per file; those downloads run concurrently, and a single failed file must
+still remove the partial install so the ZIP fallback starts clean. The ZIP
+fallback itself writes only the plugin's members, straight into the target.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.plugin_system.store_manager import PluginStoreManager  # noqa: E402
+
+REPO_URL = "https://github.com/owner/monorepo"
+SUBPATH = "plugins/hello"
+FILES = {
+    "plugins/hello/manifest.json": b'{"id": "hello"}',
+    "plugins/hello/manager.py": b"# manager\n",
+    "plugins/hello/assets/logo.png": b"\x89PNG",
+}
+
+
+def _response(status_code, content=b""):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.content = content
+    resp.headers = {}
+    return resp
+
+
+def _tree_response(subtree=False):
+    import json
+    if subtree:
+        # "<ref>:plugins/hello" listings are relative to the plugin directory.
+        tree = [{"path": path[len(SUBPATH) + 1:], "type": "blob"} for path in FILES]
+    else:
+        tree = [{"path": path, "type": "blob"} for path in FILES]
+        tree.append({"path": "plugins/other/manifest.json", "type": "blob"})
+    return _response(200, json.dumps({"tree": tree, "truncated": False}).encode())
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PluginStoreManager(plugins_dir=str(tmp_path))
+
+
+def _fake_get(raw_status=None, subtree_status=200):
+    raw_status = raw_status or {}
+
+    def fake(url, **kwargs):
+        if "/git/trees/" in url:
+            if "%3A" in url:
+                if subtree_status != 200:
+                    return _response(subtree_status)
+                return _tree_response(subtree=True)
+            return _tree_response()
+        # https://raw.githubusercontent.com/owner/monorepo/<ref>/<path>
+        path = url.split("/", 6)[6]
+        status = raw_status.get(path, 200)
+        return _response(status, FILES.get(path, b"") if status == 200 else b"")
+    return fake
+
+
+class TestMonorepoApiInstall:
+    def test_downloads_every_file_in_subpath(self, store, tmp_path):
+        target = tmp_path / "hello"
+        with patch.object(store, "_http_get_with_retries", side_effect=_fake_get()) as get:
+            assert store._install_from_monorepo_api(REPO_URL, "main", SUBPATH, target)
+
+        assert (target / "manifest.json").read_bytes() == FILES["plugins/hello/manifest.json"]
+        assert (target / "assets" / "logo.png").read_bytes() == FILES["plugins/hello/assets/logo.png"]
+        assert not (target / "other").exists()
+        # One subtree listing plus one request per file.
+        assert get.call_count == 1 + len(FILES)
+        assert get.call_args_list[0].args[0].endswith("/git/trees/main%3Aplugins/hello?recursive=true")
+
+    def test_falls_back_to_full_tree_listing(self, store, tmp_path):
+        target = tmp_path / "hello"
+        with patch.object(store, "_http_get_with_retries", side_effect=_fake_get(subtree_status=404)) as get:
+            assert store._install_from_monorepo_api(REPO_URL, "main", SUBPATH, target)
+
+        assert (target / "manager.py").read_bytes() == FILES["plugins/hello/manager.py"]
+        assert not (target / "other").exists()
+        assert get.call_args_list[1].args[0].endswith("/git/trees/main?recursive=true")
+
+    def test_full_listing_caches_only_plugin_paths(self, store, tmp_path):
+        base = _fake_get(subtree_status=404)
+
+        def fake(url, **kwargs):
+            resp = base(url, **kwargs)
+            if "/git/trees/" in url:
+                resp.headers = {"ETag": '"tree"'}
+            return resp
+
+        with patch.object(store, "_http_get_with_retries", side_effect=fake):
+            assert store._install_from_monorepo_api(REPO_URL, "main", SUBPATH, tmp_path / "hello")
+        cached = [data for _, data in store._etag_cache.values()]
+        assert all(path.startswith(f"{SUBPATH}/") for _, paths in cached for path in paths)
+        assert any(sorted(paths) == sorted(FILES) for _, paths in cached)
+
+    def test_failed_file_removes_partial_install(self, store, tmp_path):
+        target = tmp_path / "hello"
+        fake = _fake_get(raw_status={"plugins/hello/manager.py": 404})
+        with patch.object(store, "_http_get_with_retries", side_effect=fake):
+            assert not store._install_from_monorepo_api(REPO_URL, "main", SUBPATH, target)
+        assert not target.exists()
+
+    def test_commit_sha_pins_tree_and_file_urls(self, store, tmp_path):
+        target = tmp_path / "hello"
+        sha = "f" * 40
+        with patch.object(store, "_http_get_with_retries", side_effect=_fake_get()) as get:
+            assert store._install_from_monorepo_api(REPO_URL, "main", SUBPATH, target, commit_sha=sha)
+        urls = [c.args[0] for c in get.call_args_list]
+        assert urls[0].endswith(f"/git/trees/{sha}%3Aplugins/hello?recursive=true")
+        assert all(f"/{sha}/plugins/hello/" in u for u in urls[1:])
+
+    def test_commit_sha_only_used_for_resolved_branch(self):
+        info = {"last_commit_branch": "main", "last_commit_sha": "abc"}
+        assert PluginStoreManager._commit_sha_for_branch(info, "main") == "abc"
+        assert PluginStoreManager._commit_sha_for_branch(info, "dev") is None
+
+
+def _zip_response(members):
+    import io
+    import zipfile
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("monorepo-main/", b"")
+        for name, data in members.items():
+            zf.writestr(f"monorepo-main/{name}", data)
+    resp = _response(200)
+    resp.raw = io.BytesIO(buf.getvalue())
+    return resp
+
+
+class TestMonorepoZipInstall:
+    ZIP_URL = f"{REPO_URL}/archive/refs/heads/main.zip"
+
+    def test_extracts_only_plugin_members_into_target(self, store, tmp_path):
+        members = dict(FILES)
+        members["plugins/other/manifest.json"] = b'{"id": "other"}'
+        target = tmp_path / "hello"
+        with patch.object(store, "_http_get_with_retries", return_value=_zip_response(members)):
+            assert store._install_from_monorepo_zip(self.ZIP_URL, SUBPATH, target)
+
+        assert (target / "manifest.json").read_bytes() == FILES["plugins/hello/manifest.json"]
+        assert (target / "assets" / "logo.png").read_bytes() == FILES["plugins/hello/assets/logo.png"]
+        assert sorted(p.name for p in target.iterdir()) == ["assets", "manager.py", "manifest.json"]
+
+    def test_empty_members_are_created(self, store, tmp_path):
+        members = dict(FILES)
+        members["plugins/hello/__init__.py"] = b""
+        target = tmp_path / "hello"
+        with patch.object(store, "_http_get_with_retries", return_value=_zip_response(members)):
+            assert store._install_from_monorepo_zip(self.ZIP_URL, SUBPATH, target)
+        assert (target / "__init__.py").read_bytes() == b""
+
+    def test_missing_subpath_creates_nothing(self, store, tmp_path):
+        target = tmp_path / "missing"
+        with patch.object(store, "_http_get_with_retries", return_value=_zip_response(FILES)):
+            assert not store._install_from_monorepo_zip(self.ZIP_URL, "plugins/missing", target)
+        assert not target.exists()
+
+    def test_escaping_member_aborts_install(self, store, tmp_path):
+        members = dict(FILES)
+        members["plugins/hello/../../../escape.txt"] = b"x"
+        target = tmp_path / "hello"
+        with patch.object(store, "_http_get_with_retries", return_value=_zip_response(members)):
+            assert not store._install_from_monorepo_zip(self.ZIP_URL, SUBPATH, target)
+        assert not target.exists()
+        assert not (tmp_path.parent / "escape.txt").exists()
+
+    def test_parallel_extraction_writes_every_member(self, store, tmp_path):
+        members = {f"plugins/hello/data/{i}.txt": f"file {i}".encode() for i in range(40)}
+        target = tmp_path / "hello"
+        store._ZIP_PARALLEL_MIN_MEMBERS = 8
+        with patch.object(store, "_http_get_with_retries", return_value=_zip_response(members)), \
+                patch("src.plugin_system.store_manager.os.cpu_count", return_value=4):
+            assert store._install_from_monorepo_zip(self.ZIP_URL, SUBPATH, target)
+        for i in range(40):
+            assert (target / "data" / f"{i}.txt").read_bytes() == f"file {i}".encode()
+
+
+def _tarball_get(members, root="monorepo-abc123"):
+    import io
+    import tarfile
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(f"{root}/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    tree_get = _fake_get()
+
+    def fake(url, **kwargs):
+        if url.endswith(".tar.gz"):
+            resp = _response(200)
+            resp.raw = io.BytesIO(buf.getvalue())
+            return resp
+        return tree_get(url, **kwargs)
+    return fake
+
+
+class TestMonorepoTarballInstall:
+    def test_large_plugin_streams_commit_tarball(self, store, tmp_path):
+        fake = _tarball_get({**FILES, "plugins/other/manifest.json": b"{}"})
+        store.MONOREPO_TARBALL_MIN_FILES = 2
+        target = tmp_path / "hello"
+        with patch.object(store, "_http_get_with_retries", side_effect=fake) as get:
+            assert store._install_from_monorepo_api(REPO_URL, "main", SUBPATH, target, commit_sha="abc123")
+
+        urls = [c.args[0] for c in get.call_args_list]
+        assert urls[1] == f"{REPO_URL}/archive/abc123.tar.gz"
+        assert not any("raw.githubusercontent.com" in u for u in urls)
+        assert (target / "assets" / "logo.png").read_bytes() == FILES["plugins/hello/assets/logo.png"]
+        assert not (target / "other").exists()
+
+    def test_install_from_url_extracts_into_staging_dir(self, store, tmp_path):
+        import json
+        manifest = {"id": "hello", "name": "Hello", "class_name": "Hello", "display_modes": ["hello"]}
+        files = {**FILES, "plugins/hello/manifest.json": json.dumps(manifest).encode()}
+        store.MONOREPO_TARBALL_MIN_FILES = 2
+        with patch.object(store, "_http_get_with_retries", side_effect=_tarball_get(files, "monorepo-main")) as get, \
+                patch.object(store, "_branches_to_probe", return_value=["main"]), \
+                patch.object(store, "_install_dependencies", return_value=True):
+            result = store.install_from_url(REPO_URL, plugin_path=SUBPATH)
+
+        assert result["success"], result
+        assert result["plugin_id"] == "hello"
+        urls = [c.args[0] for c in get.call_args_list]
+        assert f"{REPO_URL}/archive/main.tar.gz" in urls
+        assert not any("raw.githubusercontent.com" in u for u in urls)
+        assert (tmp_path / "hello" / "manager.py").read_bytes() == FILES["plugins/hello/manager.py"]
+        assert not any(p.name.startswith(".ledmatrix_plugin_") for p in tmp_path.iterdir())
+
+    def test_failed_download_keeps_existing_target(self, store, tmp_path):
+        target = tmp_path / "staging"
+        target.mkdir()
+        fake = _tarball_get({"plugins/hello/../../escape.txt": b"x", **FILES})
+        with patch.object(store, "_http_get_with_retries", side_effect=fake):
+            assert not store._install_via_download(f"{REPO_URL}/archive/main.tar.gz", target, SUBPATH)
+        assert target.is_dir()
+        assert list(target.iterdir()) == []
+
+    def test_non_empty_target_is_left_alone(self, store, tmp_path):
+        target = tmp_path / "staging"
+        target.mkdir()
+        (target / "keep.txt").write_text("keep")
+        with patch.object(store, "_http_get_with_retries", side_effect=_tarball_get(FILES)):
+            assert not store._install_via_download(f"{REPO_URL}/archive/main.tar.gz", target, SUBPATH)
+        assert [p.name for p in target.iterdir()] == ["keep.txt"]
+
+
+class TestMonorepoApiCancellation:
+    def test_first_failure_cancels_queued_downloads(self, store, tmp_path):
+        import threading
+        release = threading.Event()
+        requested = []
+        base = _fake_get(raw_status={"plugins/hello/manifest.json": 404})
+
+        def fake(url, **kwargs):
+            requested.append(url)
+            if "/git/trees/" not in url and not url.endswith("manifest.json"):
+                release.wait(2)
+            return base(url, **kwargs)
+
+        store.MONOREPO_DOWNLOAD_WORKERS = 1
+        target = tmp_path / "hello"
+        with patch.object(store, "_http_get_with_retries", side_effect=fake):
+            assert not store._install_from_monorepo_api(REPO_URL, "main", SUBPATH, target)
+        release.set()
+        assert not any(u.endswith("assets/logo.png") for u in requested)
+        assert not target.exists()
+
+
+class TestSafeRelativeParts:
+    @pytest.mark.parametrize("path", ["", "/etc/passwd", "../x", "a/../../x", "a//b", "./a", "a/"])
+    def test_rejects_escaping_or_malformed_paths(self, path):
+        assert PluginStoreManager._safe_relative_parts(path) is None
+
+    def test_splits_nested_path(self):
+        assert PluginStoreManager._safe_relative_parts("assets/fonts/a.bdf") == ("assets", "fonts", "a.bdf")
+
+
+class TestDownloadRawFile:
+    def test_short_writes_are_completed(self, store, tmp_path):
+        body = b"x" * 10000
+        dest = tmp_path / "big.bin"
+        real_write = os.write
+
+        def short_write(fd, data):
+            return real_write(fd, bytes(data[:4096]))
+
+        with patch.object(store, "_http_get_with_retries", return_value=_response(200, body)), \
+                patch("src.plugin_system.store_manager.os.write", side_effect=short_write):
+            assert store._download_raw_file("https://raw.githubusercontent.com/o/r/main/big.bin", dest) == 200
+        assert dest.read_bytes() == body
+
+    def test_error_status_writes_nothing(self, store, tmp_path):
+        dest = tmp_path / "missing.bin"
+        with patch.object(store, "_http_get_with_retries", return_value=_response(404)):
+            assert store._download_raw_file("https://raw.githubusercontent.com/o/r/main/missing.bin", dest) == 404
+        assert not dest.exists()
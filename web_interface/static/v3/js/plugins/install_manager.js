@@ -78,11 +78,18 @@ const PluginInstallManager = {
         }
     },
     
+    /**
+     * Number of plugin updates run at once by updateAll. Each update is
+     * mostly network and git subprocess time on the server, so a few in
+     * flight overlap well without flooding the Pi.
+     */
+    UPDATE_CONCURRENCY: 3,
+
     /**
      * Update all plugins.
      *
-     * @param {Function} onProgress - Optional callback(index, total, pluginId) for progress updates
-     * @returns {Promise<Array>} Update results
+     * @param {Function} onProgress - Optional callback(completed, total, pluginId) for progress updates
+     * @returns {Promise<Array>} Update results, in installed-plugin order
      */
     async updateAll(onProgress) {
         // Prefer PluginStateManager if populated, fall back to window.installedPlugins
@@ -95,18 +102,26 @@ const PluginInstallManager = {
         if (!plugins.length) {
             return [];
         }
-        const results = [];
+        const results = new Array(plugins.length);
+        let next = 0;
+        let completed = 0;
 
-        for (let i = 0; i < plugins.length; i++) {
-            const plugin = plugins[i];
-            if (onProgress) onProgress(i + 1, plugins.length, plugin.id);
-            try {
-                const result = await window.PluginAPI.updatePlugin(plugin.id);
-                results.push({ pluginId: plugin.id, success: true, result });
-            } catch (error) {
-                results.push({ pluginId: plugin.id, success: false, error });
+        const worker = async () => {
+            while (next < plugins.length) {
+                const index = next++;
+                const plugin = plugins[index];
+                try {
+                    const result = await window.PluginAPI.updatePlugin(plugin.id);
+                    results[index] = { pluginId: plugin.id, success: true, result };
+                } catch (error) {
+                    results[index] = { pluginId: plugin.id, success: false, error };
+                }
+                completed++;
+                if (onProgress) onProgress(completed, plugins.length, plugin.id);
             }
-        }
+        };
+        const workerCount = Math.min(this.UPDATE_CONCURRENCY, plugins.length);
+        await Promise.all(Array.from({ length: workerCount }, worker));
 
         // Reload plugin list once at the end
         if (window.PluginStateManager) {